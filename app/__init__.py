@@ -3,10 +3,11 @@ from flask_session import Session
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import text
 from config import config
+from app.services.db_routing import RoutingSession
 
 # Initialize extensions
 session_manager = Session()
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 
 def create_app(config_name='default'):
@@ -17,8 +18,33 @@ def create_app(config_name='default'):
     app.config.from_object(config[config_name])
     
     # Initialize extensions
-    session_manager.init_app(app)
+    from app.services.db_routing import engine_options, read_router
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS',
+                          engine_options(app.config['SQLALCHEMY_DATABASE_URI'], app.config))
     db.init_app(app)
+    read_router.init_app(app)
+    from app.services.sqlite_tuning import init_sqlite_tuning
+    init_sqlite_tuning(app, db)
+    from app.services.query_profiler import query_profiler
+    query_profiler.init_app(app)
+    from app.services.session_store import init_session_store
+    init_session_store(app, session_manager)
+    from app.services.metrics import metrics
+    metrics.init_app(app)
+    from app.services.cache_service import cache
+    cache.init_app(app)
+    from app.services.fragment_cache import fragment_cache
+    fragment_cache.init_app(app)
+    from app.services.rate_limiter import rate_limiter
+    rate_limiter.init_app(app)
+    from app.services.password_hasher import password_hasher
+    password_hasher.init_app(app)
+    from app.services.live_updates import live_updates
+    live_updates.init_app(app)
+    from app.services.jobs import jobs
+    jobs.init_app(app)
+    # Import the modules defining @jobs.task functions so any process can run their jobs
+    from app.services import digest_service, event_service
     from flask_wtf.csrf import CSRFProtect
     csrf = CSRFProtect(app)
     
@@ -26,18 +52,18 @@ def create_app(config_name='default'):
     from app.routes.auth import auth_bp
     from app.routes.events import events_bp
     from app.routes.main import main_bp
+    from app.routes.api import api_bp
+    from app.routes.exports import exports_bp
     
     app.register_blueprint(auth_bp)
     app.register_blueprint(events_bp)
     app.register_blueprint(main_bp)
+    app.register_blueprint(api_bp)
+    app.register_blueprint(exports_bp)
     
-    # Cache control headers
-    @app.after_request
-    def after_request(response):
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Expires"] = 0
-        response.headers["Pragma"] = "no-cache"
-        return response
+    # Per-route Cache-Control policies, static fingerprinting
+    from app.services.http_cache import init_http_cache
+    init_http_cache(app)
 
     return app
 
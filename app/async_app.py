@@ -0,0 +1,142 @@
+import re
+from urllib.parse import parse_qsl
+from sqlalchemy import select
+from werkzeug.datastructures import MultiDict
+from app import create_app
+from app.models.models import Event
+from app.routes.api import (COMMENT_FIELDS, encode_json, event_columns, event_page_payload, event_rows_args,
+                            page_args, requested_fields, serialize_rows)
+from app.services.db_routing import engine_options
+from app.services.event_service import EventService
+from app.services.sqlite_tuning import install_pragmas, profile_pragmas
+
+try:
+    from a2wsgi import WSGIMiddleware
+    from sqlalchemy.ext.asyncio import create_async_engine
+except ImportError as e:  # Optional: only the ASGI entry point needs these
+    raise ImportError("ASGI mode needs: pip install uvicorn a2wsgi 'sqlalchemy[asyncio]' aiosqlite (or asyncpg)") from e
+
+# Sync dialect -> the async driver used for the same database
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+}
+
+
+def async_database_url(url):
+    """DATABASE_URL with its driver swapped for the async one (sqlite:///x.db -> sqlite+aiosqlite:///x.db)"""
+    scheme, separator, rest = url.partition('://')
+    dialect = scheme.split('+', 1)[0]
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for {dialect!r}; set ASYNC_DATABASE_URL")
+    return ASYNC_DRIVERS[dialect] + separator + rest
+
+
+class AsyncReadApp:
+    """
+    ASGI application for uvicorn (see asgi.py). The public JSON reads
+    (/api/v1/events, /api/v1/events/<id>, its /comments and /api/v1/categories)
+    are answered on the event loop through an async driver, so a slow query
+    holds a coroutine rather than a worker. They run the same statements as
+    EventService's sync methods and return the same JSON, but skip the
+    application cache and always read the primary (or ASYNC_DATABASE_URL).
+    Soft-deleted events are filtered here explicitly (see _all).
+    Every other route, including anything that reads the session, runs in
+    the Flask app on a pool of ASGI_WSGI_THREADS threads.
+    """
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.config = flask_app.config
+        url = self.config.get('ASYNC_DATABASE_URL') or async_database_url(self.config['SQLALCHEMY_DATABASE_URI'])
+        self.engine = create_async_engine(url, **engine_options(url, self.config))
+        if self.engine.dialect.name == 'sqlite':
+            install_pragmas(self.engine.sync_engine, profile_pragmas(flask_app))
+        self.wsgi = WSGIMiddleware(flask_app, workers=self.config.get('ASGI_WSGI_THREADS', 10))
+        self.routes = [
+            (re.compile(r'/api/v1/events'), self.events),
+            (re.compile(r'/api/v1/events/(\d+)'), self.event_detail),
+            (re.compile(r'/api/v1/events/(\d+)/comments'), self.event_comments),
+            (re.compile(r'/api/v1/categories'), self.categories),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self._lifespan(receive, send)
+        if scope['type'] == 'http' and scope['method'] == 'GET':
+            for pattern, handler in self.routes:
+                match = pattern.fullmatch(scope['path'])
+                if match:
+                    args = MultiDict(parse_qsl(scope['query_string'].decode('latin-1'), keep_blank_values=True))
+                    status, payload = await handler(args, *(int(group) for group in match.groups()))
+                    return await self._send_json(send, status, payload)
+        await self.wsgi(scope, receive, send)
+
+    async def events(self, args):
+        kind = args.get('kind', 'upcoming')
+        if kind not in ('upcoming', 'past'):
+            return 400, {'error': "kind must be 'upcoming' or 'past'"}
+        kwargs, fields, error = event_rows_args(args, self.config, kind)
+        if error:
+            return 400, {'error': error}
+        # Building the statement is synchronous; search filters look up the full-text backend on db.engine
+        with self.flask_app.app_context():
+            stmt, finish = EventService.event_rows_statement(**kwargs)
+        return 200, event_page_payload(finish(await self._all(stmt)), fields)
+
+    async def event_detail(self, args, event_id):
+        fields, error = requested_fields(args)
+        if error:
+            return 400, {'error': error}
+        columns, with_creator = event_columns(fields)
+        rows = await self._all(EventService.event_row_statement(event_id, columns, with_creator=with_creator))
+        if not rows:
+            return 404, {'error': "Event not found"}
+        return 200, {'data': serialize_rows(rows, fields)[0]}
+
+    async def event_comments(self, args, event_id):
+        stmt, finish = EventService.comments_page_statement(
+            event_id, after=args.get('after'), limit=page_args(args, self.config)['limit']
+        )
+        async with self.engine.connect() as conn:
+            exists = select(Event.id).where(Event.id == event_id, Event.deleted_at.is_(None))
+            if (await conn.execute(exists)).first() is None:
+                return 404, {'error': "Event not found"}
+            page = finish((await conn.execute(stmt)).all())
+        return 200, {'data': serialize_rows(page.items, COMMENT_FIELDS), 'next_cursor': page.next_cursor}
+
+    async def categories(self, args):
+        stmt, finish = EventService.categories_statement()
+        return 200, {'data': finish(await self._all(stmt))}
+
+    async def _all(self, stmt):
+        """Rows of an events statement. The session's soft-delete filter (models.py) doesn't reach a bare connection."""
+        async with self.engine.connect() as conn:
+            return (await conn.execute(stmt.where(Event.deleted_at.is_(None)))).all()
+
+    async def _send_json(self, send, status, payload):
+        body = encode_json(payload)
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+                (b'cache-control', b'private, no-cache'),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def create_asgi_app(config_name='default'):
+    """Application factory for ASGI servers: the Flask app wrapped in AsyncReadApp"""
+    return AsyncReadApp(create_app(config_name))
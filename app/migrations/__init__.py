@@ -0,0 +1,222 @@
+"""
+Versioned schema migrations.
+
+Each module in app/migrations/versions is named mNNNN_description.py and
+defines upgrade(m), where m is a MigrationContext. Applied versions are
+recorded in schema_migrations with how long they took, so
+current_version() is a single indexed MAX() and startup never has to run
+DDL just to find out whether the schema is up to date.
+
+Migrations must be safe to re-run: a data backfill that was interrupted
+halfway is resumed the next time, not repeated from scratch.
+"""
+
+import importlib
+import pkgutil
+import time
+from datetime import datetime, timezone
+from sqlalchemy import (Column, DateTime, Integer, MetaData, String, Table, func, inspect, insert, select, text)
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.migrations import versions as versions_package
+
+BACKFILL_BATCH_SIZE = 5000
+
+_metadata = MetaData()
+schema_migrations = Table(
+    'schema_migrations', _metadata,
+    Column('version', Integer, primary_key=True),
+    Column('name', String(255), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+    Column('duration_ms', Integer, nullable=False),
+)
+
+
+class Migration:
+    def __init__(self, version, name, module):
+        self.version = version
+        self.name = name
+        self.module = module
+
+    @property
+    def description(self):
+        return (self.module.__doc__ or self.name).strip().splitlines()[0]
+
+
+class MigrationContext:
+    """The API a migration's upgrade(m) works with"""
+    def __init__(self, engine, conn, batch_size=BACKFILL_BATCH_SIZE, log=print):
+        self.engine = engine
+        self.conn = conn
+        self.dialect = 'postgres' if engine.dialect.name == 'postgresql' else engine.dialect.name
+        self.batch_size = batch_size
+        self.log = log
+
+    # Dialect-specific DDL fragments
+    @property
+    def primary_key(self):
+        return "SERIAL PRIMARY KEY" if self.dialect == 'postgres' else "INTEGER PRIMARY KEY AUTOINCREMENT"
+
+    def execute(self, sql, **params):
+        return self.conn.execute(text(sql), params)
+
+    def commit(self):
+        self.conn.commit()
+
+    def has_table(self, table):
+        return inspect(self.conn).has_table(table)
+
+    def has_column(self, table, column):
+        return any(c['name'] == column for c in inspect(self.conn).get_columns(table))
+
+    def column_type(self, table, column):
+        for c in inspect(self.conn).get_columns(table):
+            if c['name'] == column:
+                return str(c['type']).upper()
+        return None
+
+    def add_column(self, table, column, definition):
+        """ALTER TABLE ... ADD COLUMN unless it exists. Returns True if it was added."""
+        if self.has_column(table, column):
+            self.log(f"   - {table}.{column} already exists.")
+            return False
+        self.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        self.log(f"   - Added {table}.{column}.")
+        return True
+
+    def create_index(self, name, table, columns, unique=False, where=None):
+        """
+        CREATE INDEX IF NOT EXISTS, partial when `where` is given. On
+        PostgreSQL the index is built CONCURRENTLY (outside the migration
+        transaction) so writes to a large table are not blocked while it builds.
+        """
+        unique_sql = "UNIQUE " if unique else ""
+        where_sql = f" WHERE {where}" if where else ""
+        if self.dialect == 'postgres':
+            self.commit()
+            with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+                conn.execute(text(
+                    f"CREATE {unique_sql}INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+                    f"{where_sql}"
+                ))
+        else:
+            self.execute(f"CREATE {unique_sql}INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)}){where_sql}")
+        self.log(f"   - Index {name} ready.")
+
+    def drop_index(self, name):
+        """DROP INDEX IF EXISTS, CONCURRENTLY on PostgreSQL like create_index"""
+        if self.dialect == 'postgres':
+            self.commit()
+            with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+        else:
+            self.execute(f"DROP INDEX IF EXISTS {name}")
+        self.log(f"   - Index {name} dropped.")
+
+    def backfill(self, table, assignments, where=None, key='id'):
+        """
+        UPDATE table SET <assignments> [WHERE <where>] in primary-key ranges of
+        batch_size rows, committing after each range so no lock is held for
+        long. `where` should exclude rows that are already done, so that an
+        interrupted backfill picks up where it stopped. Returns rows updated.
+        """
+        low, high = self.conn.execute(text(f"SELECT MIN({key}), MAX({key}) FROM {table}")).first()
+        self.commit()
+        if low is None:
+            return 0
+
+        condition = f" AND ({where})" if where else ""
+        updated = 0
+        started = time.perf_counter()
+        for start in range(low, high + 1, self.batch_size):
+            updated += self.conn.execute(
+                text(f"UPDATE {table} SET {assignments} WHERE {key} >= :start AND {key} < :end{condition}"),
+                {'start': start, 'end': start + self.batch_size}
+            ).rowcount
+            self.commit()
+        self.log(f"   - Backfilled {updated:,} {table} row(s) in {time.perf_counter() - started:.1f}s.")
+        return updated
+
+
+def discover():
+    """All migrations in version order"""
+    migrations = []
+    for module_info in pkgutil.iter_modules(versions_package.__path__):
+        if not module_info.name.startswith('m'):
+            continue
+        version, _, name = module_info.name[1:].partition('_')
+        module = importlib.import_module(f"{versions_package.__name__}.{module_info.name}")
+        migrations.append(Migration(int(version), name, module))
+    migrations.sort(key=lambda m: m.version)
+    return migrations
+
+
+def latest_version():
+    migrations = discover()
+    return migrations[-1].version if migrations else 0
+
+
+def current_version(engine):
+    """Highest applied version (0 for a database that has never been migrated) in one query"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        return 0
+
+
+def applied(engine):
+    """Rows of schema_migrations, oldest first"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(schema_migrations).order_by(schema_migrations.c.version)).all()
+    except (OperationalError, ProgrammingError):
+        return []
+
+
+def pending(engine):
+    done = {row.version for row in applied(engine)}
+    return [m for m in discover() if m.version not in done]
+
+
+def upgrade(engine, target=None, batch_size=BACKFILL_BATCH_SIZE, log=print):
+    """Applies pending migrations up to `target` (default: all). Returns the versions applied."""
+    _metadata.create_all(engine)
+    to_apply = [m for m in pending(engine) if target is None or m.version <= target]
+    if not to_apply:
+        log("✅ Schema is up to date.")
+        return []
+
+    for migration in to_apply:
+        log(f"{migration.version}. {migration.description}")
+        started = time.perf_counter()
+        with engine.connect() as conn:
+            migration.module.upgrade(MigrationContext(engine, conn, batch_size=batch_size, log=log))
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            conn.execute(insert(schema_migrations).values(
+                version=migration.version,
+                name=migration.name,
+                applied_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                duration_ms=duration_ms
+            ))
+            conn.commit()
+        log(f"   ⏱️  {duration_ms} ms")
+    return [m.version for m in to_apply]
+
+
+def drift(engine, metadata):
+    """
+    Differences between the models (`metadata`) and the live database:
+    missing tables, columns and named indexes. Empty when they agree.
+    """
+    inspector = inspect(engine)
+    problems = []
+    for table in metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            problems.append(f"missing table {table.name}")
+            continue
+        columns = {c['name'] for c in inspector.get_columns(table.name)}
+        problems += [f"missing column {table.name}.{c.name}" for c in table.columns if c.name not in columns]
+        indexes = {i['name'] for i in inspector.get_indexes(table.name)}
+        problems += [f"missing index {i.name} on {table.name}" for i in table.indexes if i.name not in indexes]
+    return problems
@@ -0,0 +1,39 @@
+"""Create users, events and event_participants tables"""
+
+
+def upgrade(m):
+    m.execute(f"""
+        CREATE TABLE IF NOT EXISTS users (
+            id {m.primary_key},
+            username TEXT UNIQUE NOT NULL,
+            hash TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    m.execute(f"""
+        CREATE TABLE IF NOT EXISTS events (
+            id {m.primary_key},
+            user_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            date TEXT NOT NULL,
+            time TEXT,
+            description TEXT,
+            category TEXT DEFAULT 'General',
+            capacity INTEGER,
+            location TEXT,
+            location_name TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+    """)
+    m.execute("""
+        CREATE TABLE IF NOT EXISTS event_participants (
+            user_id INTEGER NOT NULL,
+            event_id INTEGER NOT NULL,
+            joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (user_id, event_id),
+            FOREIGN KEY (user_id) REFERENCES users(id),
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    """)
+    m.log("   - Verified/Created users, events and event_participants.")
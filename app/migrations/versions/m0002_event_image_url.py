@@ -0,0 +1,5 @@
+"""Add events.image_url"""
+
+
+def upgrade(m):
+    m.add_column('events', 'image_url', 'TEXT')
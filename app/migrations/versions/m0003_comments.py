@@ -0,0 +1,16 @@
+"""Create comments table"""
+
+
+def upgrade(m):
+    m.execute(f"""
+        CREATE TABLE IF NOT EXISTS comments (
+            id {m.primary_key},
+            content TEXT NOT NULL,
+            user_id INTEGER NOT NULL,
+            event_id INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id),
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    """)
+    m.log("   - Verified/Created comments.")
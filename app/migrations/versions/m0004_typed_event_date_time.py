@@ -0,0 +1,30 @@
+"""Store events.date / events.time as DATE / TIME"""
+
+
+def upgrade(m):
+    if m.dialect == 'sqlite':
+        # SQLite can't change a column's type; its ISO text is what SQLAlchemy's
+        # Date/Time types read anyway. Only empty times need normalising.
+        m.backfill('events', "time = NULL", where="time = '' OR time = 'None'")
+        return
+
+    if m.column_type('events', 'date') == 'DATE':
+        m.log("   - Columns already typed.")
+        return
+
+    # ALTER COLUMN TYPE rewrites the table under an exclusive lock. Instead, fill
+    # typed shadow columns in batches and swap them in with two quick renames.
+    m.add_column('events', 'date_typed', 'DATE')
+    m.add_column('events', 'time_typed', 'TIME')
+    m.commit()
+    m.backfill(
+        'events',
+        "date_typed = date::date, time_typed = NULLIF(NULLIF(time, ''), 'None')::time",
+        where="date_typed IS NULL"
+    )
+    m.execute("ALTER TABLE events DROP COLUMN date")
+    m.execute("ALTER TABLE events DROP COLUMN time")
+    m.execute("ALTER TABLE events RENAME COLUMN date_typed TO date")
+    m.execute("ALTER TABLE events RENAME COLUMN time_typed TO time")
+    m.execute("ALTER TABLE events ALTER COLUMN date SET NOT NULL")
+    m.log("   - Swapped in typed date/time columns.")
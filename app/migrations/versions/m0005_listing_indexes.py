@@ -0,0 +1,15 @@
+"""Indexes for listing order, filters and per-event lookups"""
+
+# Must match __table_args__ in app/models/models.py (python migrate.py check verifies)
+INDEXES = [
+    ('ix_events_date_id', 'events', ['date', 'id']),
+    ('ix_events_category_date', 'events', ['category', 'date', 'id']),
+    ('ix_events_user_date', 'events', ['user_id', 'date', 'id']),
+    ('ix_event_participants_event', 'event_participants', ['event_id', 'user_id']),
+    ('ix_comments_event_created', 'comments', ['event_id', 'created_at']),
+]
+
+
+def upgrade(m):
+    for name, table, columns in INDEXES:
+        m.create_index(name, table, columns)
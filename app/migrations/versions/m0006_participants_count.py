@@ -0,0 +1,13 @@
+"""Add the stored events.participants_count counter"""
+
+
+def upgrade(m):
+    added = m.add_column('events', 'participants_count', 'INTEGER NOT NULL DEFAULT 0')
+    m.commit()
+    if added:
+        # Only events that have participants need a write; the column default covers the rest
+        m.backfill(
+            'events',
+            "participants_count = (SELECT COUNT(*) FROM event_participants WHERE event_participants.event_id = events.id)",
+            where="EXISTS (SELECT 1 FROM event_participants WHERE event_participants.event_id = events.id)"
+        )
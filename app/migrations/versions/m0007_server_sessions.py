@@ -0,0 +1,12 @@
+"""Create server_sessions table (SESSION_TYPE = 'sqlalchemy')"""
+
+
+def upgrade(m):
+    m.execute("""
+        CREATE TABLE IF NOT EXISTS server_sessions (
+            id VARCHAR(64) PRIMARY KEY,
+            data TEXT NOT NULL,
+            expiry TIMESTAMP NOT NULL
+        )
+    """)
+    m.create_index('ix_server_sessions_expiry', 'server_sessions', ['expiry'])
@@ -0,0 +1,5 @@
+"""Add events.version (HTTP validators / cache keys)"""
+
+
+def upgrade(m):
+    m.add_column('events', 'version', 'INTEGER NOT NULL DEFAULT 0')
@@ -0,0 +1,32 @@
+"""Full-text index over event title/description"""
+
+from app.services.search_service import SEARCH_DDL, SEARCH_REBUILD
+
+
+def upgrade(m):
+    """
+    FTS5 table + sync triggers on SQLite, GIN tsvector index on PostgreSQL.
+    If the engine can't provide it, search falls back to LIKE scans.
+    """
+    if m.dialect not in SEARCH_DDL:
+        m.log("   - No full-text index for this database; search uses LIKE.")
+        return
+    if m.dialect == 'postgres':
+        statement, = SEARCH_DDL['postgres']
+        m.commit()
+        with m.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.exec_driver_sql(statement.replace('CREATE INDEX', 'CREATE INDEX CONCURRENTLY', 1))
+        m.log("   - Search index ready.")
+        return
+
+    is_new = not m.has_table('events_fts')
+    try:
+        for statement in SEARCH_DDL['sqlite']:
+            m.execute(statement)
+    except Exception as e:
+        m.conn.rollback()
+        m.log(f"   ⚠️ Full-text search unavailable, falling back to LIKE search: {e}")
+        return
+    if is_new:
+        m.execute(SEARCH_REBUILD['sqlite'])
+    m.log("   - Search index ready.")
@@ -0,0 +1,13 @@
+"""Add the stored events.comments_count counter"""
+
+
+def upgrade(m):
+    added = m.add_column('events', 'comments_count', 'INTEGER NOT NULL DEFAULT 0')
+    m.commit()
+    if added:
+        # Only events that have comments need a write; the column default covers the rest
+        m.backfill(
+            'events',
+            "comments_count = (SELECT COUNT(*) FROM comments WHERE comments.event_id = events.id)",
+            where="EXISTS (SELECT 1 FROM comments WHERE comments.event_id = events.id)"
+        )
@@ -0,0 +1,19 @@
+"""Unique (user_id, date, title) index for duplicate-event detection"""
+
+# Later copies of a legacy duplicate keep their row under a distinguishable title
+DUPLICATE_CONDITION = (
+    "EXISTS (SELECT 1 FROM events AS earlier WHERE earlier.user_id = events.user_id "
+    "AND earlier.date = events.date AND earlier.title = events.title AND earlier.id < events.id)"
+)
+
+
+def upgrade(m):
+    renamed = m.execute(
+        f"UPDATE events SET title = title || ' (#' || CAST(id AS VARCHAR(20)) || ')', version = version + 1 "
+        f"WHERE {DUPLICATE_CONDITION}"
+    ).rowcount
+    m.commit()
+    if renamed:
+        m.log(f"   - Renamed {renamed:,} duplicate event(s) to '<title> (#<id>)'.")
+    # Replaced by the partial ux_events_live_user_date_title in m0013, which __table_args__ now declares
+    m.create_index('ux_events_user_date_title', 'events', ['user_id', 'date', 'title'], unique=True)
@@ -0,0 +1,21 @@
+"""Add events.deleted_at and the jobs table (soft delete + background purge)"""
+
+
+def upgrade(m):
+    m.add_column('events', 'deleted_at', 'TIMESTAMP')
+    m.execute(f"""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id {m.primary_key},
+            name VARCHAR(100) NOT NULL,
+            payload TEXT NOT NULL,
+            status VARCHAR(16) NOT NULL DEFAULT 'queued',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL,
+            run_after TIMESTAMP NOT NULL,
+            locked_until TIMESTAMP,
+            last_error TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP
+        )
+    """)
+    m.create_index('ix_jobs_status_run_after', 'jobs', ['status', 'run_after'])
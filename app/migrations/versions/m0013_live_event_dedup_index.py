@@ -0,0 +1,9 @@
+"""Limit the (user_id, date, title) duplicate guard to events that aren't soft-deleted"""
+
+
+def upgrade(m):
+    # Built before the full index goes, so duplicates are rejected throughout
+    # Must match __table_args__ in app/models/models.py (python migrate.py check verifies)
+    m.create_index('ux_events_live_user_date_title', 'events', ['user_id', 'date', 'title'], unique=True,
+                   where='deleted_at IS NULL')
+    m.drop_index('ux_events_user_date_title')
@@ -1,6 +1,10 @@
 from datetime import datetime, date
 from app import db
-from sqlalchemy import text
+from sqlalchemy import event, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session, with_loader_criteria
+
+SQLITE_SECONDS_FORMAT = "%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
 
 class User(db.Model):
     __tablename__ = 'users'
@@ -17,29 +21,43 @@ class User(db.Model):
 
 class Event(db.Model):
     __tablename__ = 'events'
+    __table_args__ = (
+        # Listing order / keyset seek, plus the category and creator filters
+        db.Index('ix_events_date_id', 'date', 'id'),
+        db.Index('ix_events_category_date', 'category', 'date', 'id'),
+        db.Index('ix_events_user_date', 'user_id', 'date', 'id'),
+        # Duplicate guard: EventService.create_event inserts with ON CONFLICT DO NOTHING, then selects the existing row.
+        # Partial, so a soft-deleted event waiting for purge_event doesn't block creating it again.
+        db.Index('ux_events_live_user_date_title', 'user_id', 'date', 'title', unique=True,
+                 sqlite_where=db.text('deleted_at IS NULL'), postgresql_where=db.text('deleted_at IS NULL')),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     title = db.Column(db.String, nullable=False)
-    date = db.Column(db.String, nullable=False) # Stored as TEXT (ISO string)
-    time = db.Column(db.String)
+    date = db.Column(db.Date, nullable=False) # ISO 'YYYY-MM-DD' on SQLite, DATE on PostgreSQL
+    time = db.Column(db.Time)
     description = db.Column(db.String)
     category = db.Column(db.String, default='General')
     capacity = db.Column(db.Integer)
     location = db.Column(db.String)
     location_name = db.Column(db.String)
     image_url = db.Column(db.String)
+    # Maintained by EventService.join_event / leave_event; see reconcile_counts.py
+    participants_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Maintained by EventService.add_comment, so a modal's first paint never counts the thread
+    comments_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Bumped on every join, leave and comment; feeds ETags and cache keys
+    version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    # Set by EventService.delete_event; the row is gone once the purge_event job has run
+    deleted_at = db.Column(db.DateTime)
 
     # Relationships
     creator = db.relationship('User', back_populates='events')
     participants = db.relationship('EventParticipant', back_populates='event', lazy='dynamic', cascade="all, delete-orphan")
     comments = db.relationship('Comment', back_populates='event', lazy=True, cascade="all, delete-orphan")
 
-    @property
-    def participants_count(self):
-        return self.participants.count()
-
     @property
     def participant_names(self):
         # Return comma separated list of usernames
@@ -60,15 +78,35 @@ class Event(db.Model):
         return {
             'id': self.id,
             'title': self.title,
-            'date': self.date,
+            'date': self.date.isoformat() if self.date else None,
             'description': self.description,
             'category': self.category,
             'image_url': self.image_url
         }
 
 
+@event.listens_for(Session, 'do_orm_execute')
+def _hide_deleted_events(execute_state):
+    """
+    Soft-deleted events are invisible to every ORM SELECT, UPDATE and DELETE
+    (listings, details, joins, exports...). Statements that need them, like
+    the purge job's, run with execution_options(include_deleted=True).
+    """
+    if execute_state.is_column_load or execute_state.is_relationship_load:
+        return
+    if execute_state.execution_options.get('include_deleted', False):
+        return
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(Event, Event.deleted_at.is_(None), include_aliases=True)
+    )
+
+
 class EventParticipant(db.Model):
     __tablename__ = 'event_participants'
+    __table_args__ = (
+        # The primary key leads with user_id; per-event lookups need their own index
+        db.Index('ix_event_participants_event', 'event_id', 'user_id'),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey('events.id'), primary_key=True)
@@ -81,16 +119,52 @@ class EventParticipant(db.Model):
 
 class Comment(db.Model):
     __tablename__ = 'comments'
+    __table_args__ = (
+        db.Index('ix_comments_event_created', 'event_id', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     content = db.Column(db.Text, nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
-    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    # Second resolution on SQLite, matching CURRENT_TIMESTAMP, so keyset cursor
+    # binds compare equal to stored values
+    created_at = db.Column(
+        db.DateTime().with_variant(sqlite.DATETIME(storage_format=SQLITE_SECONDS_FORMAT), 'sqlite'),
+        server_default=db.func.now()
+    )
 
     # Relationships
     user = db.relationship('User', back_populates='comments')
     event = db.relationship('Event', back_populates='comments')
 
+class ServerSession(db.Model):
+    """Server-side session row used when SESSION_TYPE = 'sqlalchemy'"""
+    __tablename__ = 'server_sessions'
+
+    id = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.Text, nullable=False)
+    expiry = db.Column(db.DateTime, nullable=False, index=True)
+
+class Job(db.Model):
+    """Background job row (app/services/jobs.py)"""
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        # The runner's "next due job" lookup
+        db.Index('ix_jobs_status_run_after', 'status', 'run_after'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    payload = db.Column(db.Text, nullable=False)  # JSON keyword arguments
+    status = db.Column(db.String(16), nullable=False, default='queued', server_default='queued')  # queued, running, done, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    max_attempts = db.Column(db.Integer, nullable=False)
+    run_after = db.Column(db.DateTime, nullable=False)
+    locked_until = db.Column(db.DateTime)  # a running job past this is taken to have died with its runner
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    finished_at = db.Column(db.DateTime)
+
 # Update User relationship for comments (can be done by adding property here to User or simpler, just backref)
 User.comments = db.relationship('Comment', back_populates='user', lazy=True)
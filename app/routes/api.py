@@ -0,0 +1,172 @@
+import json
+from datetime import date, time, datetime
+from flask import Blueprint, Response, request, session, current_app
+from app.models.models import Event, User
+from app.services.event_service import EventService
+
+try:
+    import orjson
+except ImportError:  # Optional: plain json with compact separators is the fallback
+    orjson = None
+
+api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
+
+# Public field name -> column. Only these can be requested through ?fields=
+EVENT_FIELDS = {
+    'id': Event.id,
+    'title': Event.title,
+    'date': Event.date,
+    'time': Event.time,
+    'description': Event.description,
+    'category': Event.category,
+    'capacity': Event.capacity,
+    'participants_count': Event.participants_count,
+    'comments_count': Event.comments_count,
+    'location': Event.location,
+    'location_name': Event.location_name,
+    'image_url': Event.image_url,
+    'user_id': Event.user_id,
+    'creator': User.username,
+    'created_at': Event.created_at,
+}
+DEFAULT_EVENT_FIELDS = ('id', 'title', 'date', 'time', 'category', 'capacity', 'participants_count', 'location_name', 'image_url')
+
+COMMENT_FIELDS = ('id', 'content', 'user_id', 'username', 'created_at')
+
+
+def encode_json(payload):
+    """Response body bytes: orjson when installed, compact json otherwise"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':'), default=_encode_value).encode()
+
+
+def _json(payload, status=200):
+    return Response(encode_json(payload), status=status, mimetype='application/json')
+
+
+def _error(message, status):
+    return _json({'error': message}, status)
+
+
+def _encode_value(value):
+    if isinstance(value, (date, time, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def requested_fields(args):
+    """Parses ?fields=a,b,c against EVENT_FIELDS. Returns (fields, error)."""
+    raw = args.get('fields')
+    if not raw:
+        return list(DEFAULT_EVENT_FIELDS), None
+    fields = [f.strip() for f in raw.split(',') if f.strip()]
+    unknown = [f for f in fields if f not in EVENT_FIELDS]
+    if unknown:
+        return None, f"Unknown field(s): {', '.join(unknown)}"
+    return fields, None
+
+
+def event_columns(fields):
+    # id and date are always selected: they form the keyset cursor
+    names = list(dict.fromkeys(['id', 'date'] + fields))
+    return [EVENT_FIELDS[name].label(name) for name in names], 'creator' in fields
+
+
+def serialize_rows(rows, fields):
+    return [{field: getattr(row, field) for field in fields} for row in rows]
+
+
+def page_args(args, config):
+    per_page = args.get('per_page', type=int) or config['EVENTS_PER_PAGE']
+    return {
+        'after': args.get('after') or None,
+        'before': args.get('before') or None,
+        'limit': max(1, min(per_page, config['EVENTS_MAX_PER_PAGE']))
+    }
+
+
+def event_rows_args(args, config, kind, user_id=None):
+    """
+    Parses a listing request into get_event_rows keyword arguments and the
+    fields to serialize. Returns (kwargs, fields, error). Shared with the
+    async read paths in app/async_app.py.
+    """
+    fields, error = requested_fields(args)
+    if error:
+        return None, None, error
+    columns, with_creator = event_columns(fields)
+    kwargs = dict(
+        kind=kind, columns=columns, user_id=user_id,
+        search_query=args.get('search', '').strip(),
+        category_filter=args.get('category', '').strip(),
+        with_creator=with_creator,
+        **page_args(args, config)
+    )
+    return kwargs, fields, None
+
+
+def event_page_payload(page, fields):
+    return {
+        'data': serialize_rows(page.items, fields),
+        'next_cursor': page.next_cursor,
+        'prev_cursor': page.prev_cursor
+    }
+
+
+def _event_page(kind, user_id=None):
+    kwargs, fields, error = event_rows_args(request.args, current_app.config, kind, user_id)
+    if error:
+        return _error(error, 400)
+    return _json(event_page_payload(EventService.get_event_rows(**kwargs), fields))
+
+
+@api_bp.route('/events')
+def events():
+    """Upcoming (default) or past events: ?kind=past, ?search=, ?category=, ?fields=, keyset cursors"""
+    kind = request.args.get('kind', 'upcoming')
+    if kind not in ('upcoming', 'past'):
+        return _error("kind must be 'upcoming' or 'past'", 400)
+    return _event_page(kind)
+
+
+@api_bp.route('/events/<int:event_id>')
+def event_detail(event_id):
+    fields, error = requested_fields(request.args)
+    if error:
+        return _error(error, 400)
+    columns, with_creator = event_columns(fields)
+
+    row = EventService.get_event_row(event_id, columns, with_creator=with_creator)
+    if row is None:
+        return _error("Event not found", 404)
+    return _json({'data': serialize_rows([row], fields)[0]})
+
+
+@api_bp.route('/events/<int:event_id>/comments')
+def event_comments(event_id):
+    """Newest first; follow next_cursor with ?after="""
+    if EventService.get_event_version(event_id) is None:
+        return _error("Event not found", 404)
+    limit = page_args(request.args, current_app.config)['limit']
+    page = EventService.get_comments_page(event_id, after=request.args.get('after'), limit=limit)
+    return _json({
+        'data': serialize_rows(page.items, COMMENT_FIELDS),
+        'next_cursor': page.next_cursor
+    })
+
+
+@api_bp.route('/categories')
+def categories():
+    return _json({'data': EventService.get_all_categories()})
+
+
+@api_bp.route('/me/events')
+def my_events():
+    """The current user's ?role=joined (default) or ?role=created events"""
+    if 'user_id' not in session:
+        return _error("Authentication required", 401)
+    role = request.args.get('role', 'joined')
+    if role not in ('joined', 'created'):
+        return _error("role must be 'joined' or 'created'", 400)
+    return _event_page(role, user_id=session['user_id'])
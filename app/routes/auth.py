@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, redirect, request, session, flash, url_for
 from app.services.auth_service import AuthService
+from app.services.password_hasher import HashingBusyError
 from app.forms.auth import LoginForm, RegisterForm
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
@@ -9,7 +10,11 @@ def register():
     """User registration"""
     form = RegisterForm()
     if form.validate_on_submit():
-        new_user = AuthService.register_user(form.username.data, form.password.data)
+        try:
+            new_user = AuthService.register_user(form.username.data, form.password.data)
+        except HashingBusyError:
+            flash('Server is busy, please try again in a moment', 'warning')
+            return render_template('auth/register.html', form=form), 503
         if not new_user:
             flash('Username already exists', 'info')
             return redirect(url_for('auth.register'))
@@ -25,8 +30,12 @@ def login():
     """User login"""
     form = LoginForm()
     if form.validate_on_submit():
+        try:
+            user = AuthService.authenticate_user(form.username.data, form.password.data)
+        except HashingBusyError:
+            flash('Server is busy, please try again in a moment', 'warning')
+            return render_template('auth/login.html', form=form), 503
         session.clear()
-        user = AuthService.authenticate_user(form.username.data, form.password.data)
         if not user:
             flash('Invalid username or password', 'danger')
             return redirect(url_for('auth.login'))
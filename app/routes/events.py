@@ -1,10 +1,55 @@
-from flask import Blueprint, render_template, redirect, request, session, flash, url_for
+from flask import Blueprint, Response, render_template, redirect, request, session, flash, url_for, current_app, make_response, jsonify, abort
 from app.services.event_service import EventService
+from app.services.http_cache import event_etag, is_revalidatable
+from app.services.live_updates import live_updates
+from app.services.rate_limiter import rate_limiter
+from app.services.sqlite_tuning import WriterBusy
 
 events_bp = Blueprint('events', __name__, url_prefix='/events')
 
 from app.forms.event import EventForm, CommentForm
 
+
+def _wants_json():
+    """The modal script asks for JSON so it can patch the open modal instead of re-rendering it"""
+    return request.accept_mimetypes.best == 'application/json'
+
+
+def _action_result(event_id, success, message, status=200):
+    """JSON answer to a modal join/leave: the outcome plus the viewer's new state"""
+    event = EventService.get_event_with_details(event_id, session['user_id'])
+    if not event:
+        return jsonify({'success': False, 'message': 'Event not found'}), 404
+    return jsonify({
+        'success': success,
+        'message': message,
+        'joined': event.joined,
+        'count': event.participants_count,
+        'capacity': event.capacity,
+        'full': event.is_full,
+    }), status
+
+
+def _rate_limited_action(event_id, wait, redirect_to):
+    """Answer to a join/leave over its rate limit: the unchanged state for the modal, or a flash and redirect"""
+    message = rate_limiter.message(wait)
+    if _wants_json():
+        response, status = _action_result(event_id, False, message, 429)
+    else:
+        flash(message, 'warning')
+        response, status = redirect(redirect_to), 302
+    response.headers['Retry-After'] = rate_limiter.retry_after(wait)
+    return response, status
+
+
+@events_bp.errorhandler(WriterBusy)
+def writer_busy(error):
+    """A write that couldn't get its turn in the SQLite write queue: nothing changed, try again"""
+    if _wants_json():
+        return jsonify({'success': False, 'message': str(error)}), 503, {'Retry-After': '1'}
+    flash(str(error), 'warning')
+    return redirect(request.referrer or url_for('main.index'))
+
 @events_bp.route('/add', methods=['GET', 'POST'])
 def add():
     """Create a new event"""
@@ -15,8 +60,8 @@ def add():
     if form.validate_on_submit():
         event_data = {
             'title': form.title.data,
-            'date': str(form.date.data), # Convert date object to string for DB
-            'time': str(form.time.data) if form.time.data else None,
+            'date': form.date.data,
+            'time': form.time.data,
             'category': form.category.data,
             'description': form.description.data,
             'capacity': form.capacity.data,
@@ -25,18 +70,25 @@ def add():
             'image_url': form.image_url.data
         }
 
-        new_event, message = EventService.create_event(session['user_id'], event_data)
-        
-        if not new_event:
-            flash(message, 'warning')
-            return render_template('events/add.html', form=form), 409
+        wait = rate_limiter.hit('create')
+        if wait:
+            flash(rate_limiter.message(wait), 'warning')
+            return render_template('events/add.html', form=form), 429, {'Retry-After': rate_limiter.retry_after(wait)}
+
+        try:
+            event, message, created = EventService.create_event(session['user_id'], event_data)
+        except WriterBusy as error:
+            flash(str(error), 'warning')
+            return render_template('events/add.html', form=form), 503, {'Retry-After': '1'}
+
+        if not created:
+            # A repeated submit: show the event that already exists
+            flash(message, 'info')
+            return redirect(url_for('events.detail', event_id=event.id))
 
         flash(message, 'success')
         return redirect(url_for('main.index'))
-        
-        flash(message, 'success')
-        return redirect(url_for('main.index'))
-        
+
     from datetime import date, timedelta
     today_date = date.today().isoformat()
     max_date = (date.today() + timedelta(days=730)).isoformat()
@@ -46,17 +98,38 @@ def add():
 @events_bp.route('/detail/<int:event_id>', methods=['GET', 'POST'])
 def detail(event_id):
     """Event detail view with comments"""
-    event = EventService.get_event_with_details(event_id)
+    is_modal = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+
+    # Conditional GET: answer from the version stamp before loading or rendering anything
+    etag = None
+    if is_revalidatable():
+        version = EventService.get_event_version(event_id)
+        if version is not None:
+            etag = event_etag(current_app, event_id, version, is_modal)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+                response.set_etag(etag, weak=True)
+                return response
+
+    event = EventService.get_event_with_details(event_id, session.get('user_id'))
     if not event:
         flash('Event not found', 'danger')
         return redirect(url_for('main.index'))
 
-    is_modal = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
-
     # Comment handling
     form = CommentForm()
     if 'user_id' in session and form.validate_on_submit():
-        new_comment, msg = EventService.add_comment(session['user_id'], event_id, form.content.data)
+        wait = rate_limiter.hit('comment')
+        if wait and _wants_json():
+            return (jsonify({'success': False, 'message': rate_limiter.message(wait)}), 429,
+                    {'Retry-After': rate_limiter.retry_after(wait)})
+        if wait:
+            new_comment, msg = None, rate_limiter.message(wait)
+        else:
+            new_comment, msg = EventService.add_comment(session['user_id'], event_id, form.content.data)
+        if _wants_json():
+            # The comment itself reaches every open modal, this one included, as a live delta
+            return jsonify({'success': bool(new_comment), 'message': msg}), 200 if new_comment else 409
         if new_comment:
             flash(msg, 'success')
         else:
@@ -64,17 +137,21 @@ def detail(event_id):
             
         # If AJAX, return the updated partial for the modal
         if is_modal:
-            comments = EventService.get_comments(event_id)
+            comments = EventService.get_comments(event_id, current_app.config['COMMENTS_PER_PAGE'])
             return render_template('events/_detail_content.html', event=event, comments=comments, form=form, is_modal=True)
 
         return redirect(url_for('events.detail', event_id=event_id))
 
-    comments = EventService.get_comments(event_id)
+    comments = EventService.get_comments(event_id, current_app.config['COMMENTS_PER_PAGE'])
     
     if is_modal:
-        return render_template('events/_detail_content.html', event=event, comments=comments, form=form, is_modal=True)
-    
-    return render_template('events/detail.html', event=event, comments=comments, form=form)
+        response = make_response(render_template('events/_detail_content.html', event=event, comments=comments, form=form, is_modal=True))
+    else:
+        response = make_response(render_template('events/detail.html', event=event, comments=comments, form=form))
+
+    if etag:
+        response.set_etag(etag, weak=True)
+    return response
 
 
 @events_bp.route('/join/<int:event_id>')
@@ -83,14 +160,20 @@ def join(event_id):
     if 'user_id' not in session:
         return redirect(url_for('auth.login'))
 
+    wait = rate_limiter.hit('join')
+    if wait:
+        return _rate_limited_action(event_id, wait, url_for('main.index'))
+
     success, message = EventService.join_event(session['user_id'], event_id)
+    if _wants_json():
+        return _action_result(event_id, success, message)
     
     # Handle AJAX request (from Modal)
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         flash(message, 'success' if success else 'warning')
         # Re-fetch data for the partial
-        event = EventService.get_event_with_details(event_id)
-        comments = EventService.get_comments(event_id)
+        event = EventService.get_event_with_details(event_id, session['user_id'])
+        comments = EventService.get_comments(event_id, current_app.config['COMMENTS_PER_PAGE'])
         from app.forms.event import CommentForm
         form = CommentForm()
         return render_template('events/_detail_content.html', event=event, comments=comments, form=form, is_modal=True)
@@ -109,14 +192,20 @@ def leave(event_id):
     if 'user_id' not in session:
         return redirect(url_for('auth.login'))
 
+    wait = rate_limiter.hit('leave')
+    if wait:
+        return _rate_limited_action(event_id, wait, url_for('main.profile'))
+
     success, message = EventService.leave_event(session['user_id'], event_id)
+    if _wants_json():
+        return _action_result(event_id, success, message)
     
     # Handle AJAX request (from Modal)
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         flash(message, 'success' if success else 'warning')
         # Re-fetch data for the partial
-        event = EventService.get_event_with_details(event_id)
-        comments = EventService.get_comments(event_id)
+        event = EventService.get_event_with_details(event_id, session['user_id'])
+        comments = EventService.get_comments(event_id, current_app.config['COMMENTS_PER_PAGE'])
         from app.forms.event import CommentForm
         form = CommentForm()
         return render_template('events/_detail_content.html', event=event, comments=comments, form=form, is_modal=True)
@@ -143,3 +232,33 @@ def delete(event_id):
         flash(message, 'warning')
 
     return redirect(url_for('main.profile'))
+
+
+@events_bp.route('/<int:event_id>/comments')
+def comments(event_id):
+    """The next page of comments (?after=<cursor>) as list items for the detail view's "Load more" button"""
+    page = EventService.get_comments_page(event_id, after=request.args.get('after'),
+                                          limit=current_app.config['COMMENTS_PER_PAGE'])
+    return render_template('events/_comments.html', comments=page, event_id=event_id)
+
+
+@events_bp.route('/<int:event_id>/live')
+def live(event_id):
+    """Server-Sent Events stream of the event's deltas (LIVE_BROKER='memory' only)"""
+    if not live_updates.serves_streams:
+        abort(404)
+    # No stream_with_context: the stream needs no request state and must not hold a DB session
+    return Response(
+        live_updates.stream(event_id, request.headers.get('Last-Event-ID', type=int)),
+        mimetype='text/event-stream',
+        headers={'X-Accel-Buffering': 'no'}
+    )
+
+
+@events_bp.route('/<int:event_id>/updates')
+def updates(event_id):
+    """Long-poll fallback: deltas after ?after=<seq>, waiting up to LIVE_POLL_TIMEOUT seconds"""
+    if not live_updates.serves_streams:
+        abort(404)
+    messages, cursor = live_updates.poll(event_id, request.args.get('after', type=int))
+    return jsonify({'data': [dict(message, seq=seq) for seq, message in messages], 'cursor': cursor})
@@ -0,0 +1,57 @@
+from flask import Blueprint, Response, abort, flash, redirect, request, session, stream_with_context, url_for
+from app.models.models import Event
+from app.services.export_service import ExportService
+from app.services.rate_limiter import rate_limiter
+
+exports_bp = Blueprint('exports', __name__, url_prefix='/export')
+
+MIMETYPES = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+    'ics': 'text/calendar',
+}
+
+
+def _download(chunks, filename, fmt):
+    """Streams `chunks` as a file download, keeping the request (and DB session) alive until the last chunk"""
+    return Response(
+        stream_with_context(chunks),
+        mimetype=MIMETYPES[fmt],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+
+@exports_bp.route('/events.<fmt>')
+def events(fmt):
+    """All events as CSV or JSONL; ?kind=upcoming|past narrows the range. Rate limited per user and IP."""
+    kind = request.args.get('kind', 'all')
+    if fmt not in ('csv', 'jsonl') or kind not in ('all', 'upcoming', 'past'):
+        abort(404)
+    wait = rate_limiter.hit('export')
+    if wait:
+        return Response(rate_limiter.message(wait), 429, mimetype='text/plain',
+                        headers={'Retry-After': rate_limiter.retry_after(wait)})
+    return _download(ExportService.events(kind, fmt), f'events-{kind}.{fmt}', fmt)
+
+
+@exports_bp.route('/events/<int:event_id>/participants.<fmt>')
+def participants(event_id, fmt):
+    """Attendee list, for the event's organizer only"""
+    if 'user_id' not in session:
+        return redirect(url_for('auth.login'))
+    if fmt not in ('csv', 'jsonl'):
+        abort(404)
+
+    organizer_id = Event.query.with_entities(Event.user_id).filter_by(id=event_id).scalar()
+    if organizer_id != session['user_id']:
+        flash('Event not found or permission denied', 'danger')
+        return redirect(url_for('main.index'))
+    return _download(ExportService.participants(event_id, fmt), f'event-{event_id}-participants.{fmt}', fmt)
+
+
+@exports_bp.route('/calendar.ics')
+def calendar():
+    """The current user's joined events as an iCalendar file"""
+    if 'user_id' not in session:
+        return redirect(url_for('auth.login'))
+    return _download(ExportService.calendar(session['user_id']), 'orbit-events.ics', 'ics')
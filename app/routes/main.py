@@ -1,8 +1,25 @@
-from flask import Blueprint, render_template, redirect, session, url_for, request
+from flask import Blueprint, render_template, redirect, session, url_for, request, current_app, abort, jsonify
 from app.services.event_service import EventService
+from app.services.cache_service import cache
+from app.services.fragment_cache import fragment_cache
+from app.services.jobs import jobs
+from app.services.metrics import metrics
+from app.services.query_profiler import query_profiler
 
 main_bp = Blueprint('main', __name__)
 
+
+def _page_args():
+    """Reads keyset cursors and the page size (clamped to config limits) from the query string"""
+    per_page = request.args.get('per_page', type=int) or current_app.config['EVENTS_PER_PAGE']
+    per_page = max(1, min(per_page, current_app.config['EVENTS_MAX_PER_PAGE']))
+    return {
+        'after': request.args.get('after') or None,
+        'before': request.args.get('before') or None,
+        'limit': per_page
+    }
+
+
 @main_bp.route('/')
 def index():
     """Homepage - list all events with search and filter"""
@@ -10,21 +27,11 @@ def index():
     search_query = request.args.get('search', '').strip()
     category_filter = request.args.get('category', '').strip()
 
-    events = EventService.get_upcoming_events(userId, search_query, category_filter)
+    page = EventService.get_listing_page('upcoming', userId, search_query, category_filter, **_page_args())
+    events = page.items
     categories = EventService.get_all_categories()
 
-    # Pre-process events to add dynamic properties like 'participants' count and 'joined' status
-    # In a pure API refactor we'd serialize. Here for Jinja compatibility we pass objects
-    # but we need to ensure the template can access participant counts.
-    # The Model has 'participants' relationship. 
-    # 'participant_names' was a specific SQL aggregate. We can replicate this logic in the template or add a property to the model.
-    # For now, let's trust the model relationships in the template OR wrap them.
-    # However, existing templates use dictionary access e.g., event['title'] because of cs50.
-    # WE MUST CHANGE TEMPLATES TO DOT NOTATION OR WRAP.
-    # STRATEGY: Update templates to use dot notation, or provide a compat layer here?
-    # Refactoring to Update Templates is cleaner.
-
-    return render_template('index.html', events=events, categories=categories, 
+    return render_template('index.html', events=events, page=page, categories=categories, 
                          search_query=search_query, selected_category=category_filter)
 
 
@@ -35,22 +42,49 @@ def history():
     search_query = request.args.get('search', '').strip()
     category_filter = request.args.get('category', '').strip()
 
-    events = EventService.get_past_events(userId, search_query, category_filter)
+    page = EventService.get_listing_page('past', userId, search_query, category_filter, **_page_args())
+    events = page.items
     categories = EventService.get_all_categories()
 
-    return render_template('history.html', events=events, categories=categories, 
+    return render_template('history.html', events=events, page=page, categories=categories, 
                          search_query=search_query, selected_category=category_filter)
 
 
 @main_bp.route('/profile')
 def profile():
-    """User profile - view created and joined events"""
+    """User profile - upcoming created and joined events, paged past events and stats"""
     if 'user_id' not in session:
         return redirect(url_for('auth.login'))
 
     userId = session['user_id']
 
-    my_events = EventService.get_user_created_events(userId)
-    joined = EventService.get_user_joined_events(userId)
+    profile = EventService.get_profile(userId, **_page_args())
+
+    return render_template('profile.html', profile=profile, page=profile.past)
+
+
+def _require_stats(flag):
+    """/_stats/* exist only when their flag is on, and only for the addresses or token allowed to scrape /metrics"""
+    if not current_app.config.get(flag) or not metrics.scrape_allowed():
+        abort(404)
+
+
+@main_bp.route('/_stats/cache')
+def cache_stats():
+    """Application and fragment cache hit/miss counters (enabled by CACHE_STATS_ENABLED)"""
+    _require_stats('CACHE_STATS_ENABLED')
+    return jsonify(dict(cache.stats(), fragments=fragment_cache.stats()))
+
+
+@main_bp.route('/_stats/jobs')
+def job_stats():
+    """Background jobs per status and the latest failures (enabled by JOBS_STATS_ENABLED)"""
+    _require_stats('JOBS_STATS_ENABLED')
+    return jsonify(jobs.stats())
+
 
-    return render_template('profile.html', events=my_events, joined=joined)
+@main_bp.route('/_stats/queries')
+def query_stats():
+    """Query counts, DB time, slowest and repeated statements of recent requests (QUERY_STATS_ENABLED)"""
+    _require_stats('QUERY_STATS_ENABLED')
+    return jsonify(list(reversed(query_profiler.recent())))
@@ -1,6 +1,6 @@
-from werkzeug.security import generate_password_hash, check_password_hash
 from app import db
 from app.models.models import User
+from app.services.password_hasher import password_hasher
 
 class AuthService:
     @staticmethod
@@ -13,7 +13,7 @@ class AuthService:
         if existing_user:
             return None # Username taken
         
-        hashed_password = generate_password_hash(password)
+        hashed_password = password_hasher.hash(password)
         new_user = User(username=username, hash=hashed_password)
         
         db.session.add(new_user)
@@ -25,9 +25,13 @@ class AuthService:
         """
         Authenticates a user.
         Returns the user object if successful, else None.
+        Hashes made with an older method or cost are upgraded on success.
         """
         user = User.query.filter_by(username=username).first()
-        if user and check_password_hash(user.hash, password):
+        if user and password_hasher.verify(user.hash, password):
+            if password_hasher.needs_rehash(user.hash):
+                user.hash = password_hasher.hash(password)
+                db.session.commit()
             return user
         return None
 
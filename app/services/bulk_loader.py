@@ -0,0 +1,321 @@
+import csv
+import io
+import json
+import os
+import random
+import time as clock
+import zlib
+from contextlib import contextmanager
+from itertools import groupby
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import insert, select, func, types
+from app.models.models import User, Event, EventParticipant, Comment
+from app.services.search_service import SEARCH_DDL, SEARCH_REBUILD
+
+# Load order respects foreign keys
+TABLES = {
+    'users': User.__table__,
+    'events': Event.__table__,
+    'participants': EventParticipant.__table__,
+    'comments': Comment.__table__,
+}
+
+# Per-connection settings trading durability for speed while loading. A crash
+# mid-load can corrupt the file, which is why loads checkpoint and resume.
+SQLITE_LOAD_PRAGMAS = {
+    'synchronous': 'OFF',
+    'journal_mode': 'MEMORY',
+    'temp_store': 'MEMORY',
+    'cache_size': '-262144',  # 256 MB
+    'foreign_keys': 'OFF',    # rows are loaded parents first; the checks only cost time
+}
+
+SQLITE_SEARCH_TRIGGERS = ('events_fts_insert', 'events_fts_delete', 'events_fts_update')
+
+CATEGORIES = ['Tech', 'Music', 'Art', 'Sports', 'Food', 'Science', 'Business', 'General']
+WORDS = ('python flask meetup concert gallery workshop hackathon tasting lecture '
+         'marathon startup jazz painting robotics data garden film poetry').split()
+
+
+class BulkLoader:
+    """
+    Streams rows into the database in large batches: executemany on SQLite
+    (with relaxed pragmas), COPY on PostgreSQL. Every committed batch is
+    recorded in a checkpoint file, so an interrupted load resumes where it
+    stopped instead of starting over.
+    """
+    def __init__(self, engine, batch_size=10000, checkpoint_path=None, resume=False, progress=True):
+        self.engine = engine
+        self.dialect = engine.dialect.name
+        self.batch_size = batch_size
+        self.checkpoint_path = checkpoint_path
+        self.progress = progress
+        # Rows committed per table, plus any values the caller needs to resume identically
+        self.done = {}
+        self.meta = {}
+        if resume and checkpoint_path and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as f:
+                state = json.load(f)
+            self.done, self.meta = state['tables'], state['meta']
+        self.conn = None
+
+    @contextmanager
+    def session(self):
+        """One connection for the whole load, so the relaxed pragmas apply to every batch"""
+        with self.engine.connect() as conn:
+            self.conn = conn
+            previous = self._relax_pragmas()
+            search_suspended = self._suspend_search_triggers()
+            try:
+                yield self
+            finally:
+                conn.rollback()
+                if search_suspended:
+                    self._restore_search_triggers()
+                self._restore_pragmas(previous)
+                self.conn = None
+
+    def load(self, name, rows, total=None):
+        """Inserts `rows` (dicts) into TABLES[name], skipping rows committed by an earlier run"""
+        table = TABLES[name]
+        skip = self.done.get(name, 0)
+        done = skip
+        started = clock.perf_counter()
+
+        for batch in _batches(rows, self.batch_size, skip):
+            # Rows missing optional fields keep their column defaults, so insert each shape separately
+            for _, same_shape in groupby(batch, key=tuple):
+                same_shape = list(same_shape)
+                if self.dialect == 'postgresql':
+                    self._copy(table, same_shape)
+                else:
+                    self.conn.execute(insert(table), same_shape)
+            self.conn.commit()
+            done += len(batch)
+            self._checkpoint(name, done)
+            if self.progress:
+                rate = (done - skip) / max(clock.perf_counter() - started, 1e-9)
+                of_total = f"/{total:,}" if total else ""
+                print(f"\r   {name:<13} {done:>12,}{of_total}  ({rate:,.0f} rows/s)", end='', flush=True)
+        if self.progress:
+            print()
+        return done
+
+    def finish(self):
+        """Post-load fixups; removes the checkpoint once everything is in"""
+        if self.dialect == 'postgresql':
+            # Explicit ids bypass the serial sequences
+            for name in ('users', 'events', 'comments'):
+                self.conn.exec_driver_sql(
+                    f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), COALESCE((SELECT MAX(id) FROM {name}), 1))"
+                )
+        self.conn.exec_driver_sql("ANALYZE")
+        self.conn.commit()
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _copy(self, table, batch):
+        columns = list(batch[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in batch:
+            writer.writerow([_copy_value(row[c]) for c in columns])
+        buffer.seek(0)
+        cursor = self.conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+        finally:
+            cursor.close()
+
+    def next_ids(self):
+        """
+        First free user and event ids, for generated rows that reference each
+        other. Fixed at the first call and kept in the checkpoint, so a resumed
+        load generates exactly the same rows.
+        """
+        if 'next_ids' not in self.meta:
+            self.meta['next_ids'] = {
+                name: (self.conn.execute(select(func.max(TABLES[name].c.id))).scalar() or 0) + 1
+                for name in ('users', 'events')
+            }
+        return self.meta['next_ids']
+
+    def _checkpoint(self, name, done):
+        self.done[name] = done
+        if not self.checkpoint_path:
+            return
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'tables': self.done, 'meta': self.meta}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _relax_pragmas(self):
+        if self.dialect != 'sqlite':
+            return {}
+        previous = {}
+        for pragma, value in SQLITE_LOAD_PRAGMAS.items():
+            previous[pragma] = self.conn.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+            self.conn.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+        return previous
+
+    def _restore_pragmas(self, previous):
+        for pragma, value in previous.items():
+            self.conn.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+
+    def _suspend_search_triggers(self):
+        """Row-by-row FTS triggers dominate event inserts; one rebuild at the end is far cheaper"""
+        if self.dialect != 'sqlite':
+            return False
+        exists = self.conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events_fts'"
+        ).first()
+        if not exists:
+            return False
+        for trigger in SQLITE_SEARCH_TRIGGERS:
+            self.conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+        self.conn.commit()
+        return True
+
+    def _restore_search_triggers(self):
+        for statement in SEARCH_DDL['sqlite']:
+            self.conn.exec_driver_sql(statement)
+        self.conn.exec_driver_sql(SEARCH_REBUILD['sqlite'])
+        self.conn.commit()
+
+
+def read_rows(path, name, hash_password):
+    """
+    Streams rows for TABLES[name] from a .csv or .jsonl file, converting values
+    to the column types. A `password` field on users is hashed with
+    `hash_password`, once per distinct password.
+    """
+    table = TABLES[name]
+    converters = {column.name: _converter(column.type) for column in table.columns}
+    hashes = {}
+
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            records = (json.loads(line) for line in f if line.strip())
+        elif path.endswith('.csv'):
+            records = csv.DictReader(f)
+        else:
+            raise ValueError(f"Unsupported file type: {path} (expected .csv or .jsonl)")
+
+        for record in records:
+            if name == 'users' and 'password' in record:
+                password = record.pop('password')
+                if password not in hashes:
+                    hashes[password] = hash_password(password)
+                record['hash'] = hashes[password]
+            yield {
+                key: converters[key](value)
+                for key, value in record.items() if key in converters
+            }
+
+
+def synthetic_rows(users, events, participations, comments, password_hash, seed=42, first_ids=None):
+    """
+    Deterministic generators for each table (same seed, same rows). They share
+    one random stream, so they must be consumed in TABLES order. `first_ids`
+    ({'users': n, 'events': n}) places the rows after existing data.
+    Returns {name: (rows, total)}.
+    """
+    first_user = (first_ids or {}).get('users', 1)
+    first_event = (first_ids or {}).get('events', 1)
+    rng = random.Random(seed)
+    today = date.today()
+
+    # Participations per event, exponentially distributed so some events are popular
+    average = participations / events if events else 0
+    per_event = [min(int(rng.expovariate(1.0) * average), users) for _ in range(events)]
+
+    def user_rows():
+        for i in range(users):
+            yield {'id': first_user + i, 'username': f'user{first_user - 1 + i}', 'hash': password_hash}
+
+    def event_rows():
+        # ux_events_live_user_date_title rejects a repeated (user, date, title); the rare repeat gets its id appended
+        seen = set()
+        for i in range(events):
+            user_id = first_user + rng.randint(0, users - 1)
+            title = ' '.join(rng.sample(WORDS, 3)).title()
+            day = rng.randint(-365, 365)
+            key = (user_id * 1024 + day + 365) << 32 | zlib.crc32(title.encode())
+            if key in seen:
+                title = f'{title} #{first_event + i}'
+            seen.add(key)
+            yield {
+                'id': first_event + i,
+                'user_id': user_id,
+                'title': title,
+                'date': today + timedelta(days=day),
+                'time': time(rng.randint(8, 22), rng.choice((0, 15, 30, 45))),
+                'description': ' '.join(rng.choices(WORDS, k=30)),
+                'category': rng.choice(CATEGORIES),
+                'capacity': per_event[i] + rng.randint(0, 20),
+                'location_name': f'Venue {rng.randint(1, 500)}',
+                'participants_count': per_event[i],
+                'version': 0,
+            }
+
+    def participant_rows():
+        for i, count in enumerate(per_event):
+            for user_index in rng.sample(range(users), count):
+                yield {'user_id': first_user + user_index, 'event_id': first_event + i}
+
+    def comment_rows():
+        now = datetime.now().replace(microsecond=0)
+        for _ in range(comments):
+            yield {
+                'user_id': first_user + rng.randint(0, users - 1),
+                'event_id': first_event + rng.randint(0, events - 1),
+                'content': ' '.join(rng.choices(WORDS, k=rng.randint(3, 20))),
+                'created_at': now - timedelta(seconds=rng.randint(0, 365 * 86400)),
+            }
+
+    return {
+        'users': (user_rows(), users),
+        'events': (event_rows(), events),
+        'participants': (participant_rows(), sum(per_event)),
+        'comments': (comment_rows(), comments),
+    }
+
+
+def _batches(rows, size, skip=0):
+    batch = []
+    for index, row in enumerate(rows):
+        if index < skip:
+            continue
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _converter(column_type):
+    if isinstance(column_type, types.DateTime):
+        parse = datetime.fromisoformat
+    elif isinstance(column_type, types.Date):
+        parse = date.fromisoformat
+    elif isinstance(column_type, types.Time):
+        parse = time.fromisoformat
+    elif isinstance(column_type, types.Integer):
+        parse = int
+    else:
+        return lambda value: value
+
+    def convert(value):
+        if value is None or value == '':
+            return None
+        return value if not isinstance(value, str) else parse(value)
+    return convert
+
+
+def _copy_value(value):
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
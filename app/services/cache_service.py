@@ -0,0 +1,181 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from app.services.metrics import metrics
+
+# Distinguishes "not cached" from a cached None
+_MISSING = object()
+
+
+class TTLLRUCache:
+    """
+    Thread-safe in-process cache: entries expire after `ttl` seconds and the
+    least recently used entry is evicted once `maxsize` is reached.
+    """
+    def __init__(self, maxsize=2048, ttl=10):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TieredCache:
+    """
+    Application cache with a per-process TTL+LRU tier in front of an optional
+    shared cachelib tier (filesystem or Redis) that every worker can see.
+
+    Writes and deletes go to both tiers. Another worker's local tier may keep a
+    stale entry for up to CACHE_LOCAL_TTL seconds, so keep that short when
+    running several workers.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.local = TTLLRUCache()
+        self.shared = None
+        self.shared_ttl = 300
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        self.reset_stats()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('CACHE_ENABLED', True)
+        self.local = TTLLRUCache(
+            maxsize=app.config.get('CACHE_LOCAL_MAX_ENTRIES', 2048),
+            ttl=app.config.get('CACHE_LOCAL_TTL', 10)
+        )
+        self.shared_ttl = app.config.get('CACHE_SHARED_TTL', 300)
+        self.shared = _make_shared_tier(app.config)
+        self.reset_stats()
+        app.extensions['orbit_cache'] = self
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            self._count('local_hits')
+            metrics.cache_lookup('app', 'local_hit')
+            return value
+        if self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self._count('shared_hits')
+                metrics.cache_lookup('app', 'shared_hit')
+                self.local.set(key, value)
+                return value
+        self._count('misses')
+        metrics.cache_lookup('app', 'miss')
+        return None
+
+    def get_many(self, keys):
+        """Returns {key: value} for the keys that are cached"""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set(self, key, value):
+        if not self.enabled:
+            return
+        self.local.set(key, value)
+        if self.shared is not None:
+            self.shared.set(key, value, timeout=self.shared_ttl)
+
+    def set_many(self, mapping):
+        for key, value in mapping.items():
+            self.set(key, value)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.local.delete(key)
+        if self.shared is not None and keys:
+            self.shared.delete_many(*keys)
+        self._count('invalidations', len(keys))
+
+    def version(self, namespace):
+        """Current version token for a group of keys, created on first use"""
+        key = f"version:{namespace}"
+        token = self.get(key)
+        if token is None:
+            token = secrets.token_hex(4)
+            self.set(key, token)
+        return token
+
+    def bump(self, namespace):
+        """Invalidates every key built from `version(namespace)` in one write"""
+        key = f"version:{namespace}"
+        self.delete(key)
+        self.set(key, secrets.token_hex(4))
+
+    def clear(self):
+        self.local.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {'local_hits': 0, 'shared_hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats['local_hits'] + stats['shared_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['local_hits'] + stats['shared_hits']) / lookups, 4) if lookups else 0.0
+        stats['local_entries'] = len(self.local)
+        stats['shared_tier'] = type(self.shared).__name__ if self.shared is not None else None
+        return stats
+
+
+def _make_shared_tier(config):
+    shared_type = config.get('CACHE_SHARED_TYPE')
+    if not shared_type:
+        return None
+    if shared_type == 'filesystem':
+        from cachelib import FileSystemCache
+        return FileSystemCache(config['CACHE_SHARED_DIR'], threshold=config.get('CACHE_SHARED_MAX_ENTRIES', 10000))
+    if shared_type == 'redis':
+        from cachelib import RedisCache
+        import redis
+        return RedisCache(redis.from_url(config['CACHE_REDIS_URL']), key_prefix='orbit:')
+    raise ValueError(f"Unsupported CACHE_SHARED_TYPE: {shared_type}")
+
+
+cache = TieredCache()
@@ -0,0 +1,106 @@
+import functools
+import random
+import threading
+import time
+from flask import g, has_app_context, has_request_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine
+
+# Session key holding the time until which the user's reads stay on the primary
+STICKY_KEY = '_db_primary_until'
+
+
+def engine_options(url, config):
+    """
+    SQLAlchemy engine options for `url` from the DB_POOL_* settings.
+    SQLite keeps SQLAlchemy's own pool, which suits a local file.
+    """
+    if url.startswith('sqlite'):
+        return {}
+    return {
+        'pool_size': config.get('DB_POOL_SIZE', 5),
+        'max_overflow': config.get('DB_MAX_OVERFLOW', 10),
+        'pool_timeout': config.get('DB_POOL_TIMEOUT', 30),
+        'pool_recycle': config.get('DB_POOL_RECYCLE', 1800),
+        'pool_pre_ping': config.get('DB_POOL_PRE_PING', True),
+    }
+
+
+class RoutingSession(Session):
+    """
+    db.session class that sends reads made inside read_router.replica_reads
+    to a replica engine. Flushes and INSERT/UPDATE/DELETE statements always
+    go to the primary and mark the request as having written.
+    """
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if self._flushing or getattr(clause, 'is_dml', False):
+            read_router.mark_write()
+        elif bind is None:
+            replica = read_router.current_replica()
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class ReadRouter:
+    """
+    Routes read-only EventService calls to DATABASE_REPLICA_URLS.
+    A request keeps to one replica so its reads see a single point in time.
+    After a user's own write, their reads go to the primary for
+    REPLICA_STICKY_SECONDS (longer than the replicas are expected to lag),
+    so they always see their join, comment or new event.
+    Without replica URLs every query goes to the primary as before.
+    """
+    def __init__(self):
+        self.replicas = []
+        self.sticky_seconds = 5
+        self._local = threading.local()
+
+    def init_app(self, app):
+        self.replicas = [create_engine(url, **engine_options(url, app.config))
+                         for url in app.config.get('DATABASE_REPLICA_URLS') or []]
+        self.sticky_seconds = app.config.get('REPLICA_STICKY_SECONDS', 5)
+        app.extensions['read_router'] = self
+        if not self.replicas:
+            return
+
+        @app.after_request
+        def remember_write(response):
+            if g.pop('db_wrote', False):
+                session[STICKY_KEY] = time.time() + self.sticky_seconds
+            return response
+
+    def replica_reads(self, func):
+        """Decorator for service methods that only read; their queries may use a replica"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self._local.depth = getattr(self._local, 'depth', 0) + 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.depth -= 1
+        return wrapper
+
+    def current_replica(self):
+        """The replica engine for a query issued now, or None for the primary"""
+        if not self.replicas or not getattr(self._local, 'depth', 0) or self._sticky():
+            return None
+        if not has_app_context():
+            return random.choice(self.replicas)
+        if 'db_replica' not in g:
+            g.db_replica = random.choice(self.replicas)
+        return g.db_replica
+
+    def mark_write(self):
+        if self.replicas and has_app_context():
+            g.db_wrote = True
+
+    def _sticky(self):
+        if not has_app_context():
+            return False
+        if g.get('db_wrote'):
+            return True
+        return has_request_context() and session.get(STICKY_KEY, 0) > time.time()
+
+
+read_router = ReadRouter()
@@ -0,0 +1,59 @@
+import smtplib
+from datetime import date, timedelta
+from email.message import EmailMessage
+from flask import current_app
+from sqlalchemy import select
+from app import db
+from app.models.models import Event, EventParticipant, User
+from app.services.jobs import jobs
+
+
+class DigestService:
+    """
+    "Your upcoming events" emails, sent by send_digest jobs through the SMTP
+    server at MAIL_SERVER:MAIL_PORT (in development a local stand-in such as
+    `python -m aiosmtpd -n -l localhost:1025`). Users have no email address,
+    so mail goes to <username>@MAIL_RECIPIENT_DOMAIN.
+    """
+    @staticmethod
+    def enqueue_digests(days=7):
+        """Queues one send_digest job per user who joined an event in the next `days` days. Returns how many."""
+        user_ids = db.session.scalars(
+            select(EventParticipant.user_id).distinct()
+            .join(Event, Event.id == EventParticipant.event_id)
+            .where(Event.date >= date.today(), Event.date < date.today() + timedelta(days=days))
+        ).all()
+        jobs.enqueue_many('send_digest', [{'user_id': user_id, 'days': days} for user_id in user_ids])
+        db.session.commit()
+        return len(user_ids)
+
+    @staticmethod
+    @jobs.task('send_digest')
+    def send_digest(user_id, days=7):
+        user = db.session.get(User, user_id)
+        if user is None:
+            return
+        events = db.session.execute(
+            select(Event.title, Event.date, Event.time, Event.location_name)
+            .join(EventParticipant, EventParticipant.event_id == Event.id)
+            .where(EventParticipant.user_id == user_id,
+                   Event.date >= date.today(), Event.date < date.today() + timedelta(days=days))
+            .order_by(Event.date, Event.time, Event.id)
+        ).all()
+        if not events:
+            return
+
+        config = current_app.config
+        message = EmailMessage()
+        message['From'] = config['MAIL_SENDER']
+        message['To'] = f"{user.username}@{config['MAIL_RECIPIENT_DOMAIN']}"
+        message['Subject'] = f"Your Orbit events for the next {days} days"
+        lines = [f"Hi {user.username},", "", "Coming up:", ""]
+        for event in events:
+            when = event.date.strftime('%a %d %b') + (event.time.strftime(' %H:%M') if event.time else '')
+            where = f" @ {event.location_name}" if event.location_name else ''
+            lines.append(f"  - {when}  {event.title}{where}")
+        message.set_content("\n".join(lines) + "\n")
+
+        with smtplib.SMTP(config['MAIL_SERVER'], config['MAIL_PORT'], timeout=config.get('MAIL_TIMEOUT', 10)) as smtp:
+            smtp.send_message(message)
@@ -1,22 +1,141 @@
-from datetime import date
-from sqlalchemy import func, case, text
+import base64
+from datetime import date, datetime
+from types import SimpleNamespace
+from sqlalchemy import func, case, text, tuple_, select, insert, update, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from app import db
 from app.models.models import Event, EventParticipant, User
+from app.services.search_service import SearchService
+from app.services.cache_service import cache
+from app.services.sqlite_tuning import write_queue
+from app.services.db_routing import read_router
+from app.services.live_updates import live_updates
+from app.services.jobs import jobs
+from app.services.metrics import metrics
+
+# Keeps `IN (...)` lists well under SQLite's bound-parameter limit
+LISTING_CHUNK_SIZE = 500
+
+# Page size used when callers don't pass one; routes take theirs from Config
+DEFAULT_PAGE_SIZE = 24
+DEFAULT_COMMENTS_PAGE_SIZE = 20
+
+# Deleting an event with more participants + comments than this is left to the purge_event job
+DELETE_INLINE_MAX_ROWS = 500
+# Rows per set-based DELETE while purging a deleted event
+PURGE_BATCH_SIZE = 1000
+
+
+class EventCard:
+    """
+    An event's columns plus the aggregates a card needs.
+    Built by EventService.get_cards / load_listing so templates never touch lazy
+    relationships. Unknown attributes fall through to the wrapped event.
+    """
+    def __init__(self, event, participants_count=0, participant_names='', creator_username='Unknown', joined=False):
+        self.event = event
+        self.participants_count = participants_count
+        self.participant_names = participant_names
+        self.creator_username = creator_username
+        self.joined = joined
+
+    def __getattr__(self, name):
+        return getattr(self.event, name)
+
+    @property
+    def is_full(self):
+        return bool(self.capacity) and self.participants_count >= self.capacity
+
+
+class EventPage:
+    """
+    One keyset page of events.
+    `next_cursor` / `prev_cursor` are opaque tokens for the `after` / `before`
+    arguments of the listing methods, or None when there is nothing that way.
+    """
+    def __init__(self, items, next_cursor=None, prev_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+class ProfileDashboard:
+    """
+    Everything the profile page shows for one user: their upcoming `hosted`
+    and `joined` events as EventCards, one EventPage of `past` events (hosted
+    or joined, most recent first) and summary `stats`.
+    """
+    def __init__(self, hosted, joined, past, stats):
+        self.hosted = hosted
+        self.joined = joined
+        self.past = past
+        self.stats = stats
+
+
+def encode_cursor(event):
+    """Encodes an event's (date, id) sort key as a URL-safe cursor"""
+    return _encode_key(event.date, event.id)
+
+
+def decode_cursor(cursor):
+    """Decodes a cursor back to a (date, id) tuple. Raises ValueError if malformed."""
+    return _decode_key(cursor, date.fromisoformat)
+
+
+def encode_comment_cursor(comment):
+    """Encodes a comment's (created_at, id) sort key as a URL-safe cursor"""
+    return _encode_key(comment.created_at, comment.id)
+
+
+def decode_comment_cursor(cursor):
+    return _decode_key(cursor, datetime.fromisoformat)
+
+
+def encode_rank_cursor(score, event_id):
+    """Encodes a search result's (relevance score, id) sort key as a URL-safe cursor"""
+    return _encode_key(score, event_id)
+
+
+def decode_rank_cursor(cursor):
+    return _decode_key(cursor, float)
+
+
+def _encode_key(value, row_id):
+    raw = f"{value.isoformat() if isinstance(value, date) else repr(value)}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_key(cursor, parse):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        value, row_id = base64.urlsafe_b64decode(padded).decode().rsplit('|', 1)
+        return parse(value), int(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
 
 class EventService:
     @staticmethod
+    @write_queue.serialized
     def create_event(user_id, event_data):
-        """Creates a new event with spam check"""
-        # Spam Protection: Check for duplicates
-        existing_event = Event.query.filter_by(
-            user_id=user_id,
-            title=event_data['title'],
-            date=event_data['date']
-        ).first()
-        
-        if existing_event:
-            return None, "Event already exists"
-
+        """
+        Creates a new event unless the user already has one with this title on
+        this date. Returns (event, message, created); for a duplicate submit the
+        event is the existing one and created is False.
+        The unique index ux_events_live_user_date_title does the check as part
+        of the INSERT, so there is no lookup first and two concurrent
+        submissions can't both get through: with ON CONFLICT DO NOTHING an
+        empty RETURNING means a duplicate, and the existing row is selected
+        (its version is left alone). The index skips soft-deleted events, so a
+        deleted one can be created again.
+        """
         # Handle capacity
         capacity = event_data.get('capacity')
         if not capacity:
@@ -24,7 +143,7 @@ class EventService:
         else:
             capacity = int(capacity)
 
-        new_event = Event(
+        values = dict(
             user_id=user_id,
             title=event_data['title'],
             date=event_data['date'],
@@ -36,129 +155,791 @@ class EventService:
             location_name=event_data.get('location_name'),
             image_url=event_data.get('image_url')
         )
-        
-        db.session.add(new_event)
+        event = db.session.scalars(
+            _dialect_insert(Event)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=['user_id', 'date', 'title'],
+                                    index_where=Event.deleted_at.is_(None))
+            .returning(Event)
+        ).one_or_none()
+        if event is None:
+            # No row came back, so the index already holds this event
+            event = db.session.scalars(
+                select(Event).where(Event.user_id == user_id, Event.date == values['date'],
+                                    Event.title == values['title'])
+            ).one()
+            db.session.rollback()
+            metrics.event_operation('create', 'duplicate')
+            return event, "You already created this event", False
         db.session.commit()
-        return new_event, "Event created successfully"
+        cache.bump('listings')
+        cache.delete('categories')
+        _bump_profiles(user_id)
+        metrics.event_operation('create', 'created')
+        return event, "Event created successfully", True
 
     @staticmethod
+    @write_queue.serialized
     def add_comment(user_id, event_id, content):
         """Adds a comment to an event"""
         from app.models.models import Comment
         if not content:
+            metrics.event_operation('comment', 'empty')
             return False, "Content cannot be empty"
 
+        # The counter UPDATE goes first: it matches no row for a missing or soft-deleted event
+        comments_count = db.session.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(comments_count=Event.comments_count + 1, version=Event.version + 1)
+            .returning(Event.comments_count)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if comments_count is None:
+            db.session.rollback()
+            metrics.event_operation('comment', 'not_found')
+            return None, "Event not found"
+
         new_comment = Comment(
             user_id=user_id,
             event_id=event_id,
             content=content
         )
         db.session.add(new_comment)
+        db.session.flush()
+        comment_id = new_comment.id
         db.session.commit()
+        cache.delete(_comments_key(event_id), _card_key(event_id))
+        _publish_comment(event_id, comment_id, comments_count)
+        metrics.event_operation('comment', 'added')
         return new_comment, "Comment added successfully"
 
     @staticmethod
-    def get_comments(event_id):
-        """Get comments for an event"""
-        from app.models.models import Comment
-        return Comment.query.filter_by(event_id=event_id).order_by(Comment.created_at.desc()).all()
+    @read_router.replica_reads
+    def get_comments(event_id, limit=DEFAULT_COMMENTS_PAGE_SIZE):
+        """
+        First page of an event's comments (newest first) with author names, as
+        an EventPage whose next_cursor loads the rest. Cached per event;
+        later pages come from get_comments_page.
+        """
+        page = cache.get(_comments_key(event_id))
+        if page is None or page['limit'] != limit:
+            first = EventService.get_comments_page(event_id, limit=limit)
+            page = {'items': [row._asdict() for row in first], 'next_cursor': first.next_cursor, 'limit': limit}
+            cache.set(_comments_key(event_id), page)
+        return EventPage([SimpleNamespace(**c) for c in page['items']], next_cursor=page['next_cursor'])
 
     @staticmethod
+    @read_router.replica_reads
+    def get_event_version(event_id):
+        """
+        The event's version stamp (bumped by every join, leave and comment), or
+        None if it doesn't exist. A single primary-key lookup, cheap enough to
+        answer conditional GETs before anything is rendered.
+        """
+        return db.session.query(Event.version).filter(Event.id == event_id).scalar()
+
+    @staticmethod
+    @read_router.replica_reads
     def get_event_with_details(event_id, current_user_id=None):
-        """Returns event with participant count and join status"""
-        # Since we use ORM, some of this is easier handled in the loop or with hybrid properties,
-        # but to keep efficient bulk loading patterns similar to previous raw SQL:
-        return db.session.get(Event, event_id)
+        """Returns the event's EventCard with participant count and join status, or None"""
+        cards = EventService.get_cards([event_id], current_user_id)
+        return cards[0] if cards else None
 
     @staticmethod
-    def get_upcoming_events(user_id, search_query='', category_filter=''):
-        """Fetch upcoming events with filters"""
-        today = str(date.today())
+    @read_router.replica_reads
+    def get_upcoming_events(user_id, search_query='', category_filter='', after=None, before=None, limit=DEFAULT_PAGE_SIZE):
+        """Fetch one page of upcoming events with filters, soonest first"""
+        today = date.today()
         
         query = Event.query.filter(Event.date >= today)
+        query, ranking = EventService._apply_filters(query, search_query, category_filter)
         
-        if search_query:
-            search_pattern = f"%{search_query}%"
-            query = query.filter((Event.title.like(search_pattern)) | (Event.description.like(search_pattern)))
-        
-        if category_filter and category_filter != 'All':
-            query = query.filter(Event.category == category_filter)
-        
-        # Sort by date
-        query = query.order_by(Event.date.asc())
-        
-        return query.all()
+        return EventService._keyset_page(query, descending=False, after=after, before=before, limit=limit,
+                                         ranking=ranking)
 
     @staticmethod
-    def get_past_events(user_id, search_query='', category_filter=''):
-        """Fetch past events with filters"""
-        today = str(date.today())
+    @read_router.replica_reads
+    def get_past_events(user_id, search_query='', category_filter='', after=None, before=None, limit=DEFAULT_PAGE_SIZE):
+        """Fetch one page of past events with filters, most recent first"""
+        today = date.today()
         
         query = Event.query.filter(Event.date < today)
+        query, ranking = EventService._apply_filters(query, search_query, category_filter)
         
-        if search_query:
-            search_pattern = f"%{search_query}%"
-            query = query.filter((Event.title.like(search_pattern)) | (Event.description.like(search_pattern)))
+        return EventService._keyset_page(query, descending=True, after=after, before=before, limit=limit,
+                                         ranking=ranking)
+
+    @staticmethod
+    def _apply_filters(query, search_query, category_filter):
+        """
+        Applies the category filter and the search. Returns the query and the
+        search's ranking subquery (see SearchService.ranking), which
+        _keyset_statement joins to order matches by relevance; None without a
+        search or a full-text index, in which case matches are filtered with
+        LIKE and stay in date order.
+        """
+        ranking = SearchService.ranking(search_query) if search_query else None
+        if search_query and ranking is None:
+            query = SearchService.filter(query, search_query)
         
         if category_filter and category_filter != 'All':
             query = query.filter(Event.category == category_filter)
-        
-        # Sort by date DESC logic for history
-        query = query.order_by(Event.date.desc())
-        
-        return query.all()
+
+        return query, ranking
+
+    @staticmethod
+    @read_router.replica_reads
+    def get_event_rows(kind, columns, user_id=None, search_query='', category_filter='', after=None, before=None,
+                       limit=DEFAULT_PAGE_SIZE, with_creator=False):
+        """
+        Keyset page of plain rows holding only `columns` (which must include
+        Event.id and Event.date), without hydrating ORM objects.
+        kind is 'upcoming', 'past', or the user's 'created' / 'joined' events.
+        with_creator joins users so User.username can be selected.
+        """
+        stmt, finish = EventService.event_rows_statement(
+            kind, columns, user_id=user_id, search_query=search_query, category_filter=category_filter,
+            after=after, before=before, limit=limit, with_creator=with_creator
+        )
+        return finish(db.session.execute(stmt).all())
+
+    @staticmethod
+    def event_rows_statement(kind, columns, user_id=None, search_query='', category_filter='', after=None, before=None,
+                             limit=DEFAULT_PAGE_SIZE, with_creator=False):
+        """
+        The SELECT behind get_event_rows and a function building the EventPage
+        from its rows, for callers that execute it themselves (app/async_app.py).
+        """
+        query = select(*columns).select_from(Event)
+        if with_creator:
+            query = query.join(User, User.id == Event.user_id)
+
+        today = date.today()
+        if kind == 'upcoming':
+            query, descending = query.filter(Event.date >= today), False
+        elif kind == 'past':
+            query, descending = query.filter(Event.date < today), True
+        elif kind == 'created':
+            query, descending = query.filter(Event.user_id == user_id), False
+        elif kind == 'joined':
+            query = query.join(EventParticipant, EventParticipant.event_id == Event.id)
+            query, descending = query.filter(EventParticipant.user_id == user_id), False
+        else:
+            raise ValueError(f"Unknown listing kind: {kind}")
+
+        query, ranking = EventService._apply_filters(query, search_query, category_filter)
+        return EventService._keyset_statement(query, descending=descending, after=after, before=before, limit=limit,
+                                              ranking=ranking)
+
+    @staticmethod
+    @read_router.replica_reads
+    def get_event_row(event_id, columns, with_creator=False):
+        """A single event as a plain row of `columns`, or None"""
+        return db.session.execute(EventService.event_row_statement(event_id, columns, with_creator)).first()
+
+    @staticmethod
+    def event_row_statement(event_id, columns, with_creator=False):
+        """The SELECT behind get_event_row"""
+        query = select(*columns).select_from(Event)
+        if with_creator:
+            query = query.join(User, User.id == Event.user_id)
+        return query.where(Event.id == event_id).limit(1)
+
+    @staticmethod
+    @read_router.replica_reads
+    def get_comments_page(event_id, after=None, limit=DEFAULT_COMMENTS_PAGE_SIZE):
+        """
+        Keyset page of an event's comments, newest first, ordered by
+        (created_at, id) and with author names selected in the same query.
+        """
+        stmt, finish = EventService.comments_page_statement(event_id, after=after, limit=limit)
+        return finish(db.session.execute(stmt).all())
+
+    @staticmethod
+    def comments_page_statement(event_id, after=None, limit=DEFAULT_COMMENTS_PAGE_SIZE):
+        """The SELECT behind get_comments_page and a function building its EventPage from the rows"""
+        from app.models.models import Comment
+        # Joined through events so the soft-delete filter hides a deleted event's comments until purge_event runs
+        query = (select(Comment.id, Comment.content, Comment.user_id, Comment.created_at, User.username)
+                 .join(Event, Event.id == Comment.event_id)
+                 .join(User, User.id == Comment.user_id)
+                 .where(Comment.event_id == event_id))
+
+        if after:
+            try:
+                query = query.where(tuple_(Comment.created_at, Comment.id) < decode_comment_cursor(after))
+            except ValueError:
+                pass
+
+        def finish(rows):
+            has_more = len(rows) > limit
+            items = rows[:limit]
+            return EventPage(items, next_cursor=encode_comment_cursor(items[-1]) if has_more else None)
+
+        return query.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(limit + 1), finish
+
+    @staticmethod
+    def _keyset_page(query, descending, after=None, before=None, limit=DEFAULT_PAGE_SIZE, ranking=None):
+        """Runs an Event query through _keyset_statement and returns the EventPage"""
+        query, finish = EventService._keyset_statement(query, descending, after=after, before=before, limit=limit,
+                                                       ranking=ranking)
+        return finish(query.all())
+
+    @staticmethod
+    def _keyset_statement(query, descending, after=None, before=None, limit=DEFAULT_PAGE_SIZE, ranking=None):
+        """
+        Seeks to a page ordered by (date, id) without OFFSET, so deep pages cost
+        the same as the first one. `after` walks forward, `before` walks back.
+        With a search `ranking` (EventService._apply_filters) only its matches
+        are kept, ordered by (score, id), most relevant first.
+        Malformed cursors are ignored and yield the first page.
+        Returns the query limited to the page (plus one row that tells whether
+        there is more) and a function turning its rows into the EventPage.
+        """
+        if ranking is None:
+            key_columns, decode, encode = (Event.date, Event.id), decode_cursor, encode_cursor
+
+            def item(row):
+                return row
+        else:
+            # The score is selected alongside so pages can hand out (score, id) cursors
+            query = query.join(ranking, ranking.c.id == Event.id).add_columns(ranking.c.score.label('search_score'))
+            key_columns, decode, descending = (ranking.c.score, Event.id), decode_rank_cursor, False
+
+            def item(row):
+                # ORM queries yield (Event, score); column selects yield rows that keep the extra column
+                return row[0] if isinstance(row[0], Event) else row
+
+            def encode(row):
+                return encode_rank_cursor(row.search_score, item(row).id)
+
+        key = tuple_(*key_columns)
+        forward = tuple(c.desc() for c in key_columns) if descending else tuple(c.asc() for c in key_columns)
+        backward = tuple(c.asc() for c in key_columns) if descending else tuple(c.desc() for c in key_columns)
+
+        try:
+            after = decode(after) if after else None
+            before = decode(before) if before else None
+        except ValueError:
+            after = before = None
+
+        if before:
+            seek = key > before if descending else key < before
+
+            def finish_backward(rows):
+                has_more = len(rows) > limit
+                rows = rows[:limit][::-1]
+                return EventPage(
+                    [item(row) for row in rows],
+                    next_cursor=encode(rows[-1]) if rows else None,
+                    prev_cursor=encode(rows[0]) if has_more else None
+                )
+
+            return query.filter(seek).order_by(*backward).limit(limit + 1), finish_backward
+
+        if after:
+            seek = key < after if descending else key > after
+            query = query.filter(seek)
+
+        def finish(rows):
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            return EventPage(
+                [item(row) for row in rows],
+                next_cursor=encode(rows[-1]) if has_more else None,
+                prev_cursor=encode(rows[0]) if after and rows else None
+            )
+
+        return query.order_by(*forward).limit(limit + 1), finish
+
+    @staticmethod
+    @read_router.replica_reads
+    def get_listing_page(kind, viewer_id=None, search_query='', category_filter='', after=None, before=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        One page of EventCards for the 'upcoming' or 'past' listing.
+        The page's event ids are cached per filter/cursor combination and all
+        dropped at once when an event is created or deleted; the cards come from
+        the per-event cache, so a warm page only queries the viewer's join status.
+        """
+        key = f"listing:{cache.version('listings')}:{kind}:{date.today()}:{limit}:{after}:{before}:{category_filter}:{search_query}"
+        cached = cache.get(key)
+        if cached is None:
+            fetch = EventService.get_upcoming_events if kind == 'upcoming' else EventService.get_past_events
+            page = fetch(viewer_id, search_query, category_filter, after=after, before=before, limit=limit)
+            cache.set(key, ([e.id for e in page.items], page.next_cursor, page.prev_cursor))
+            return EventPage(EventService.load_listing(page.items, viewer_id), page.next_cursor, page.prev_cursor)
+
+        event_ids, next_cursor, prev_cursor = cached
+        return EventPage(EventService.get_cards(event_ids, viewer_id), next_cursor, prev_cursor)
+
+    @staticmethod
+    @read_router.replica_reads
+    def load_listing(events, viewer_id=None):
+        """Wraps already-loaded events in EventCards (see get_cards)"""
+        events = list(events)
+        return EventService.get_cards([e.id for e in events], viewer_id, events)
+
+    @staticmethod
+    @read_router.replica_reads
+    def get_cards(event_ids, viewer_id=None, events=None):
+        """
+        Returns EventCards, in `event_ids` order, with counts, creator names,
+        participant names and the viewer's join status filled in.
+        Card data is cached per event; misses are built with one query for
+        creators and one for participants (per chunk of LISTING_CHUNK_SIZE),
+        plus one for join status, regardless of listing size.
+        Ids of missing events are skipped.
+        """
+        if not event_ids:
+            return []
+
+        cached = cache.get_many([_card_key(event_id) for event_id in event_ids])
+        payloads = {event_id: cached[_card_key(event_id)] for event_id in event_ids if _card_key(event_id) in cached}
+
+        missing = [event_id for event_id in event_ids if event_id not in payloads]
+        if missing:
+            if events is None:
+                loaded = []
+                for chunk in _chunks(missing):
+                    loaded.extend(Event.query.filter(Event.id.in_(chunk)))
+            else:
+                wanted = set(missing)
+                loaded = [e for e in events if e.id in wanted]
+            built = EventService._build_card_payloads(loaded)
+            cache.set_many({_card_key(event_id): payload for event_id, payload in built.items()})
+            payloads.update(built)
+
+        joined = set()
+        if viewer_id:
+            for chunk in _chunks(list(payloads)):
+                rows = db.session.query(EventParticipant.event_id).filter(
+                    EventParticipant.user_id == viewer_id,
+                    EventParticipant.event_id.in_(chunk)
+                )
+                joined.update(r.event_id for r in rows)
+
+        return [
+            EventCard(
+                SimpleNamespace(**payloads[event_id]['event']),
+                participants_count=payloads[event_id]['participants_count'],
+                participant_names=payloads[event_id]['participant_names'],
+                creator_username=payloads[event_id]['creator_username'],
+                joined=event_id in joined
+            )
+            for event_id in event_ids if event_id in payloads
+        ]
+
+    @staticmethod
+    def _build_card_payloads(events):
+        """Plain, cacheable card data for each event: columns plus aggregates"""
+        if not events:
+            return {}
+
+        event_ids = [e.id for e in events]
+        creator_ids = list({e.user_id for e in events})
+
+        creators = {}
+        for chunk in _chunks(creator_ids):
+            for user_id, username in db.session.query(User.id, User.username).filter(User.id.in_(chunk)):
+                creators[user_id] = username
+
+        names = {event_id: [] for event_id in event_ids}
+        for chunk in _chunks(event_ids):
+            rows = (db.session.query(EventParticipant.event_id, User.username)
+                    .join(User, User.id == EventParticipant.user_id)
+                    .filter(EventParticipant.event_id.in_(chunk))
+                    .order_by(EventParticipant.event_id, EventParticipant.joined_at, EventParticipant.user_id))
+            for event_id, username in rows:
+                names[event_id].append(username)
+
+        columns = Event.__table__.columns.keys()
+        return {
+            e.id: {
+                'event': {column: getattr(e, column) for column in columns},
+                'participants_count': e.participants_count,
+                'participant_names': ", ".join(names[e.id]),
+                'creator_username': creators.get(e.user_id, "Unknown")
+            }
+            for e in events
+        }
 
     @staticmethod
+    @read_router.replica_reads
     def get_all_categories():
-        return [r.category for r in db.session.query(Event.category).distinct().order_by(Event.category).all() if r.category]
+        categories = cache.get('categories')
+        if categories is None:
+            stmt, finish = EventService.categories_statement()
+            categories = finish(db.session.execute(stmt).all())
+            cache.set('categories', categories)
+        return categories
 
     @staticmethod
+    def categories_statement():
+        def finish(rows):
+            return [r.category for r in rows if r.category]
+        return select(Event.category).distinct().order_by(Event.category), finish
+
+    @staticmethod
+    @write_queue.serialized
     def join_event(user_id, event_id):
-        event = db.session.get(Event, event_id)
-        if not event:
-            return False, "Event not found"
-            
-        # Check if already joined
-        participant = EventParticipant.query.filter_by(user_id=user_id, event_id=event_id).first()
-        if participant:
-            return False, "You already joined this event"
-            
-        # Check capacity
-        current_count = EventParticipant.query.filter_by(event_id=event_id).count()
-        if event.capacity and current_count >= event.capacity:
+        """
+        Joins an event without a read-then-write race.
+        The capacity check and counter increment are a single conditional UPDATE
+        (row-locked on PostgreSQL, RESERVED lock on SQLite), and the participant
+        INSERT relies on the primary key to reject duplicate joins.
+        """
+        reserved = db.session.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .where((Event.capacity.is_(None)) | (Event.participants_count < Event.capacity))
+            .values(participants_count=Event.participants_count + 1, version=Event.version + 1)
+            .returning(Event.participants_count, Event.capacity, Event.user_id)
+            .execution_options(synchronize_session=False)
+        ).first()
+
+        if not reserved:
+            db.session.rollback()
+            event = db.session.get(Event, event_id)
+            if not event:
+                metrics.event_operation('join', 'not_found')
+                return False, "Event not found"
+            if event.is_joined(user_id):
+                metrics.event_operation('join', 'already_joined')
+                return False, "You already joined this event"
+            metrics.event_operation('join', 'full')
             return False, "Event is full"
-            
-        new_participant = EventParticipant(user_id=user_id, event_id=event_id)
-        db.session.add(new_participant)
-        db.session.commit()
+
+        try:
+            db.session.execute(insert(EventParticipant).values(user_id=user_id, event_id=event_id))
+            db.session.commit()
+        except IntegrityError:
+            # Already a participant: the rollback also undoes the counter increment
+            db.session.rollback()
+            metrics.event_operation('join', 'already_joined')
+            return False, "You already joined this event"
+
+        count, capacity, host_id = reserved
+        cache.delete(_card_key(event_id))
+        _bump_profiles(user_id, host_id)
+        _publish_participants(event_id, count, capacity, change=1)
+        metrics.event_operation('join', 'joined')
         return True, "You have joined the event!"
 
     @staticmethod
+    @write_queue.serialized
     def leave_event(user_id, event_id):
-        participant = EventParticipant.query.filter_by(user_id=user_id, event_id=event_id).first()
-        if not participant:
+        removed = db.session.execute(
+            delete(EventParticipant)
+            .where(EventParticipant.user_id == user_id, EventParticipant.event_id == event_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not removed:
+            db.session.rollback()
+            metrics.event_operation('leave', 'not_joined')
             return False, "You are not part of this event"
-            
-        db.session.delete(participant)
+
+        counts = db.session.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(
+                participants_count=case((Event.participants_count > 0, Event.participants_count - 1), else_=0),
+                version=Event.version + 1
+            )
+            .returning(Event.participants_count, Event.capacity, Event.user_id)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if counts is None:
+            # Soft-deleted and waiting for purge_event: leave its participant rows to the purge
+            db.session.rollback()
+            metrics.event_operation('leave', 'not_found')
+            return False, "Event not found"
         db.session.commit()
+        count, capacity, host_id = counts
+        cache.delete(_card_key(event_id))
+        _bump_profiles(user_id, host_id)
+        _publish_participants(event_id, count, capacity, change=-1)
+        metrics.event_operation('leave', 'left')
         return True, "You have left the event"
 
     @staticmethod
+    def reconcile_participant_counts():
+        """
+        Recomputes events.participants_count from event_participants for every
+        event whose stored counter has drifted. Returns the number of rows fixed.
+        """
+        return _reconcile_counter(Event.participants_count, EventParticipant.event_id)
+
+    @staticmethod
+    def reconcile_comment_counts():
+        """Same as reconcile_participant_counts, for events.comments_count"""
+        from app.models.models import Comment
+        return _reconcile_counter(Event.comments_count, Comment.event_id)
+
+    @staticmethod
+    @write_queue.serialized
     def delete_event(user_id, event_id):
-        event = Event.query.filter_by(id=event_id, user_id=user_id).first()
-        if not event:
+        """
+        Soft-deletes the event, which takes it out of every query at once, then
+        removes its rows with purge_event: right here for a small event, in a
+        background job when it has more than DELETE_INLINE_MAX_ROWS
+        participants and comments, so a big one doesn't hold up the request.
+        """
+        deleted = db.session.execute(
+            update(Event)
+            .where(Event.id == event_id, Event.user_id == user_id)
+            .values(deleted_at=func.now(), version=Event.version + 1)
+            .returning(Event.participants_count, Event.comments_count)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if not deleted:
+            db.session.rollback()
+            metrics.event_operation('delete', 'not_found')
             return False, "Event not found or permission denied"
-            
-        # Cascade delete is handled by database ON DELETE CASCADE, but SQLAlchemy also handles it via relationships
-        db.session.delete(event)
+
+        inline = sum(deleted) <= DELETE_INLINE_MAX_ROWS
+        if not inline:
+            jobs.enqueue('purge_event', event_id=event_id)
         db.session.commit()
+        cache.delete(_card_key(event_id), _comments_key(event_id), 'categories')
+        cache.bump('listings')
+        _bump_profiles(user_id)
+        live_updates.publish(event_id, {'type': 'deleted'})
+        if inline:
+            EventService.purge_event(event_id)
+        metrics.event_operation('delete', 'deleted')
         return True, "Event deleted successfully"
 
     @staticmethod
+    @jobs.task('purge_event', max_attempts=10)
+    def purge_event(event_id):
+        """
+        Deletes a soft-deleted event's participants and comments in batches of
+        PURGE_BATCH_SIZE rows (a set-based DELETE per batch, each its own
+        write turn and commit), then the event row. Participants' profiles are
+        dropped from the cache as their rows go. Resumes where it stopped if
+        interrupted, so it is safe to run again.
+        """
+        while True:
+            # WriterBusy from a full write queue fails the attempt and the job is retried
+            removed = EventService._purge_batch(event_id, PURGE_BATCH_SIZE)
+            if not removed:
+                break
+        cache.delete(_card_key(event_id), _comments_key(event_id))
+
+    @staticmethod
+    @write_queue.serialized
+    def _purge_batch(event_id, batch_size):
+        """Deletes up to batch_size participants and comments of the event, or the event row once they are gone"""
+        from app.models.models import Comment
+        user_ids = db.session.scalars(
+            delete(EventParticipant)
+            .where(EventParticipant.event_id == event_id,
+                   EventParticipant.user_id.in_(select(EventParticipant.user_id)
+                                                .where(EventParticipant.event_id == event_id).limit(batch_size)))
+            .returning(EventParticipant.user_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        comments = db.session.execute(
+            delete(Comment)
+            .where(Comment.id.in_(select(Comment.id).where(Comment.event_id == event_id).limit(batch_size)))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        removed = len(user_ids) + comments
+        if not removed:
+            db.session.execute(
+                delete(Event)
+                .where(Event.id == event_id, Event.deleted_at.is_not(None))
+                .execution_options(synchronize_session=False, include_deleted=True)
+            )
+        db.session.commit()
+        _bump_profiles(*user_ids)
+        return removed
+
+    @staticmethod
+    @read_router.replica_reads
     def get_user_created_events(user_id):
-        return Event.query.filter_by(user_id=user_id).order_by(Event.date.asc()).all()
+        return Event.query.filter_by(user_id=user_id).order_by(Event.date.asc(), Event.id.asc()).all()
         
     @staticmethod
+    @read_router.replica_reads
     def get_user_joined_events(user_id):
         # Join-based query
-        return Event.query.join(EventParticipant).filter(EventParticipant.user_id == user_id).order_by(Event.date.asc()).all()
+        return Event.query.join(EventParticipant).filter(EventParticipant.user_id == user_id).order_by(Event.date.asc(), Event.id.asc()).all()
+
+    @staticmethod
+    @read_router.replica_reads
+    def get_profile(user_id, after=None, before=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        The user's ProfileDashboard. Built from three queries (summary stats,
+        upcoming event ids with the user's role, one keyset page of past event
+        ids) plus get_cards for whatever the card cache misses: up to three
+        more (events, creators, participants), so six when nothing is cached.
+        Cached per user until they join, leave, create or delete an event or
+        someone joins or leaves one they host; past pages are keyed by cursor
+        like listings.
+        """
+        prefix = f"profile:{cache.version(_profile_namespace(user_id))}:{user_id}:{date.today()}"
+
+        summary = cache.get(f"{prefix}:summary")
+        if summary is None:
+            summary = EventService._profile_summary(user_id)
+            cache.set(f"{prefix}:summary", summary)
+
+        past_key = f"{prefix}:past:{limit}:{after}:{before}"
+        past = cache.get(past_key)
+        if past is None:
+            hosted, joined = _profile_roles(user_id)
+            stmt, finish = EventService._keyset_statement(
+                select(Event.id, Event.date, hosted.label('hosted'), joined.label('joined'))
+                .where((hosted | joined) & (Event.date < date.today())),
+                descending=True, after=after, before=before, limit=limit
+            )
+            page = finish(db.session.execute(stmt).all())
+            past = {
+                'rows': [(r.id, r.hosted, r.joined) for r in page.items],
+                'next_cursor': page.next_cursor,
+                'prev_cursor': page.prev_cursor,
+            }
+            cache.set(past_key, past)
+
+        rows = summary['upcoming'] + past['rows']
+        cards = {card.id: card for card in EventService.get_cards(list(dict.fromkeys(r[0] for r in rows)))}
+        for event_id, _, joined in rows:
+            if event_id in cards:
+                cards[event_id].joined = joined
+
+        def pick(rows, role):
+            return [cards[r[0]] for r in rows if r[role] and r[0] in cards]
+
+        return ProfileDashboard(
+            hosted=pick(summary['upcoming'], 1),
+            joined=pick(summary['upcoming'], 2),
+            past=EventPage([cards[r[0]] for r in past['rows'] if r[0] in cards],
+                           past['next_cursor'], past['prev_cursor']),
+            stats=summary['stats']
+        )
+
+    @staticmethod
+    def _profile_summary(user_id):
+        """Cacheable stats and upcoming (event id, hosted, joined) rows for get_profile"""
+        hosted, joined = _profile_roles(user_id)
+        upcoming = Event.date >= date.today()
+
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        totals = db.session.execute(
+            select(
+                count_where(hosted).label('hosted'),
+                count_where(hosted & upcoming).label('hosted_upcoming'),
+                count_where(joined).label('joined'),
+                count_where(joined & upcoming).label('joined_upcoming'),
+                func.coalesce(func.sum(case((hosted, Event.participants_count), else_=0)), 0).label('attendees'),
+                # Fill rate only counts events with a capacity
+                func.coalesce(func.sum(case((hosted & Event.capacity.isnot(None), Event.participants_count),
+                                            else_=0)), 0).label('seats_taken'),
+                func.coalesce(func.sum(case((hosted, Event.capacity), else_=0)), 0).label('seats'),
+            ).where(hosted | joined)
+        ).one()
+
+        rows = db.session.execute(
+            select(Event.id, hosted.label('hosted'), joined.label('joined'))
+            .where((hosted | joined) & upcoming)
+            .order_by(Event.date.asc(), Event.id.asc())
+        ).all()
+
+        return {
+            'stats': {
+                'hosted': totals.hosted,
+                'hosted_upcoming': totals.hosted_upcoming,
+                'hosted_past': totals.hosted - totals.hosted_upcoming,
+                'joined': totals.joined,
+                'joined_upcoming': totals.joined_upcoming,
+                'joined_past': totals.joined - totals.joined_upcoming,
+                'attendees': totals.attendees,
+                'fill_rate': round(totals.seats_taken / totals.seats, 4) if totals.seats else None,
+            },
+            'upcoming': [(r.id, r.hosted, r.joined) for r in rows],
+        }
+
+
+
+def _publish_participants(event_id, count, capacity, change):
+    """Live delta for a join (change=1) or leave (-1), plus a capacity delta when the event fills or reopens"""
+    full = capacity is not None and count >= capacity
+    live_updates.publish(event_id, {'type': 'participants', 'count': count, 'capacity': capacity, 'full': full})
+    was_full = capacity is not None and count - change >= capacity
+    if full != was_full:
+        live_updates.publish(event_id, {'type': 'capacity', 'full': full})
+
+
+def _reconcile_counter(counter, foreign_key):
+    """UPDATE events SET counter = (actual row count) for every event where they differ"""
+    actual = (
+        select(func.count())
+        .select_from(foreign_key.table)
+        .where(foreign_key == Event.id)
+        .scalar_subquery()
+    )
+    fixed = db.session.execute(
+        update(Event)
+        .where(counter != actual)
+        .values({counter: actual})
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    return fixed
+
+
+def _publish_comment(event_id, comment_id, comments_count):
+    """Live delta for a new comment, shaped like the rows get_comments returns"""
+    from app.models.models import Comment
+    if not live_updates.enabled:
+        return
+    row = (db.session.query(Comment.id, Comment.content, Comment.user_id, Comment.created_at, User.username)
+           .join(User, User.id == Comment.user_id)
+           .filter(Comment.id == comment_id)
+           .first())
+    if row:
+        live_updates.publish(event_id, {
+            'type': 'comment', 'id': row.id, 'content': row.content, 'user_id': row.user_id,
+            'username': row.username, 'created_at': row.created_at.strftime('%Y-%m-%d %H:%M'),
+            'comments_count': comments_count
+        })
+
+
+def _profile_roles(user_id):
+    """(hosted, joined) conditions on Event for get_profile; usable in WHERE and as selected columns"""
+    joined = Event.id.in_(select(EventParticipant.event_id).where(EventParticipant.user_id == user_id))
+    return Event.user_id == user_id, joined
+
+
+def _profile_namespace(user_id):
+    return f"profile:{user_id}"
+
+
+def _bump_profiles(*user_ids):
+    """Drops the cached profile of each user (see get_profile)"""
+    for user_id in set(user_ids):
+        cache.bump(_profile_namespace(user_id))
+
+
+def _card_key(event_id):
+    return f"event:{event_id}:card"
+
+
+def _comments_key(event_id):
+    return f"event:{event_id}:comments:first"
+
+
+def _dialect_insert(model):
+    """INSERT with ON CONFLICT clauses (on_conflict_do_nothing/do_update) for the database in use"""
+    if db.engine.dialect.name == 'postgresql':
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def _chunks(items, size=LISTING_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
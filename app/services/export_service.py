@@ -0,0 +1,183 @@
+import csv
+import io
+import json
+from datetime import date, time, datetime, timezone
+from sqlalchemy import select
+from app import db
+from app.models.models import Event, EventParticipant, User
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_YIELD_PER = 1000
+# Rows serialized into one chunk of the streamed response
+EXPORT_CHUNK_ROWS = 500
+
+EVENT_EXPORT_COLUMNS = [
+    Event.id, Event.title, Event.date, Event.time, Event.category, Event.capacity,
+    Event.participants_count, Event.location_name, Event.location,
+    User.username.label('creator'), Event.description,
+]
+
+PARTICIPANT_EXPORT_COLUMNS = [
+    EventParticipant.user_id, User.username, EventParticipant.joined_at,
+]
+
+ICS_PRODID = '-//Mini Orbit//Events//EN'
+
+# Spreadsheets run a cell starting with one of these as a formula (CSV injection)
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class ExportService:
+    """
+    Streaming exports. Every method returns a generator of text chunks: rows
+    come off a server-side cursor (yield_per) and are serialized a chunk at a
+    time, so memory stays flat however many rows there are and the first
+    bytes go out before the query has finished.
+    """
+    @staticmethod
+    def events(kind='all', fmt='csv'):
+        """All events, or only 'upcoming' / 'past' ones, ordered by (date, id)"""
+        query = select(*EVENT_EXPORT_COLUMNS).join(User, User.id == Event.user_id)
+        if kind == 'upcoming':
+            query = query.where(Event.date >= date.today())
+        elif kind == 'past':
+            query = query.where(Event.date < date.today())
+        elif kind != 'all':
+            raise ValueError(f"Unknown export kind: {kind}")
+        return _serialize(query.order_by(Event.date, Event.id), fmt)
+
+    @staticmethod
+    def participants(event_id, fmt='csv'):
+        """An event's attendee list in join order"""
+        query = (
+            select(*PARTICIPANT_EXPORT_COLUMNS)
+            .join(User, User.id == EventParticipant.user_id)
+            .where(EventParticipant.event_id == event_id)
+            .order_by(EventParticipant.joined_at, EventParticipant.user_id)
+        )
+        return _serialize(query, fmt)
+
+    @staticmethod
+    def calendar(user_id):
+        """iCalendar (RFC 5545) feed of the events a user has joined"""
+        query = (
+            select(Event.id, Event.title, Event.date, Event.time, Event.description,
+                   Event.location_name, Event.location, Event.category)
+            .join(EventParticipant, EventParticipant.event_id == Event.id)
+            .where(EventParticipant.user_id == user_id)
+            .order_by(Event.date, Event.id)
+        )
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+        yield _ics_lines(['BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{ICS_PRODID}', 'CALSCALE:GREGORIAN'])
+        for rows in _stream(query):
+            lines = []
+            for row in rows:
+                lines += _vevent(row, stamp)
+            yield _ics_lines(lines)
+        yield _ics_lines(['END:VCALENDAR'])
+
+
+def _stream(query):
+    """Yields lists of up to EXPORT_CHUNK_ROWS rows from a server-side cursor"""
+    result = db.session.execute(query.execution_options(yield_per=EXPORT_YIELD_PER))
+    try:
+        while True:
+            rows = result.fetchmany(EXPORT_CHUNK_ROWS)
+            if not rows:
+                break
+            yield rows
+    finally:
+        result.close()
+
+
+def _serialize(query, fmt):
+    if fmt == 'csv':
+        return _csv_chunks(query)
+    if fmt == 'jsonl':
+        return _jsonl_chunks(query)
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+def _csv_chunks(query):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([c.name for c in query.selected_columns])
+    for rows in _stream(query):
+        writer.writerows([_csv_cell(v) for v in row] for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _jsonl_chunks(query):
+    names = [c.name for c in query.selected_columns]
+    for rows in _stream(query):
+        yield ''.join(
+            json.dumps(dict(zip(names, (_text(v) for v in row))), ensure_ascii=False) + '\n'
+            for row in rows
+        )
+
+
+def _text(value):
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+def _csv_cell(value):
+    """Quotes user text that a spreadsheet would otherwise evaluate as a formula"""
+    value = _text(value)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _vevent(row, stamp):
+    if row.time:
+        start = f"DTSTART:{datetime.combine(row.date, row.time).strftime('%Y%m%dT%H%M%S')}"
+    else:
+        start = f"DTSTART;VALUE=DATE:{row.date.strftime('%Y%m%d')}"
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:event-{row.id}@orbit-mini',
+        f'DTSTAMP:{stamp}',
+        start,
+        f'SUMMARY:{_ics_escape(row.title)}',
+    ]
+    location = row.location_name or row.location
+    if location:
+        lines.append(f'LOCATION:{_ics_escape(location)}')
+    if row.description:
+        lines.append(f'DESCRIPTION:{_ics_escape(row.description)}')
+    if row.category:
+        lines.append(f'CATEGORIES:{_ics_escape(row.category)}')
+    lines.append('END:VEVENT')
+    return lines
+
+
+def _ics_escape(value):
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _ics_lines(lines):
+    return ''.join(_ics_fold(line) + '\r\n' for line in lines)
+
+
+def _ics_fold(line, limit=75):
+    """Folds a content line at 75 octets (continuations start with a space), never splitting a UTF-8 character"""
+    if len(line.encode('utf-8')) <= limit:
+        return line
+    parts, current, size = [], '', 0
+    for char in line:
+        width = len(char.encode('utf-8'))
+        if size + width > limit:
+            parts.append(current)
+            current, size = ' ', 1
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n'.join(parts)
@@ -0,0 +1,94 @@
+import threading
+from flask import current_app
+from markupsafe import Markup, escape
+from app.services.cache_service import TTLLRUCache
+from app.services.metrics import metrics
+
+
+def _slot_marker(name):
+    # An HTML comment can't come out of escaped user content, so it can't be forged by it
+    return f'<!--slot:{name}-->'
+
+
+class FragmentCache:
+    """
+    Caches the rendered markup of an event card or of the detail modal body,
+    keyed by template, event id and the event's version stamp (bumped by every
+    join, leave and comment). A version's markup never changes, so entries
+    need no invalidation; FRAGMENT_CACHE_TTL only lets cold ones go.
+
+    Fragment templates get `event` plus the keyword arguments of the call and
+    must not depend on the viewer. What does (join/leave buttons, forms, owner
+    tools) is rendered by the caller and passed as `slots`; each slot is left
+    as a marker in the cached markup and spliced in on every render, so one
+    entry serves every user. Used from templates as event_fragment(...).
+    """
+    def __init__(self):
+        self.enabled = False
+        self.store = TTLLRUCache()
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        self.reset_stats()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('FRAGMENT_CACHE_ENABLED', True)
+        self.store = TTLLRUCache(
+            maxsize=app.config.get('FRAGMENT_CACHE_MAX_ENTRIES', 4096),
+            ttl=app.config.get('FRAGMENT_CACHE_TTL', 600)
+        )
+        self.reset_stats()
+        app.jinja_env.globals['event_fragment'] = self.render
+        app.extensions['fragment_cache'] = self
+
+    def render(self, template_name, event, slots=None, **context):
+        """
+        `template_name` rendered for `event`, with `slots` ({name: markup})
+        filled in. `context` is only used on a miss, so it must follow from the
+        event's version too (e.g. the event's first page of comments).
+        """
+        slots = slots or {}
+        template = current_app.jinja_env.get_template(template_name)
+        key = f"{template_name}:{event.id}:{event.version}"
+
+        html = None
+        if self.enabled:
+            entry = self.store.get(key)
+            # With template auto-reload an edited file is a new Template object
+            if entry is not None and entry[0] is template:
+                html = entry[1]
+        if html is None:
+            self._count('misses')
+            metrics.cache_lookup('fragments', 'miss')
+            placeholders = {name: Markup(_slot_marker(name)) for name in slots}
+            html = template.render(event=event, **context, **placeholders)
+            if self.enabled:
+                self.store.set(key, (template, html))
+        else:
+            self._count('hits')
+            metrics.cache_lookup('fragments', 'hit')
+
+        for name, markup in slots.items():
+            html = html.replace(_slot_marker(name), str(escape(markup)), 1)
+        return Markup(html)
+
+    def clear(self):
+        self.store.clear()
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {'hits': 0, 'misses': 0}
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['entries'] = len(self.store)
+        return stats
+
+
+fragment_cache = FragmentCache()
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import time
+from flask import request, session
+
+# Fingerprinted static URLs never change content, so browsers may keep them for a year
+STATIC_MAX_AGE = 31536000
+
+# Pages holding one-shot form tokens, and live update streams, must never be stored
+NO_STORE_ENDPOINTS = {'auth.login', 'auth.register', 'events.add', 'events.live', 'events.updates'}
+
+# CSRF tokens are time-limited; never revalidate a page older than this
+CSRF_BUCKET_SECONDS = 1800
+
+_fingerprints = {}
+
+
+def static_fingerprint(static_folder, filename):
+    """Short content hash of a static file, recomputed only when its mtime changes"""
+    path = os.path.join(static_folder, filename)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    key = (path, mtime)
+    if key not in _fingerprints:
+        with open(path, 'rb') as f:
+            _fingerprints[key] = hashlib.md5(f.read()).hexdigest()[:12]
+    return _fingerprints[key]
+
+
+def templates_fingerprint(template_folder):
+    """Hash of template mtimes, so a deploy with new markup invalidates old ETags"""
+    digest = hashlib.md5()
+    for root, _, files in sorted(os.walk(template_folder)):
+        for name in sorted(files):
+            digest.update(f"{name}:{os.stat(os.path.join(root, name)).st_mtime_ns}".encode())
+    return digest.hexdigest()[:12]
+
+
+def event_etag(app, event_id, event_version, *parts):
+    """
+    Weak validator for a rendered event page: the event's id and version
+    stamp plus everything else the markup depends on (viewer, session CSRF
+    token and its age bucket, template build, and any extra `parts`).
+    """
+    raw = "|".join(str(p) for p in (
+        event_id,
+        event_version,
+        session.get('user_id') or 0,
+        session.get('csrf_token', ''),
+        int(time.time() // CSRF_BUCKET_SECONDS),
+        app.config['TEMPLATES_FINGERPRINT'],
+        *parts
+    ))
+    return hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+def is_revalidatable():
+    """Pending flash messages are rendered once, so such responses can't be reused"""
+    return request.method == 'GET' and '_flashes' not in session
+
+
+def init_http_cache(app):
+    app.config['TEMPLATES_FINGERPRINT'] = templates_fingerprint(os.path.join(app.root_path, app.template_folder))
+
+    @app.url_defaults
+    def add_static_fingerprint(endpoint, values):
+        if endpoint == 'static' and 'filename' in values and 'v' not in values:
+            fingerprint = static_fingerprint(app.static_folder, values['filename'])
+            if fingerprint:
+                values['v'] = fingerprint
+
+    @app.after_request
+    def apply_cache_policy(response):
+        if request.endpoint == 'static':
+            if request.args.get('v'):
+                response.cache_control.public = True
+                response.cache_control.max_age = STATIC_MAX_AGE
+                response.cache_control.immutable = True
+                response.cache_control.no_cache = None
+            return response
+
+        if request.endpoint in NO_STORE_ENDPOINTS or request.method != 'GET':
+            response.headers['Cache-Control'] = 'no-store'
+            return response
+
+        # Pages depend on the session (user, flashes, CSRF token): browsers may keep
+        # them privately but must revalidate, which ETag-aware views answer with 304
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.vary.add('Cookie')
+        return response
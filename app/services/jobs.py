@@ -0,0 +1,236 @@
+import json
+import os
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+from sqlalchemy import and_, delete, event, func, insert, or_, select, update
+from app import db
+from app.models.models import Job
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _last_line(error):
+    # The exception line of a stored traceback
+    lines = (error or '').strip().splitlines()
+    return lines[-1] if lines else None
+
+
+class JobQueue:
+    """
+    Background jobs kept in the jobs table, so they survive restarts, every
+    worker process can run them and their state can be inspected
+    (/_stats/jobs, python worker.py status).
+
+    Functions register with @jobs.task(name) and are queued with
+    jobs.enqueue(name, **kwargs) inside the caller's transaction: the job
+    exists if and only if the caller's write committed. A runner claims a due
+    job by flipping it to 'running' with a lease of JOBS_VISIBILITY_TIMEOUT
+    seconds; a job whose runner died is claimed again once the lease is up.
+    A job that raises is retried with exponential backoff until it has used
+    max_attempts, then left 'failed' with its traceback. Delivery is
+    at-least-once, so tasks must be safe to run twice.
+
+    JOBS_RUNNER = 'thread' runs a daemon thread in each app process (started
+    by its first request); 'external' leaves the jobs to python worker.py.
+    """
+    def __init__(self):
+        self.tasks = {}
+        self.runner = 'thread'
+        self.poll_interval = 2.0
+        self.visibility_timeout = 300
+        self.retry_backoff = 5
+        self.default_max_attempts = 5
+        self.keep_done = 86400
+        self._app = None
+        self._thread = None
+        self._thread_pid = None
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.runner = app.config.get('JOBS_RUNNER', 'thread')
+        self.poll_interval = app.config.get('JOBS_POLL_INTERVAL', 2.0)
+        self.visibility_timeout = app.config.get('JOBS_VISIBILITY_TIMEOUT', 300)
+        self.retry_backoff = app.config.get('JOBS_RETRY_BACKOFF', 5)
+        self.default_max_attempts = app.config.get('JOBS_MAX_ATTEMPTS', 5)
+        self.keep_done = app.config.get('JOBS_KEEP_DONE', 86400)
+        self._app = app
+        app.extensions['jobs'] = self
+        if self.runner == 'thread':
+            # Not at startup: a thread started before gunicorn forks its workers doesn't survive the fork
+            app.before_request(self._ensure_thread)
+        elif self.runner != 'external':
+            raise ValueError(f"Unsupported JOBS_RUNNER: {self.runner}")
+
+    def task(self, name, max_attempts=None):
+        """Decorator registering a job function under `name`; it is called with the job's keyword arguments"""
+        def decorator(func):
+            self.tasks[name] = (func, max_attempts)
+            return func
+        return decorator
+
+    def enqueue(self, name, delay=0, **kwargs):
+        """Adds a job to the current transaction; it becomes visible to runners when that commits"""
+        return self.enqueue_many(name, [kwargs], delay=delay)
+
+    def enqueue_many(self, name, payloads, delay=0):
+        """One multi-row INSERT of jobs `name`, one per payload dict"""
+        if name not in self.tasks:
+            raise KeyError(f"Unknown job: {name}")
+        if not payloads:
+            return
+        max_attempts = self.tasks[name][1] or self.default_max_attempts
+        run_after = _utcnow() + timedelta(seconds=delay)
+        db.session.execute(insert(Job), [
+            {'name': name, 'payload': json.dumps(payload), 'max_attempts': max_attempts, 'run_after': run_after}
+            for payload in payloads
+        ])
+        # Wake this process's runner as soon as the jobs are committed
+        event.listen(db.session(), 'after_commit', lambda session: self._wake.set(), once=True)
+
+    def run_next(self):
+        """Claims and runs one due job. Returns its id, or None if nothing was due."""
+        claimed = self._claim()
+        if claimed is None:
+            return None
+        job_id, name, payload, attempts, max_attempts = claimed
+
+        try:
+            if attempts > max_attempts:
+                raise RuntimeError(f"Gave up after {max_attempts} attempts (runner lease expired)")
+            if name not in self.tasks:
+                raise KeyError(f"Unknown job: {name}")
+            self.tasks[name][0](**json.loads(payload))
+        except Exception:
+            db.session.rollback()
+            error = traceback.format_exc()
+            retry = attempts < max_attempts and name in self.tasks
+            current_app.logger.warning(f"Job {job_id} ({name}) attempt {attempts}/{max_attempts} failed"
+                                       f"{', will retry' if retry else ''}:\n{error}")
+            if retry:
+                backoff = min(self.retry_backoff * 2 ** (attempts - 1), 3600)
+                self._finish(job_id, status='queued', run_after=_utcnow() + timedelta(seconds=backoff),
+                             locked_until=None, last_error=error)
+            else:
+                self._finish(job_id, status='failed', finished_at=_utcnow(), last_error=error)
+        else:
+            self._finish(job_id, status='done', finished_at=_utcnow(), locked_until=None)
+        return job_id
+
+    def run_pending(self, limit=None):
+        """Runs due jobs until none is left (or `limit` have run). Returns how many ran."""
+        ran = 0
+        while limit is None or ran < limit:
+            if self.run_next() is None:
+                break
+            ran += 1
+        return ran
+
+    def work(self, stop=None):
+        """Runner loop: due jobs back to back, then a nap until woken or JOBS_POLL_INTERVAL passes"""
+        next_prune = 0
+        while stop is None or not stop.is_set():
+            self._wake.clear()
+            try:
+                with self._app.app_context():
+                    self.run_pending()
+                    if time.monotonic() >= next_prune:
+                        self.prune()
+                        next_prune = time.monotonic() + 600
+            except Exception:
+                # A lost database connection mustn't end the loop; the next round retries
+                self._app.logger.exception("Job runner error")
+            self._wake.wait(self.poll_interval)
+
+    def _ensure_thread(self):
+        if self._thread_pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread_pid != os.getpid():
+                self._thread = threading.Thread(target=self.work, name='job-runner', daemon=True)
+                self._thread.start()
+                self._thread_pid = os.getpid()
+
+    def _claim(self):
+        now = _utcnow()
+        due = or_(
+            and_(Job.status == 'queued', Job.run_after <= now),
+            and_(Job.status == 'running', Job.locked_until < now)
+        )
+        # Plain indexed read first: an idle poll must not take SQLite's write lock
+        job_id = db.session.execute(
+            select(Job.id).where(due).order_by(Job.run_after, Job.id).limit(1)
+        ).scalar()
+        if job_id is None:
+            db.session.rollback()
+            return None
+
+        # Re-checked in the UPDATE, so of two runners that picked the same job only one gets it
+        claimed = db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, due)
+            .values(status='running', attempts=Job.attempts + 1,
+                    locked_until=now + timedelta(seconds=self.visibility_timeout))
+            .returning(Job.id, Job.name, Job.payload, Job.attempts, Job.max_attempts)
+            .execution_options(synchronize_session=False)
+        ).first()
+        db.session.commit()
+        return tuple(claimed) if claimed else self._claim()
+
+    def _finish(self, job_id, **values):
+        db.session.execute(
+            update(Job).where(Job.id == job_id).values(**values).execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+    def retry(self, job_id=None):
+        """Queues failed jobs (or one, by id) again with a fresh set of attempts. Returns how many."""
+        condition = Job.status == 'failed' if job_id is None else Job.id == job_id
+        requeued = db.session.execute(
+            update(Job).where(condition)
+            .values(status='queued', attempts=0, run_after=_utcnow(), locked_until=None, finished_at=None)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        return requeued
+
+    def prune(self):
+        """Deletes finished jobs older than JOBS_KEEP_DONE seconds (failed ones stay until retried)"""
+        removed = db.session.execute(
+            delete(Job).where(Job.status == 'done', Job.finished_at < _utcnow() - timedelta(seconds=self.keep_done))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        return removed
+
+    def stats(self, failures=10):
+        """Job counts per status, the oldest due job's wait, and the latest failures"""
+        counts = dict(db.session.execute(select(Job.status, func.count()).group_by(Job.status)).all())
+        oldest_due = db.session.execute(
+            select(func.min(Job.run_after)).where(Job.status == 'queued', Job.run_after <= _utcnow())
+        ).scalar()
+        failed = db.session.execute(
+            select(Job.id, Job.name, Job.payload, Job.attempts, Job.finished_at, Job.last_error)
+            .where(Job.status == 'failed').order_by(Job.id.desc()).limit(failures)
+        ).all()
+        return {
+            'counts': {status: counts.get(status, 0) for status in ('queued', 'running', 'done', 'failed')},
+            'oldest_due_seconds': round((_utcnow() - oldest_due).total_seconds(), 1) if oldest_due else 0.0,
+            'failed': [
+                {
+                    'id': row.id, 'name': row.name, 'payload': json.loads(row.payload),
+                    'attempts': row.attempts, 'finished_at': row.finished_at.isoformat() if row.finished_at else None,
+                    'error': _last_line(row.last_error),
+                }
+                for row in failed
+            ],
+            'runner': self.runner,
+        }
+
+
+jobs = JobQueue()
@@ -0,0 +1,177 @@
+import json
+import socket
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+def sse_message(seq, message):
+    """One Server-Sent Events frame; `seq` becomes Last-Event-ID on reconnect"""
+    return f"id: {seq}\ndata: {json.dumps(message, separators=(',', ':'), default=str)}\n\n"
+
+
+def parse_broker_address(address):
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+class Channel:
+    """Numbered deltas for one event; the last `history` are kept for reconnects and long-polls"""
+    def __init__(self, history):
+        self.seq = 0
+        self.history = deque(maxlen=history)
+
+    def append(self, message):
+        self.seq += 1
+        self.history.append((self.seq, message))
+        return self.seq
+
+    def since(self, after):
+        """
+        Deltas newer than `after`. A client that fell further behind than the
+        history reaches gets a single 'resync' delta and should refetch.
+        A cursor ahead of this channel (the broker restarted) starts over.
+        """
+        after = min(after, self.seq)
+        if self.history and after < self.history[0][0] - 1:
+            return [(self.seq, {'type': 'resync'})]
+        return [(seq, message) for seq, message in self.history if seq > after]
+
+
+class MemoryBroker:
+    """
+    In-process pub/sub: a publish wakes the threads waiting on that event's
+    channel. Only reaches subscribers served by the same process.
+    """
+    def __init__(self, history=50, max_channels=10000):
+        self.history = history
+        self.max_channels = max_channels
+        self._channels = OrderedDict()
+        self._lock = threading.Lock()
+
+    def publish(self, channel, message):
+        with self._lock:
+            entry = self._channel(channel)
+            entry.append(message)
+            entry.changed.notify_all()
+
+    def wait(self, channel, after, timeout):
+        """
+        Deltas on `channel` newer than `after` (None: from now on), waiting up
+        to `timeout` seconds for one. Returns (messages, cursor to pass next).
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            entry = self._channel(channel)
+            if after is None:
+                after = entry.seq
+            while True:
+                messages = entry.since(after)
+                remaining = deadline - time.monotonic()
+                if messages or remaining <= 0:
+                    return messages, (messages[-1][0] if messages else min(after, entry.seq))
+                entry.changed.wait(remaining)
+                entry = self._channel(channel)
+
+    def _channel(self, channel):
+        # Callers hold self._lock
+        entry = self._channels.get(channel)
+        if entry is None:
+            entry = self._channels[channel] = Channel(self.history)
+            entry.changed = threading.Condition(self._lock)
+            while len(self._channels) > self.max_channels:
+                self._channels.popitem(last=False)
+        self._channels.move_to_end(channel)
+        return entry
+
+
+class UdpPublisher:
+    """
+    Sends deltas as fire-and-forget datagrams to live_server.py, which fans
+    them out to subscribers of every worker. Publishing never blocks a
+    request; a delta lost on the way only means a viewer's modal catches up
+    on its next reopen.
+    """
+    def __init__(self, address):
+        self.address = parse_broker_address(address)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def publish(self, channel, message):
+        payload = json.dumps({'channel': channel, 'message': message}, separators=(',', ':'), default=str)
+        try:
+            self._socket.sendto(payload.encode(), self.address)
+        except OSError:
+            pass
+
+
+class LiveUpdates:
+    """
+    Broadcasts small deltas about an event (participant count, capacity
+    reached, new comments, deletion) to everyone viewing its detail modal.
+
+    LIVE_BROKER='memory' keeps subscribers in this process and serves them
+    from /events/<id>/live; that holds a worker thread per viewer, so it
+    suits development and threaded workers. Under gunicorn's sync workers
+    (gunicorn.conf.py sets sync_workers) one viewer would pin a whole worker,
+    so the app then offers no live updates at all. LIVE_BROKER='udp'
+    publishes to live_server.py, an asyncio process that holds thousands of
+    idle connections without tying up the app's sync workers.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.broker_type = 'memory'
+        self.broker = MemoryBroker()
+        self.stream_url = ''
+        self.heartbeat = 15
+        self.poll_timeout = 25
+        self.sync_workers = False
+
+    def init_app(self, app):
+        self.enabled = app.config.get('LIVE_UPDATES_ENABLED', True)
+        self.broker_type = app.config.get('LIVE_BROKER', 'memory')
+        if self.broker_type == 'memory':
+            self.broker = MemoryBroker(history=app.config.get('LIVE_HISTORY', 50))
+        elif self.broker_type == 'udp':
+            self.broker = UdpPublisher(app.config.get('LIVE_BROKER_ADDRESS', '127.0.0.1:8765'))
+        else:
+            raise ValueError(f"Unknown LIVE_BROKER {self.broker_type!r}; expected 'memory' or 'udp'")
+        self.stream_url = (app.config.get('LIVE_STREAM_URL') or '').rstrip('/')
+        self.heartbeat = app.config.get('LIVE_HEARTBEAT', 15)
+        self.poll_timeout = app.config.get('LIVE_POLL_TIMEOUT', 25)
+        app.extensions['live_updates'] = self
+
+        @app.context_processor
+        def live_settings():
+            return {'live_updates_enabled': self.available, 'live_stream_url': self.stream_url}
+
+    @property
+    def serves_streams(self):
+        """True when this app answers /events/<id>/live itself"""
+        return self.enabled and self.broker_type == 'memory' and not self.sync_workers
+
+    @property
+    def available(self):
+        """True when modals have somewhere to subscribe: this app or live_server.py"""
+        return self.serves_streams or (self.enabled and self.broker_type == 'udp')
+
+    def publish(self, event_id, message):
+        if self.enabled:
+            self.broker.publish(event_id, message)
+
+    def stream(self, event_id, after=None):
+        """SSE frames for one subscriber, with a comment line as heartbeat while idle"""
+        yield "retry: 3000\n\n"
+        while True:
+            messages, after = self.broker.wait(event_id, after, self.heartbeat)
+            if not messages:
+                yield ": keep-alive\n\n"
+            for seq, message in messages:
+                yield sse_message(seq, message)
+
+    def poll(self, event_id, after=None):
+        """Long-poll: (deltas newer than `after`, next cursor), waiting up to LIVE_POLL_TIMEOUT seconds"""
+        return self.broker.wait(event_id, after, self.poll_timeout)
+
+
+live_updates = LiveUpdates()
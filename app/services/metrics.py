@@ -0,0 +1,174 @@
+import hmac
+import ipaddress
+import os
+import time
+from flask import Response, abort, g, request
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+                               generate_latest, multiprocess)
+
+DB_QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 20, 35, 50, 100)
+DB_SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SESSION_SECONDS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+
+class _TimedSessionInterface:
+    """Wraps the app's session interface to time loading and saving the session"""
+    def __init__(self, inner, histogram, backend):
+        self.inner = inner
+        self.histogram = histogram
+        self.backend = backend
+
+    def open_session(self, app, request):
+        with self.histogram.labels(self.backend, 'open').time():
+            return self.inner.open_session(app, request)
+
+    def save_session(self, app, session, response):
+        with self.histogram.labels(self.backend, 'save').time():
+            return self.inner.save_session(app, session, response)
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+
+class Metrics:
+    """
+    Prometheus metrics, served at METRICS_PATH: request latency and in-flight
+    requests per blueprint and endpoint, SQL queries and DB time per request
+    (from the query profiler), session store latency, cache lookups and
+    EventService outcomes and rate-limit refusals.
+
+    Each gunicorn worker keeps its own values. With PROMETHEUS_MULTIPROC_DIR
+    set in the environment before the app starts (see gunicorn.conf.py),
+    prometheus_client keeps them in memory-mapped files in that directory,
+    and whichever worker serves a scrape adds up every worker's samples.
+
+    Only scrapes from METRICS_ALLOWED_IPS or carrying METRICS_TOKEN as a
+    bearer token are answered; to everyone else the path doesn't exist.
+    The /_stats/* endpoints use the same check (scrape_allowed).
+    """
+    def __init__(self):
+        self.enabled = False
+        self.path = '/metrics'
+        self.allowed_networks = []
+        self.token = None
+        self._created = False
+
+    def init_app(self, app):
+        self.enabled = app.config.get('METRICS_ENABLED', True)
+        self.path = app.config.get('METRICS_PATH', '/metrics')
+        self.allowed_networks = [ipaddress.ip_network(ip, strict=False)
+                                 for ip in app.config.get('METRICS_ALLOWED_IPS', [])]
+        self.token = app.config.get('METRICS_TOKEN')
+        app.extensions['metrics'] = self
+        if not self.enabled:
+            return
+        self._create()
+
+        app.add_url_rule(self.path, 'metrics', self.export)
+        app.session_interface = _TimedSessionInterface(
+            app.session_interface, self.session_seconds, app.config.get('SESSION_TYPE', 'cookie')
+        )
+
+        @app.before_request
+        def start_request_metrics():
+            if request.endpoint == 'metrics':
+                return
+            g.metrics_labels = (request.blueprint or '', request.endpoint or 'unmatched')
+            g.metrics_started = time.perf_counter()
+            self.in_flight.labels(*g.metrics_labels).inc()
+
+        @app.after_request
+        def observe_request(response):
+            labels = g.get('metrics_labels')
+            if labels is None:
+                return response
+            self.request_seconds.labels(*labels, request.method, str(response.status_code)).observe(
+                time.perf_counter() - g.metrics_started
+            )
+            # Registered after the query profiler, so this runs before it pops the request's profile
+            profile = g.get('query_profile')
+            if profile is not None:
+                self.db_queries.labels(*labels).observe(profile.count)
+                self.db_seconds.labels(*labels).observe(profile.seconds)
+            return response
+
+        @app.teardown_request
+        def finish_request_metrics(exc):
+            labels = g.pop('metrics_labels', None)
+            if labels is not None:
+                self.in_flight.labels(*labels).dec()
+
+    def _create(self):
+        # Metrics register with the process-wide registry, so only the first app creates them
+        if self._created:
+            return
+        labels = ('blueprint', 'endpoint')
+        self.request_seconds = Histogram(
+            'orbit_http_request_duration_seconds', 'Time to produce a response (streamed bodies excluded)',
+            labels + ('method', 'status')
+        )
+        self.in_flight = Gauge(
+            'orbit_http_requests_in_flight', 'Requests being handled', labels, multiprocess_mode='livesum'
+        )
+        self.db_queries = Histogram(
+            'orbit_db_queries_per_request', 'SQL statements run per request', labels, buckets=DB_QUERY_BUCKETS
+        )
+        self.db_seconds = Histogram(
+            'orbit_db_seconds_per_request', 'Time spent in SQL statements per request', labels,
+            buckets=DB_SECONDS_BUCKETS
+        )
+        self.session_seconds = Histogram(
+            'orbit_session_store_seconds', 'Time to load (open) or store (save) the session',
+            ('backend', 'operation'), buckets=SESSION_SECONDS_BUCKETS
+        )
+        self.cache_lookups = Counter(
+            'orbit_cache_lookups_total', 'Application and fragment cache lookups by result', ('cache', 'result')
+        )
+        self.event_operations = Counter(
+            'orbit_event_operations_total', 'EventService writes by outcome', ('operation', 'outcome')
+        )
+        self.rate_limited_requests = Counter(
+            'orbit_rate_limited_total', 'Writes refused by the rate limiter, by action and exhausted bucket',
+            ('action', 'bucket')
+        )
+        self._created = True
+
+    def cache_lookup(self, cache, result, amount=1):
+        """Counts lookups in `cache` ('app' or 'fragments') with `result` (e.g. 'local_hit', 'miss')"""
+        if self.enabled:
+            self.cache_lookups.labels(cache, result).inc(amount)
+
+    def event_operation(self, operation, outcome):
+        """Counts an EventService write, e.g. ('join', 'full') or ('create', 'duplicate')"""
+        if self.enabled:
+            self.event_operations.labels(operation, outcome).inc()
+
+    def rate_limited(self, action, bucket):
+        """Counts a write refused by the rate limiter because the 'user' or 'ip' bucket was empty"""
+        if self.enabled:
+            self.rate_limited_requests.labels(action, bucket).inc()
+
+    def export(self):
+        if not self.scrape_allowed():
+            abort(404)
+        if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        return Response(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+    def scrape_allowed(self):
+        """Whether the request comes from METRICS_ALLOWED_IPS or carries the METRICS_TOKEN bearer"""
+        if self.token:
+            scheme, _, credentials = request.headers.get('Authorization', '').partition(' ')
+            if scheme.lower() == 'bearer' and hmac.compare_digest(credentials.encode(), self.token.encode()):
+                return True
+        try:
+            address = ipaddress.ip_address(request.remote_addr or '')
+        except ValueError:
+            return False
+        return any(address in network for network in self.allowed_networks)
+
+
+metrics = Metrics()
@@ -0,0 +1,113 @@
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+class HashingBusyError(Exception):
+    """Raised when the hashing queue is full and a request can't get a slot in time"""
+
+
+def _timed(func, *args):
+    # Runs in the pool process; the start time lets the caller measure queue wait
+    return time.time(), func(*args)
+
+
+class PasswordHasher:
+    """
+    Runs password hashing/verification in a bounded process pool so a burst of
+    logins can't monopolise the CPU that request threads need.
+    At most PASSWORD_HASH_MAX_PENDING operations are queued or running per
+    worker process; further callers wait up to PASSWORD_HASH_QUEUE_TIMEOUT
+    seconds for a slot and then get HashingBusyError.
+    """
+    def __init__(self):
+        self.method = 'scrypt:32768:8:1'
+        self.prefix = self.method
+        self.use_pool = False
+        self.workers = 2
+        self.queue_timeout = 2.0
+        self._slots = threading.BoundedSemaphore(16)
+        self._pool = None
+        self._pool_pid = None
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.reset_stats()
+
+    def init_app(self, app):
+        self.method = app.config.get('PASSWORD_HASH_METHOD', self.method)
+        # The method as werkzeug writes it: short names get their defaults ('scrypt' -> 'scrypt:32768:8:1')
+        self.prefix = generate_password_hash('x', self.method).split('$', 1)[0]
+        self.use_pool = app.config.get('PASSWORD_HASH_POOL', True)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS') or min(4, os.cpu_count() or 1)
+        self.queue_timeout = app.config.get('PASSWORD_HASH_QUEUE_TIMEOUT', 2.0)
+        self._slots = threading.BoundedSemaphore(app.config.get('PASSWORD_HASH_MAX_PENDING', 16))
+        app.extensions['password_hasher'] = self
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, stored_hash, password):
+        return self._run(check_password_hash, stored_hash, password)
+
+    def needs_rehash(self, stored_hash):
+        """True if the stored hash was made with a different method or cost than configured"""
+        return stored_hash.split('$', 1)[0] != self.prefix
+
+    def _run(self, func, *args):
+        if not self.use_pool:
+            return func(*args)
+
+        submitted = time.time()
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            self._count('rejected')
+            raise HashingBusyError("Password hashing queue is full")
+        try:
+            started, result = self._get_pool().submit(_timed, func, *args).result()
+        finally:
+            self._slots.release()
+
+        finished = time.time()
+        with self._lock:
+            self._stats['completed'] += 1
+            self._stats['queue_seconds_total'] += max(0.0, started - submitted)
+            self._stats['queue_seconds_max'] = max(self._stats['queue_seconds_max'], started - submitted)
+            self._stats['run_seconds_total'] += finished - started
+        return result
+
+    def _get_pool(self):
+        # Pools don't survive fork (e.g. gunicorn preload), so each process builds its own
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None and self._pool_pid == os.getpid():
+                self._pool.shutdown()
+            self._pool = None
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {
+                'completed': 0, 'rejected': 0,
+                'queue_seconds_total': 0.0, 'queue_seconds_max': 0.0, 'run_seconds_total': 0.0
+            }
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        completed = stats['completed']
+        stats['queue_seconds_avg'] = stats['queue_seconds_total'] / completed if completed else 0.0
+        stats['run_seconds_avg'] = stats['run_seconds_total'] / completed if completed else 0.0
+        return stats
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,179 @@
+import json
+import re
+import threading
+import time
+from collections import Counter, deque
+from flask import g, request, has_request_context
+from sqlalchemy import event
+
+# Literals and bind markers collapse to '?' so "same query, different id" counts as a repeat
+_FINGERPRINT_RULES = [
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'%\(\w+\)s|:\w+|\$\d+'), '?'),
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(?+)'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised (when QUERY_BUDGET_RAISE is set) if a request runs more queries than its budget"""
+
+
+def fingerprint(statement):
+    for pattern, replacement in _FINGERPRINT_RULES:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+class RequestProfile:
+    """Queries run while handling one request"""
+    def __init__(self, slowest_kept):
+        self.count = 0
+        self.seconds = 0.0
+        self.slowest = []
+        self.slowest_kept = slowest_kept
+        self.fingerprints = Counter()
+
+    def record(self, statement, seconds):
+        self.count += 1
+        self.seconds += seconds
+        self.fingerprints[fingerprint(statement)] += 1
+        if self.slowest_kept:
+            self.slowest.append((seconds, statement))
+            if len(self.slowest) > self.slowest_kept:
+                self.slowest.sort(key=lambda item: item[0], reverse=True)
+                self.slowest.pop()
+
+    def repeated(self):
+        """Fingerprints executed more than once, most frequent first (likely N+1s)"""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n > 1]
+
+    def to_dict(self):
+        return {
+            'queries': self.count,
+            'db_ms': round(self.seconds * 1000, 2),
+            'slowest': [
+                {'ms': round(seconds * 1000, 2), 'sql': statement}
+                for seconds, statement in sorted(self.slowest, key=lambda item: item[0], reverse=True)
+            ],
+            'repeated': [{'count': n, 'sql': fp} for fp, n in self.repeated()]
+        }
+
+
+class QueryProfiler:
+    """
+    Counts and times every SQL statement per request through engine events.
+    Each response gets a Server-Timing header; requests can also be logged as
+    one JSON line, kept for the /_stats/queries view and checked against a
+    query budget (QUERY_BUDGET, with per-endpoint QUERY_BUDGET_ENDPOINTS).
+    """
+    def __init__(self):
+        self.enabled = False
+        self.budget = None
+        self.endpoint_budgets = {}
+        self.raise_on_budget = False
+        self.slow_seconds = 0.1
+        self.slowest_kept = 5
+        self.log_requests = False
+        self._recent = deque(maxlen=50)
+        self._lock = threading.Lock()
+        self._engines = set()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('QUERY_PROFILER_ENABLED', True)
+        self.budget = app.config.get('QUERY_BUDGET')
+        self.endpoint_budgets = dict(app.config.get('QUERY_BUDGET_ENDPOINTS') or {})
+        self.raise_on_budget = app.config.get('QUERY_BUDGET_RAISE', False)
+        self.slow_seconds = app.config.get('QUERY_SLOW_MS', 100) / 1000
+        self.slowest_kept = app.config.get('QUERY_PROFILER_SLOWEST', 5)
+        self.log_requests = app.config.get('QUERY_PROFILER_LOG', False)
+        self._recent = deque(maxlen=app.config.get('QUERY_PROFILER_HISTORY', 50))
+        app.extensions['query_profiler'] = self
+        if not self.enabled:
+            return
+
+        from app import db
+        from app.services.db_routing import read_router
+        with app.app_context():
+            for engine in (db.engine, *read_router.replicas):
+                self._listen(engine)
+
+        @app.before_request
+        def start_profile():
+            g.query_profile = RequestProfile(self.slowest_kept)
+            g.request_started = time.perf_counter()
+
+        @app.after_request
+        def finish_profile(response):
+            profile = g.pop('query_profile', None)
+            if profile is None:
+                return response
+            total_ms = (time.perf_counter() - g.pop('request_started')) * 1000
+            response.headers.add(
+                'Server-Timing', f'db;dur={profile.seconds * 1000:.2f};desc="{profile.count} queries"'
+            )
+            response.headers.add('Server-Timing', f'app;dur={total_ms:.2f}')
+
+            entry = {
+                'method': request.method,
+                'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                'total_ms': round(total_ms, 2),
+                **profile.to_dict()
+            }
+            with self._lock:
+                self._recent.append(entry)
+            if self.log_requests:
+                app.logger.info("request_profile %s", json.dumps(entry))
+            self._check_budget(app, entry)
+            return response
+
+    def _listen(self, engine):
+        if engine in self._engines:
+            return
+        self._engines.add(engine)
+        event.listen(engine, 'before_cursor_execute', self._before_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_execute)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info['query_started'].pop()
+        if not has_request_context():
+            return
+        profile = g.get('query_profile')
+        if profile is not None:
+            profile.record(statement, seconds)
+        if seconds >= self.slow_seconds:
+            from flask import current_app
+            current_app.logger.warning(
+                "slow_query %s", json.dumps({'ms': round(seconds * 1000, 2), 'path': request.path, 'sql': statement})
+            )
+
+    def budget_for(self, endpoint):
+        return self.endpoint_budgets.get(endpoint, self.budget)
+
+    def _check_budget(self, app, entry):
+        budget = self.budget_for(entry['endpoint'])
+        if budget is None or entry['queries'] <= budget:
+            return
+        message = (
+            f"{entry['endpoint']} ran {entry['queries']} queries (budget {budget}) for {entry['method']} {entry['path']}"
+        )
+        if self.raise_on_budget:
+            raise QueryBudgetExceeded(message)
+        app.logger.warning("query_budget_exceeded %s", message)
+
+    def recent(self):
+        with self._lock:
+            return list(self._recent)
+
+    def clear(self):
+        with self._lock:
+            self._recent.clear()
+
+
+query_profiler = QueryProfiler()
@@ -0,0 +1,201 @@
+import itertools
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from flask import request, session
+from app.services.metrics import metrics
+
+
+class MemoryBucketStore:
+    """
+    Token buckets in a dict, per process: each key holds (tokens, last update).
+    A check is one dict lookup and a little arithmetic under a lock. At most
+    `max_keys` buckets are kept; the least recently used goes first, and a
+    bucket idle for that long would have refilled anyway.
+    """
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate):
+        """Takes a token from `key`'s bucket. Returns 0 if one was there, else seconds until one will be."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            self._buckets[key] = (tokens - 1 if allowed else tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return 0 if allowed else (1 - tokens) / rate
+
+    def refund(self, key, capacity):
+        """Gives back a token taken by take()"""
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated = self._buckets[key]
+                self._buckets[key] = (min(capacity, tokens + 1), updated)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class SqliteBucketStore:
+    """
+    Token buckets in a small SQLite file that every worker process on the host
+    opens, so the limits hold per host rather than per process. Taking a token
+    is one UPSERT on the primary key that refills, checks and decrements in the
+    same statement; a row comes back only when a token was taken.
+    """
+    CLEANUP_EVERY = 1000  # takes between deletes of buckets idle for max_idle seconds
+
+    def __init__(self, path, max_idle=3600):
+        self.path = path
+        self.max_idle = max_idle
+        self._local = threading.local()
+        self._takes = itertools.count(1)  # next() is atomic, unlike += across threads
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS rate_buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def _connection(self):
+        # sqlite3 connections can't be shared across threads or survive a fork
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # buckets are throwaway state
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def take(self, key, capacity, rate):
+        now = time.time()
+        conn = self._connection()
+        params = {'key': key, 'capacity': capacity, 'rate': rate, 'now': now}
+        refilled = "min(:capacity, tokens + (:now - updated) * :rate)"
+        taken = conn.execute(
+            f"INSERT INTO rate_buckets (key, tokens, updated) VALUES (:key, :capacity - 1, :now) "
+            f"ON CONFLICT(key) DO UPDATE SET tokens = {refilled} - 1, updated = :now "
+            f"WHERE {refilled} >= 1 RETURNING tokens",
+            params
+        ).fetchone()
+
+        if next(self._takes) % self.CLEANUP_EVERY == 0:
+            conn.execute("DELETE FROM rate_buckets WHERE updated < ?", (now - self.max_idle,))
+        if taken is not None:
+            return 0
+        row = conn.execute(f"SELECT {refilled} FROM rate_buckets WHERE key = :key", params).fetchone()
+        return (1 - row[0]) / rate if row else 0
+
+    def refund(self, key, capacity):
+        self._connection().execute(
+            "UPDATE rate_buckets SET tokens = min(:capacity, tokens + 1) WHERE key = :key",
+            {'key': key, 'capacity': capacity}
+        )
+
+    def clear(self):
+        self._connection().execute("DELETE FROM rate_buckets")
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM rate_buckets").fetchone()[0]
+
+
+class RateLimiter:
+    """
+    Token-bucket limits on writes, per user and per client IP. RATE_LIMITS maps
+    an action to (burst, per_minute): a caller can do `burst` in a row, then
+    `per_minute` a minute. The IP bucket is RATE_LIMIT_IP_MULTIPLIER times
+    larger, since users behind one NAT share it. Each check costs one bucket
+    update per key whatever the traffic, so it stays O(1) per request.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.limits = {}
+        self.ip_multiplier = 1
+        self.store = MemoryBucketStore()
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        self.reset_stats()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('RATE_LIMIT_ENABLED', True)
+        self.limits = dict(app.config.get('RATE_LIMITS', {}))
+        self.ip_multiplier = app.config.get('RATE_LIMIT_IP_MULTIPLIER', 5)
+        self.store = _make_store(app.config)
+        self.reset_stats()
+        app.extensions['rate_limiter'] = self
+
+    def hit(self, action, user_id=None, ip=None):
+        """
+        Counts one `action` by the current user (or `user_id`) and client IP.
+        Returns 0 if it may go ahead, else the seconds until it may.
+        """
+        if not self.enabled or action not in self.limits:
+            return 0
+        if user_id is None:
+            user_id = session.get('user_id')
+        if ip is None:
+            ip = request.remote_addr
+
+        burst, per_minute = self.limits[action]
+        user_key = f"user:{user_id}:{action}" if user_id is not None else None
+        wait = self.store.take(user_key, burst, per_minute / 60) if user_key else 0
+        bucket = 'user'
+        if not wait and ip:
+            wait = self.store.take(f"ip:{ip}:{action}", burst * self.ip_multiplier,
+                                   per_minute * self.ip_multiplier / 60)
+            bucket = 'ip'
+            if wait and user_key:
+                # Refused on the IP's account: the user's token goes back, the write never happened
+                self.store.refund(user_key, burst)
+        if wait:
+            self._count('limited')
+            metrics.rate_limited(action, bucket)
+        else:
+            self._count('allowed')
+        return wait
+
+    @staticmethod
+    def message(wait):
+        return f"You're doing that too often, please try again in {math.ceil(wait)} s"
+
+    @staticmethod
+    def retry_after(wait):
+        """Retry-After header value (whole seconds, at least 1)"""
+        return str(max(1, math.ceil(wait)))
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {'allowed': 0, 'limited': 0}
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+
+def _make_store(config):
+    store_type = config.get('RATE_LIMIT_STORE', 'memory')
+    if store_type == 'memory':
+        return MemoryBucketStore(config.get('RATE_LIMIT_MAX_KEYS', 100000))
+    if store_type == 'sqlite':
+        return SqliteBucketStore(config['RATE_LIMIT_SQLITE_PATH'])
+    raise ValueError(f"Unsupported RATE_LIMIT_STORE: {store_type}")
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,150 @@
+import re
+from sqlalchemy import Float, cast, column, func, inspect, literal_column, select, table, text
+from app import db
+from app.models.models import Event
+
+# Weight title matches above description matches when ranking
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+# Must match the indexed expression exactly or PostgreSQL won't use the GIN index
+PG_SEARCH_VECTOR = (
+    "to_tsvector('simple', coalesce(events.title, '') || ' ' || coalesce(events.description, ''))"
+)
+
+# Full-text index DDL per engine. Executed in order by migration m0009_search_index.
+SEARCH_DDL = {
+    'sqlite': [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+            title, description,
+            content='events', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+            INSERT INTO events_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events BEGIN
+            INSERT INTO events_fts(events_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS events_fts_update AFTER UPDATE OF title, description ON events BEGIN
+            INSERT INTO events_fts(events_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO events_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+    ],
+    'postgres': [
+        f"CREATE INDEX IF NOT EXISTS idx_events_search ON events USING GIN (({PG_SEARCH_VECTOR}))",
+    ],
+}
+
+# Re-indexes rows that existed before the FTS table was created
+SEARCH_REBUILD = {
+    'sqlite': "INSERT INTO events_fts(events_fts) VALUES ('rebuild')",
+    'postgres': None,
+}
+
+events_fts = table('events_fts', column('rowid'))
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# Backend detected per engine URL: 'sqlite', 'postgres' or None (LIKE fallback)
+_backends = {}
+
+
+class SearchService:
+    @staticmethod
+    def backend():
+        """
+        Returns the full-text backend for the current engine, or None when the
+        index isn't installed (e.g. SQLite built without FTS5), in which case
+        callers fall back to LIKE scans.
+        """
+        engine = db.engine
+        key = str(engine.url)
+        if key not in _backends:
+            if engine.dialect.name == 'sqlite':
+                if not inspect(engine).has_table('events_fts'):
+                    # Not remembered: the index appears once migrations run, without a restart
+                    return None
+                _backends[key] = 'sqlite'
+            elif engine.dialect.name == 'postgresql':
+                _backends[key] = 'postgres'
+            else:
+                _backends[key] = None
+        return _backends[key]
+
+    @staticmethod
+    def tokens(search_query):
+        return _TOKEN_RE.findall(search_query or '')[:16]
+
+    @staticmethod
+    def filter(query, search_query):
+        """Restricts an Event query to rows matching every search term (prefix match)"""
+        terms = SearchService.tokens(search_query)
+        if not terms:
+            return query
+
+        backend = SearchService.backend()
+        if backend == 'sqlite':
+            return query.filter(Event.id.in_(
+                text("SELECT rowid FROM events_fts WHERE events_fts MATCH :fts_query")
+                .bindparams(fts_query=SearchService._fts5_query(terms))
+                .columns(column('rowid'))
+            ))
+        if backend == 'postgres':
+            return query.filter(
+                text(f"{PG_SEARCH_VECTOR} @@ to_tsquery('simple', :ts_query)")
+                .bindparams(ts_query=SearchService._tsquery(terms))
+            )
+
+        for term in terms:
+            pattern = f"%{term}%"
+            query = query.filter((Event.title.like(pattern)) | (Event.description.like(pattern)))
+        return query
+
+    @staticmethod
+    def ranking(search_query):
+        """
+        Subquery of (id, score) for the events matching every search term, a
+        lower score meaning more relevant (title matches count TITLE_WEIGHT
+        times as much as description matches). None when there are no terms or
+        no full-text index to rank with; callers then use filter().
+        """
+        terms = SearchService.tokens(search_query)
+        if not terms:
+            return None
+
+        backend = SearchService.backend()
+        if backend == 'sqlite':
+            return (select(events_fts.c.rowid.label('id'),
+                           literal_column(f"bm25(events_fts, {TITLE_WEIGHT}, {DESCRIPTION_WEIGHT})").label('score'))
+                    .select_from(events_fts)
+                    .where(text("events_fts MATCH :fts_query").bindparams(fts_query=SearchService._fts5_query(terms)))
+                    .subquery('search_hits'))
+        if backend == 'postgres':
+            ts_query = func.to_tsquery(literal_column("'simple'"), SearchService._tsquery(terms))
+            # ts_rank is higher for better matches; negated so both backends sort ascending, and a double
+            # (not ts_rank's real) so the score in a cursor compares equal to the row it came from
+            score = cast(-func.ts_rank(literal_column(PG_SEARCH_VECTOR), ts_query), Float)
+            return (select(Event.id.label('id'), score.label('score'))
+                    .where(literal_column(PG_SEARCH_VECTOR).op('@@')(ts_query))
+                    .subquery('search_hits'))
+        return None
+
+    @staticmethod
+    def _fts5_query(terms):
+        # Quote each term so user input can't inject FTS5 operators; `*` makes it a prefix match
+        return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+    @staticmethod
+    def _tsquery(terms):
+        return " & ".join(f"{term}:*" for term in terms)
@@ -0,0 +1,139 @@
+import secrets
+import time
+from datetime import datetime, timezone
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy import select, update, insert, delete
+from werkzeug.datastructures import CallbackDict
+from app import db
+from app.models.models import ServerSession
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its id, the user it was loaded for and whether it was modified"""
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(session):
+            session.modified = True
+
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.loaded_user_id = self.get('user_id')
+
+
+class SqlSessionInterface(SessionInterface):
+    """
+    Stores sessions in the `server_sessions` table, shared by every worker
+    that can reach the database.
+    Rows are only written when the session changes, and expired rows are
+    removed by a periodic batched sweep instead of on every read.
+    A session that logs in gets a new id, so an id planted in a browser before
+    login (session fixation) is useless afterwards.
+    """
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, sweep_interval=300, sweep_batch=500):
+        self.sweep_interval = sweep_interval
+        self.sweep_batch = sweep_batch
+        self._last_sweep = time.monotonic()
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            with db.engine.connect() as conn:
+                row = conn.execute(
+                    select(ServerSession.data)
+                    .where(ServerSession.id == sid, ServerSession.expiry > _utcnow())
+                ).first()
+            if row:
+                return ServerSideSession(self.serializer.loads(row.data), sid=sid)
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified and not session.new:
+                with db.engine.begin() as conn:
+                    conn.execute(delete(ServerSession).where(ServerSession.id == session.sid))
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if not self.should_set_cookie(app, session):
+            return
+
+        # Non-permanent sessions still get a server-side expiry so the sweep can collect them
+        cookie_expires = self.get_expiration_time(app, session)
+        expiry = cookie_expires.replace(tzinfo=None) if cookie_expires else _utcnow() + app.permanent_session_lifetime
+        data = self.serializer.dumps(dict(session))
+        replaced_sid = None
+        if not session.new and session.get('user_id') != session.loaded_user_id:
+            replaced_sid, session.sid = session.sid, secrets.token_urlsafe(32)
+
+        with db.engine.begin() as conn:
+            if replaced_sid:
+                conn.execute(delete(ServerSession).where(ServerSession.id == replaced_sid))
+            stored = conn.execute(
+                update(ServerSession).where(ServerSession.id == session.sid).values(data=data, expiry=expiry)
+            ).rowcount
+            if not stored:
+                conn.execute(insert(ServerSession).values(id=session.sid, data=data, expiry=expiry))
+
+        response.set_cookie(
+            name, session.sid,
+            expires=cookie_expires,
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+        self.maybe_sweep()
+
+    def maybe_sweep(self):
+        if time.monotonic() - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = time.monotonic()
+        self.sweep()
+
+    def sweep(self, max_batches=10):
+        """Deletes expired sessions in bounded batches. Returns the number removed."""
+        removed = 0
+        for _ in range(max_batches):
+            expired = (
+                select(ServerSession.id)
+                .where(ServerSession.expiry <= _utcnow())
+                .limit(self.sweep_batch)
+                .scalar_subquery()
+            )
+            with db.engine.begin() as conn:
+                count = conn.execute(delete(ServerSession).where(ServerSession.id.in_(expired))).rowcount
+            removed += count
+            if count < self.sweep_batch:
+                break
+        return removed
+
+
+def init_session_store(app, session_manager):
+    """
+    Installs the configured session backend:
+    'cookie' keeps Flask's signed cookie, 'sqlalchemy' uses SqlSessionInterface,
+    anything else is handed to Flask-Session (e.g. the legacy 'filesystem').
+    """
+    session_type = app.config.get('SESSION_TYPE', 'cookie')
+    if session_type == 'cookie':
+        return
+    if session_type == 'sqlalchemy':
+        app.session_interface = SqlSessionInterface(
+            sweep_interval=app.config.get('SESSION_SWEEP_INTERVAL', 300),
+            sweep_batch=app.config.get('SESSION_SWEEP_BATCH', 500)
+        )
+        return
+    session_manager.init_app(app)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
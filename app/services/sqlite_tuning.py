@@ -0,0 +1,172 @@
+import functools
+import os
+import threading
+import time
+from sqlalchemy import event
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are serialized within a process only
+    fcntl = None
+
+# Per-connection PRAGMAs applied by each SQLITE_PROFILE. SQLITE_PRAGMAS in the
+# config overrides individual entries of the selected profile.
+SQLITE_PROFILES = {
+    # SQLite's own defaults: rollback journal, a commit blocks every reader
+    'default': {},
+    'production': {
+        'busy_timeout': 5000,       # ms to wait for a lock before "database is locked"
+        'journal_mode': 'WAL',      # readers never block the writer and vice versa
+        'synchronous': 'NORMAL',    # fsync at checkpoints, not every commit (safe in WAL)
+        'mmap_size': 268435456,     # 256 MB of the file read through the page cache
+        'cache_size': -65536,       # 64 MB page cache per connection
+        'foreign_keys': 'ON',
+        'temp_store': 'MEMORY',
+    },
+}
+
+BUSY_MESSAGE = "Server is busy, please try again in a moment"
+
+
+class WriterBusy(Exception):
+    """Raised when a writer can't get its turn in the write queue in time"""
+
+
+def profile_pragmas(app):
+    """The PRAGMAs for the configured profile with SQLITE_PRAGMAS applied on top"""
+    profile = app.config.get('SQLITE_PROFILE', 'default')
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLITE_PROFILE {profile!r}; expected one of {sorted(SQLITE_PROFILES)}")
+    return {**SQLITE_PROFILES[profile], **app.config.get('SQLITE_PRAGMAS', {})}
+
+
+def init_sqlite_tuning(app, db):
+    """Applies the SQLite profile to every new connection and configures the writer queue"""
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        return
+
+    install_pragmas(engine, profile_pragmas(app))
+    write_queue.init_app(app, engine)
+
+
+def install_pragmas(engine, pragmas):
+    """Runs `pragmas` on every new DBAPI connection of `engine` (for async engines, pass engine.sync_engine)"""
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+        cursor.close()
+
+
+class WriteQueue:
+    """
+    Lets one mutating EventService call at a time reach SQLite. Writers wait
+    their turn on a lock within the process and, for a file database, on an
+    flock() of <database>.write-lock shared by all worker processes, instead
+    of colliding inside SQLite and retrying until busy_timeout runs out.
+    A writer that can't get its turn within SQLITE_WRITE_QUEUE_TIMEOUT
+    seconds gets WriterBusy, whatever the shape of the method's result.
+    Disabled (a no-op) unless SQLITE_WRITE_QUEUE is set and the database is SQLite.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.timeout = 10.0
+        self.lock_path = None
+        self._thread_lock = threading.Lock()
+        self._local = threading.local()
+        self._lock_file = None
+        self._lock_file_pid = None
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        self.reset_stats()
+
+    def init_app(self, app, engine):
+        self.enabled = bool(app.config.get('SQLITE_WRITE_QUEUE')) and engine.dialect.name == 'sqlite'
+        self.timeout = app.config.get('SQLITE_WRITE_QUEUE_TIMEOUT', self.timeout)
+        database = engine.url.database
+        in_memory = not database or database == ':memory:' or database.startswith('file::memory:')
+        self.lock_path = None if in_memory or fcntl is None else f"{database}.write-lock"
+        app.extensions['sqlite_write_queue'] = self
+
+    def serialized(self, func):
+        """Decorator for service methods that write; nested calls reuse the held turn"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled or getattr(self._local, 'depth', 0):
+                return func(*args, **kwargs)
+            if not self._acquire():
+                raise WriterBusy(BUSY_MESSAGE)
+            self._local.depth = 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.depth = 0
+                self._release()
+        return wrapper
+
+    def _acquire(self):
+        queued = time.monotonic()
+        deadline = queued + self.timeout
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            self._count('busy')
+            return False
+        if self.lock_path and not self._acquire_file(deadline):
+            self._thread_lock.release()
+            self._count('busy')
+            return False
+
+        waited = time.monotonic() - queued
+        with self._stats_lock:
+            self._stats['writes'] += 1
+            self._stats['wait_seconds_total'] += waited
+            self._stats['wait_seconds_max'] = max(self._stats['wait_seconds_max'], waited)
+        return True
+
+    def _acquire_file(self, deadline):
+        lock_file = self._get_lock_file()
+        delay = 0.0005
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 0.01)
+
+    def _release(self):
+        if self.lock_path:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        self._thread_lock.release()
+
+    def _get_lock_file(self):
+        # flock() locks belong to the open file, which a forked worker would share
+        # with its parent, so each process opens its own
+        if self._lock_file is None or self._lock_file_pid != os.getpid():
+            self._lock_file = open(self.lock_path, 'a')
+            self._lock_file_pid = os.getpid()
+        return self._lock_file
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {'writes': 0, 'busy': 0, 'wait_seconds_total': 0.0, 'wait_seconds_max': 0.0}
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['wait_seconds_avg'] = stats['wait_seconds_total'] / stats['writes'] if stats['writes'] else 0.0
+        return stats
+
+
+write_queue = WriteQueue()
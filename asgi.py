@@ -0,0 +1,5 @@
+import os
+from app.async_app import create_asgi_app
+
+# uvicorn asgi:app --workers 4
+app = create_asgi_app(os.environ.get('FLASK_ENV', 'production'))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+JSON API vs HTML Benchmark
+Compares latency and payload size of the /api/v1 endpoints against the HTML
+pages that show the same data (homepage listing, event detail modal).
+The application cache is disabled so every request hits the database.
+
+Usage: python benchmarks/api_vs_html.py [--events 2000] [--requests 300]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+MODAL_HEADERS = {'X-Requested-With': 'XMLHttpRequest'}
+
+
+def make_app(db_path):
+    class BenchConfig(config.TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        CACHE_ENABLED = False
+
+    config.config['bench'] = BenchConfig
+    from app import create_app
+    return create_app('bench')
+
+
+def seed(app, events, users=50):
+    from app import db
+    from app.models.models import User, Event, Comment
+
+    today = date.today()
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([User(username=f'bench{i}', hash='x') for i in range(users)])
+        db.session.flush()
+        db.session.add_all([
+            Event(
+                user_id=i % users + 1, title=f'Event {i}', date=today + timedelta(days=i % 365),
+                description='Lorem ipsum dolor sit amet ' * 8, category=('Tech', 'Art', 'Music')[i % 3],
+                capacity=50, location_name=f'Venue {i % 40}'
+            ) for i in range(events)
+        ])
+        db.session.flush()
+        db.session.add_all([Comment(event_id=1, user_id=i % users + 1, content=f'Comment {i}') for i in range(40)])
+        db.session.commit()
+
+
+def measure(client, url, requests, headers=None):
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, (url, response.status_code)
+    size = len(response.data)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get(url, headers=headers)
+    return (time.perf_counter() - start) / requests * 1000, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--requests', type=int, default=300)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    try:
+        app = make_app(os.path.join(workdir, 'api_bench.db'))
+        seed(app, args.events)
+        client = app.test_client()
+
+        pairs = [
+            ('listing', ('/', None), ('/api/v1/events', None)),
+            ('listing (ids+titles)', ('/', None), ('/api/v1/events?fields=id,title', None)),
+            ('event detail', ('/events/detail/1', MODAL_HEADERS), ('/api/v1/events/1?fields=id,title,date,time,description,creator,participants_count', None)),
+            ('comments', ('/events/detail/1', MODAL_HEADERS), ('/api/v1/events/1/comments', None)),
+        ]
+
+        print(f"⏱️  {args.requests} requests per endpoint, {args.events} events, cache disabled")
+        print(f"   {'':<22}{'HTML ms':>9}{'API ms':>9}{'HTML B':>10}{'API B':>9}")
+        for label, (html_url, html_headers), (api_url, api_headers) in pairs:
+            html_ms, html_size = measure(client, html_url, args.requests, html_headers)
+            api_ms, api_size = measure(client, api_url, args.requests, api_headers)
+            print(f"   {label:<22}{html_ms:9.2f}{api_ms:9.2f}{html_size:10d}{api_size:9d}"
+                  f"   ({html_ms / api_ms:.1f}x faster, {html_size / api_size:.1f}x smaller)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Async vs Sync Serving Benchmark
+Serves the same dataset with gunicorn sync workers (wsgi) and with uvicorn in
+ASGI mode (asgi.py: async driver for the public JSON reads), then drives the
+/api/v1 read endpoints over HTTP with an increasing number of concurrent
+connections. Reports throughput, latency, errors, how many requests each
+server actually had in flight, and the server's memory per in-flight request.
+The application cache is off, so every request reaches the database.
+
+Usage: python benchmarks/async_vs_sync.py [--workers 2] [--connections 16,64,256] [--seconds 10]
+       [--events 5000] [--servers sync,async]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from dataset import build_dataset
+
+SERVERS = {
+    'sync': lambda port, workers: [
+        sys.executable, '-m', 'gunicorn', '--chdir', BENCH_DIR, '-w', str(workers), '--backlog', '2048',
+        '-b', f'127.0.0.1:{port}', '--log-level', 'warning', 'bench_wsgi:app'
+    ],
+    'async': lambda port, workers: [
+        sys.executable, '-m', 'uvicorn', '--app-dir', BENCH_DIR, '--workers', str(workers), '--backlog', '2048',
+        '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning', '--no-access-log', 'bench_asgi:app'
+    ],
+}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def tree_rss_mb(pid):
+    """Resident memory of a process and all its descendants (the server's workers)"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f'/proc/{current}/status') as f:
+                total += next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+        except (OSError, StopIteration):
+            pass
+    return total / 1024
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def fetch(port, path):
+    """One GET on a fresh connection (gunicorn's sync workers don't keep connections alive). Returns the status."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+def random_path(rng, events):
+    roll = rng.random()
+    if roll < 0.5:
+        return f"/api/v1/events?kind={rng.choice(('upcoming', 'past'))}&fields=id,title,date,creator,participants_count"
+    if roll < 0.85:
+        return f"/api/v1/events/{rng.randint(1, events)}?fields=id,title,date,description,creator,comments_count"
+    return f"/api/v1/events/{rng.randint(1, events)}/comments"
+
+
+async def load(port, connections, seconds, events, server_pid):
+    latencies, errors, rss_samples = [], 0, []
+    deadline = time.perf_counter() + seconds
+
+    async def client(index):
+        nonlocal errors
+        rng = random.Random(index)
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = await asyncio.wait_for(fetch(port, random_path(rng, events)), 30)
+                if status >= 400:
+                    errors += 1
+                else:
+                    latencies.append(time.perf_counter() - started)
+            except (OSError, asyncio.TimeoutError, IndexError, ValueError):
+                errors += 1
+
+    async def sample_memory():
+        while time.perf_counter() < deadline:
+            rss_samples.append(tree_rss_mb(server_pid))
+            await asyncio.sleep(0.5)
+
+    started = time.perf_counter()
+    await asyncio.gather(sample_memory(), *(client(i) for i in range(connections)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return latencies, errors, elapsed, max(rss_samples, default=0.0)
+
+
+def wait_ready(process, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{process.args[2]} exited during startup (is it installed?)")
+        try:
+            if asyncio.run(fetch(port, '/api/v1/categories')) == 200:
+                return
+        except (OSError, IndexError, ValueError):
+            time.sleep(0.2)
+    raise RuntimeError("server did not start in time")
+
+
+def run(name, database_url, args):
+    port = free_port()
+    env = dict(os.environ, BENCH_DATABASE_URL=database_url, BENCH_CACHE_ENABLED='0')
+    process = subprocess.Popen(SERVERS[name](port, args.workers), env=env)
+    try:
+        wait_ready(process, port)
+        idle_mb = tree_rss_mb(process.pid)
+        for connections in args.connections:
+            latencies, errors, elapsed, rss_mb = asyncio.run(
+                load(port, connections, args.seconds, args.events, process.pid)
+            )
+            rps = len(latencies) / elapsed
+            # Little's law: requests the server had open on average, queued ones included
+            in_flight = rps * (sum(latencies) / len(latencies)) if latencies else 0.0
+            # A sync worker processes one request at a time; the rest wait in the accept queue
+            served = min(in_flight, args.workers) if name == 'sync' else in_flight
+            print(f"{name:<6} {connections:>6} {rps:>8.0f} {percentile(latencies, 50) * 1000:>8.1f}ms "
+                  f"{percentile(latencies, 99) * 1000:>8.1f}ms {errors:>6} {in_flight:>9.1f} {served:>7.1f} "
+                  f"{idle_mb:>6.0f}/{rss_mb:<4.0f}MB {rss_mb * 1024 / max(served, 1):>9.0f}KB")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--workers', type=int, default=2, help='server processes for both servers')
+    parser.add_argument('--connections', default='16,64,256', help='comma-separated concurrent connection counts')
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--servers', default=','.join(SERVERS), help=f"comma-separated, from: {', '.join(SERVERS)}")
+    args = parser.parse_args()
+    args.connections = [int(n) for n in args.connections.split(',')]
+
+    names = args.servers.split(',')
+    unknown = [name for name in names if name not in SERVERS]
+    if unknown:
+        parser.error(f"unknown server(s): {', '.join(unknown)}")
+
+    db_dir = tempfile.mkdtemp()
+    database_url = f"sqlite:///{os.path.join(db_dir, 'async.db')}"
+    build_dataset(database_url, users=args.users, events=args.events,
+                  participations=args.events * 5, comments=args.events * 2)
+
+    print(f"\n🏋️  {args.workers} worker processes per server, {args.seconds:g}s per step\n")
+    print(f"{'server':<6} {'conns':>6} {'req/s':>8} {'p50':>10} {'p99':>10} {'errors':>6} {'in-flight':>9} "
+          f"{'served':>7} {'RSS idle/load':>13} {'RSS/served':>11}")
+    try:
+        for name in names:
+            run(name, database_url, args)
+    finally:
+        shutil.rmtree(db_dir, ignore_errors=True)
+    print("\n'in-flight' counts requests open on the server (rps x mean latency), queued ones included;"
+          "\n'served' is how many of them were being processed at once, which sync workers cap at --workers.")
+
+
+if __name__ == "__main__":
+    main()
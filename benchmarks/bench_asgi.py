@@ -0,0 +1,13 @@
+"""
+Uvicorn entry point for benchmarks/async_vs_sync.py: serves the app in ASGI
+mode against the benchmark database given in BENCH_DATABASE_URL.
+
+uvicorn --app-dir benchmarks bench_asgi:app
+"""
+
+import os
+
+from dataset import make_app
+from app.async_app import AsyncReadApp
+
+app = AsyncReadApp(make_app(os.environ['BENCH_DATABASE_URL'], os.environ.get('BENCH_CACHE_ENABLED', '1') == '1'))
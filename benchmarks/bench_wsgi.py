@@ -0,0 +1,12 @@
+"""
+Gunicorn entry point for benchmarks/run_suite.py: serves the app against the
+benchmark database given in BENCH_DATABASE_URL.
+
+gunicorn --chdir benchmarks bench_wsgi:app
+"""
+
+import os
+
+from dataset import make_app
+
+app = make_app(os.environ['BENCH_DATABASE_URL'], os.environ.get('BENCH_CACHE_ENABLED', '1') == '1')
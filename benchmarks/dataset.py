@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Synthetic Benchmark Dataset
+Builds a reproducible database of users, events, participations and comments
+(SQLite file or PostgreSQL URL) for the benchmark suite, using the bulk
+loader behind seed.py. The same --seed always produces the same rows. Every
+user's password is BENCH_PASSWORD.
+
+Usage: python benchmarks/dataset.py sqlite:////tmp/orbit_bench.db [--scale small|medium|large]
+       [--users N] [--events N] [--participations N] [--comments N] [--seed 42]
+"""
+
+import argparse
+import os
+import sys
+import time as clock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+BENCH_PASSWORD = 'benchpass'
+
+SCALES = {
+    'small': {'users': 1000, 'events': 10000, 'participations': 50000, 'comments': 20000},
+    'medium': {'users': 10000, 'events': 100000, 'participations': 1000000, 'comments': 500000},
+    'large': {'users': 100000, 'events': 1000000, 'participations': 10000000, 'comments': 5000000},
+}
+
+
+def bench_config(database_url, cache_enabled=True):
+    """Config class shared by the benchmark scripts and the gunicorn entry point"""
+    class BenchConfig(config.TestingConfig):
+        SQLALCHEMY_DATABASE_URI = config.database_url(database_url)
+        WTF_CSRF_ENABLED = False
+        QUERY_BUDGET_RAISE = False
+        CACHE_ENABLED = cache_enabled
+        RATE_LIMIT_ENABLED = False  # load generators are one user/IP hammering writes
+
+    return BenchConfig
+
+
+def make_app(database_url, cache_enabled=True):
+    config.config['bench'] = bench_config(database_url, cache_enabled)
+    from app import create_app
+    return create_app('bench')
+
+
+def build_dataset(database_url, users, events, participations, comments, seed=42):
+    from app import db, migrations
+    from app.services.bulk_loader import BulkLoader, TABLES, synthetic_rows
+    from app.services.password_hasher import password_hasher
+
+    app = make_app(database_url)
+
+    with app.app_context():
+        # Not model tables, so drop_all would leave them behind
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql("DROP TABLE IF EXISTS events_fts")
+            conn.exec_driver_sql("DROP TABLE IF EXISTS schema_migrations")
+        db.drop_all()
+        migrations.upgrade(db.engine, log=lambda message: None)
+        print(f"📦 Building dataset: {users:,} users, {events:,} events, "
+              f"{participations:,} participations, {comments:,} comments")
+
+        streams = synthetic_rows(users, events, participations, comments,
+                                 password_hasher.hash(BENCH_PASSWORD), seed=seed)
+        started = clock.perf_counter()
+        loader = BulkLoader(db.engine)
+        with loader.session():
+            for name in TABLES:
+                rows, total = streams[name]
+                loader.load(name, rows, total)
+            loader.finish()
+        # Comments land on random events, so their counters are filled in afterwards
+        from app.services.event_service import EventService
+        EventService.reconcile_comment_counts()
+        print(f"✅ Dataset ready in {clock.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('database_url')
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    for name in ('users', 'events', 'participations', 'comments'):
+        parser.add_argument(f'--{name}', type=int)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    sizes = dict(SCALES[args.scale])
+    sizes.update({name: getattr(args, name) for name in sizes if getattr(args, name) is not None})
+    build_dataset(args.database_url, seed=args.seed, **sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Event Delete Benchmark
+Deletes events with growing numbers of participants and comments three ways
+and times what the request waits for: the old ORM cascade (every child row
+loaded, then deleted one by one), the soft delete plus a background
+purge_event job, and the job itself (set-based batched DELETEs).
+
+Usage: python benchmarks/delete_event.py [--sizes 1000,10000,50000]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from dataset import bench_config
+
+
+def make_app(database_url):
+    config.config['delete'] = type('DeleteConfig', (bench_config(database_url),), {'JOBS_RUNNER': 'external'})
+    from app import create_app
+    return create_app('delete')
+
+
+def add_event(title, participants, comments):
+    """An event with `participants` joins and `comments` comments, inserted in bulk"""
+    from sqlalchemy import insert
+    from app import db
+    from app.models.models import Comment, Event, EventParticipant
+
+    event = Event(user_id=1, title=title, date=date.today() + timedelta(days=7),
+                  participants_count=participants, comments_count=comments)
+    db.session.add(event)
+    db.session.flush()
+    db.session.execute(insert(EventParticipant), [{'user_id': u, 'event_id': event.id} for u in range(2, participants + 2)])
+    if comments:
+        db.session.execute(insert(Comment), [{'user_id': 2, 'event_id': event.id, 'content': 'x' * 80}] * comments)
+    db.session.commit()
+    return event.id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='1000,10000,50000', help='comma-separated child rows per event (half joins, half comments)')
+    args = parser.parse_args()
+    sizes = [int(n) for n in args.sizes.split(',')]
+
+    db_dir = tempfile.mkdtemp()
+    app = make_app(f"sqlite:///{os.path.join(db_dir, 'delete.db')}")
+
+    from sqlalchemy import insert
+    from app import db, migrations
+    from app.models.models import Event, User
+    from app.services.event_service import EventService
+    from app.services.jobs import jobs
+
+    print(f"\n{'child rows':>10} {'ORM cascade':>12} {'soft delete':>12} {'purge job':>10}")
+    try:
+        with app.app_context():
+            migrations.upgrade(db.engine, log=lambda message: None)
+            users = max(sizes) // 2 + 2
+            db.session.execute(insert(User), [{'username': f'user{i}', 'hash': 'x'} for i in range(1, users + 1)])
+            db.session.commit()
+
+            for size in sizes:
+                joins, comments = size // 2, size - size // 2
+
+                event_id = add_event(f'cascade {size}', joins, comments)
+                db.session.expunge_all()
+                started = time.perf_counter()
+                db.session.delete(db.session.get(Event, event_id))
+                db.session.commit()
+                cascade = time.perf_counter() - started
+
+                event_id = add_event(f'soft {size}', joins, comments)
+                db.session.expunge_all()
+                started = time.perf_counter()
+                EventService.delete_event(1, event_id)
+                soft = time.perf_counter() - started
+
+                started = time.perf_counter()
+                jobs.run_pending()
+                purge = time.perf_counter() - started
+                print(f"{size:>10,} {cascade * 1000:>10.0f}ms {soft * 1000:>10.1f}ms {purge * 1000:>8.0f}ms")
+    finally:
+        shutil.rmtree(db_dir, ignore_errors=True)
+    print("\nThe request only waits for 'soft delete'; 'purge job' runs on the job runner.")
+
+
+if __name__ == "__main__":
+    main()
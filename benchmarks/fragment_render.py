@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Fragment Cache Render Benchmark
+Requests large homepage listings and event detail modals through the Flask
+test client with the rendered-fragment cache off and on. The application
+cache stays on and is warmed first, so the difference is template rendering.
+
+Usage: python benchmarks/fragment_render.py [--cards 100,300,500] [--requests 30] [--events 2000]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from dataset import bench_config, build_dataset
+
+
+def make_app(database_url, fragments, max_cards):
+    settings = {'FRAGMENT_CACHE_ENABLED': fragments, 'EVENTS_MAX_PER_PAGE': max_cards}
+    config.config['fragments'] = type('FragmentConfig', (bench_config(database_url),), settings)
+    from app import create_app
+    return create_app('fragments')
+
+
+def timed(client, url, requests, headers=None):
+    """Median milliseconds per request after one warm-up request"""
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, (url, response.status_code)
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        client.get(url, headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--cards', default='100,300,500', help='comma-separated listing sizes')
+    parser.add_argument('--requests', type=int, default=30)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--events', type=int, default=2000)
+    args = parser.parse_args()
+    sizes = [int(n) for n in args.cards.split(',')]
+
+    db_dir = tempfile.mkdtemp()
+    database_url = f"sqlite:///{os.path.join(db_dir, 'fragments.db')}"
+    build_dataset(database_url, users=args.users, events=args.events,
+                  participations=args.events * 5, comments=args.events * 2)
+
+    from app.services.cache_service import cache
+    results = {}
+    try:
+        for fragments in (False, True):
+            app = make_app(database_url, fragments, max(sizes))
+            cache.clear()
+            client = app.test_client()
+            with client.session_transaction() as session:
+                session['user_id'] = 1
+            for size in sizes:
+                results[(fragments, f'listing {size}')] = timed(client, f'/?per_page={size}', args.requests)
+            results[(fragments, 'detail modal')] = timed(
+                client, '/events/detail/1', args.requests, headers={'X-Requested-With': 'XMLHttpRequest'}
+            )
+    finally:
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+    print(f"\n{'page':<16} {'no fragments':>13} {'fragments':>11} {'speedup':>8}")
+    for name in [f'listing {size}' for size in sizes] + ['detail modal']:
+        off, on = results[(False, name)], results[(True, name)]
+        print(f"{name:<16} {off:>11.1f}ms {on:>9.1f}ms {off / on:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
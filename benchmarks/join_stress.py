@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Join Stress Test
+Fires many concurrent join_event calls from separate processes (like gunicorn
+workers) at one small-capacity event and checks that it is never overbooked
+and that the stored counter matches the participant rows.
+
+Usage: python benchmarks/join_stress.py [--workers 8] [--users 200] [--capacity 25]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+
+def make_app(db_path):
+    class StressConfig(config.TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+
+    config.config['stress'] = StressConfig
+    from app import create_app
+    return create_app('stress')
+
+
+def setup(db_path, users, capacity):
+    from app import db
+    from app.models.models import User, Event
+
+    app = make_app(db_path)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([User(username=f'stress{i}', hash='x') for i in range(users)])
+        db.session.flush()
+        event = Event(user_id=1, title='Stress', date=date.today() + timedelta(days=1), capacity=capacity)
+        db.session.add(event)
+        db.session.commit()
+        return event.id
+
+
+def join_many(args):
+    db_path, event_id, user_ids = args
+    from app.services.event_service import EventService
+
+    app = make_app(db_path)
+    results = {'joined': 0, 'full': 0, 'errors': 0}
+    with app.app_context():
+        for user_id in user_ids:
+            try:
+                success, message = EventService.join_event(user_id, event_id)
+            except Exception:
+                from app import db
+                db.session.rollback()
+                results['errors'] += 1
+                continue
+            if success:
+                results['joined'] += 1
+            elif 'full' in message:
+                results['full'] += 1
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--capacity', type=int, default=25)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), 'join_stress.db')
+    event_id = setup(db_path, args.users, args.capacity)
+
+    user_ids = list(range(1, args.users + 1))
+    batches = [(db_path, event_id, user_ids[i::args.workers]) for i in range(args.workers)]
+    print(f"🏁 {args.users} users joining an event of capacity {args.capacity} from {args.workers} processes...")
+    with Pool(args.workers) as pool:
+        results = pool.map(join_many, batches)
+
+    totals = {key: sum(r[key] for r in results) for key in results[0]}
+
+    from app import db
+    from app.models.models import Event, EventParticipant
+    app = make_app(db_path)
+    with app.app_context():
+        event = db.session.get(Event, event_id)
+        rows = EventParticipant.query.filter_by(event_id=event_id).count()
+        counter = event.participants_count
+
+    print(f"   joined={totals['joined']} rejected_full={totals['full']} errors={totals['errors']}")
+    print(f"   participant rows={rows} stored counter={counter} capacity={args.capacity}")
+
+    ok = rows <= args.capacity and rows == counter == totals['joined']
+    print("✅ Capacity held and counter consistent." if ok else "❌ Event overbooked or counter drifted!")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Live Subscribers Benchmark
+Starts live_server.py, opens many idle Server-Sent Events connections spread
+over a few events, then publishes deltas the way app workers do (UDP) and
+measures how long each delta takes to reach every subscriber, along with the
+server's memory use.
+
+Usage: python benchmarks/live_subscribers.py [--subscribers 2000] [--events 20] [--deltas 20]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.live_updates import UdpPublisher
+
+
+def free_port(kind=socket.SOCK_STREAM):
+    with socket.socket(socket.AF_INET, kind) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def rss_mb(pid):
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+async def subscriber(port, event_id, received, ready):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"GET /events/{event_id}/live HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    while (await reader.readline()) not in (b'\r\n', b''):
+        pass
+    ready.release()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            if line.startswith(b'data:'):
+                received[event_id].append(time.perf_counter())
+    finally:
+        writer.close()
+
+
+async def run(args):
+    http_port, udp_port = free_port(), free_port(socket.SOCK_DGRAM)
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'live_server.py'), '--host', '127.0.0.1', '--port', str(http_port),
+         '--broker', f'127.0.0.1:{udp_port}'],
+        stdout=subprocess.DEVNULL, cwd=ROOT
+    )
+    try:
+        await asyncio.sleep(1.5)
+        baseline_mb = rss_mb(server.pid)
+
+        received = {event_id: [] for event_id in range(1, args.events + 1)}
+        ready = asyncio.Semaphore(0)
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(subscriber(http_port, i % args.events + 1, received, ready))
+                 for i in range(args.subscribers)]
+        for _ in range(args.subscribers):
+            await ready.acquire()
+        print(f"🔌 {args.subscribers:,} subscribers connected in {time.perf_counter() - started:.1f}s; "
+              f"server RSS {baseline_mb:.0f} MB -> {rss_mb(server.pid):.0f} MB")
+
+        publisher = UdpPublisher(f'127.0.0.1:{udp_port}')
+        per_event = args.subscribers // args.events
+        latencies = []
+        for n in range(args.deltas):
+            event_id = n % args.events + 1
+            before = len(received[event_id])
+            sent = time.perf_counter()
+            publisher.publish(event_id, {'type': 'participants', 'count': n, 'capacity': None, 'full': False})
+            deadline = sent + 5
+            while len(received[event_id]) < before + per_event and time.perf_counter() < deadline:
+                await asyncio.sleep(0.001)
+            arrivals = received[event_id][before:]
+            if arrivals:
+                latencies.append((max(arrivals) - sent) * 1000)
+            await asyncio.sleep(0.05)
+
+        latencies.sort()
+        delivered = sum(len(times) for times in received.values())
+        print(f"📨 {args.deltas} deltas to ~{per_event} subscribers each: "
+              f"{delivered:,} deliveries, fan-out p50 {latencies[len(latencies) // 2]:.1f} ms, "
+              f"max {latencies[-1]:.1f} ms")
+        print(f"🧠 Server RSS with {args.subscribers:,} idle streams: {rss_mb(server.pid):.0f} MB")
+        for task in tasks:
+            task.cancel()
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--subscribers', type=int, default=2000)
+    parser.add_argument('--events', type=int, default=20)
+    parser.add_argument('--deltas', type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Login Throughput Benchmark
+Drives concurrent POST /auth/login requests from a thread per simulated client
+(like a threaded gunicorn worker) and reports logins/second and latency, with
+password hashing inline vs in the bounded process pool.
+
+Usage: python benchmarks/login_throughput.py [--clients 8] [--logins 10]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+PASSWORD = 'benchmark-password'
+
+
+def make_app(db_path, use_pool):
+    class BenchConfig(config.TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        WTF_CSRF_ENABLED = False
+        PASSWORD_HASH_POOL = use_pool
+
+    config.config['bench'] = BenchConfig
+    from app import create_app
+    return create_app('bench')
+
+
+def run(use_pool, clients, logins):
+    from app import db
+    from app.models.models import User
+    from app.services.password_hasher import password_hasher
+    from werkzeug.security import generate_password_hash
+
+    db_path = os.path.join(tempfile.mkdtemp(), 'login.db')
+    app = make_app(db_path, use_pool)
+    with app.app_context():
+        db.create_all()
+        stored = generate_password_hash(PASSWORD, password_hasher.method)
+        db.session.add_all([User(username=f'bench{i}', hash=stored) for i in range(clients)])
+        db.session.commit()
+
+    password_hasher.reset_stats()
+    if use_pool:
+        password_hasher.verify(stored, PASSWORD)  # warm the pool processes
+
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+
+    def client_loop(index):
+        client = app.test_client()
+        for _ in range(logins):
+            start = time.perf_counter()
+            response = client.post('/auth/login', data={'username': f'bench{index}', 'password': PASSWORD})
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    threads = [threading.Thread(target=client_loop, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    stats = password_hasher.stats()
+    password_hasher.shutdown()
+    return {
+        'throughput': len(latencies) / wall,
+        'p50': latencies[len(latencies) // 2] * 1000,
+        'p95': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'mean': statistics.mean(latencies) * 1000,
+        'statuses': statuses,
+        'queue_avg': stats['queue_seconds_avg'] * 1000,
+        'queue_max': stats['queue_seconds_max'] * 1000,
+        'rejected': stats['rejected'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--logins', type=int, default=10, help='logins per client')
+    args = parser.parse_args()
+
+    print(f"🔐 {args.clients} concurrent clients x {args.logins} logins")
+    for label, use_pool in (('inline', False), ('pool', True)):
+        r = run(use_pool, args.clients, args.logins)
+        print(f"   {label:<7} {r['throughput']:7.1f} logins/s  p50={r['p50']:.0f}ms p95={r['p95']:.0f}ms "
+              f"statuses={r['statuses']}", end='')
+        if use_pool:
+            print(f"  queue avg={r['queue_avg']:.0f}ms max={r['queue_max']:.0f}ms rejected={r['rejected']}")
+        else:
+            print()
+
+
+if __name__ == "__main__":
+    main()
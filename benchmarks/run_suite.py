@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Route Benchmark Suite
+Drives the real routes against a dataset built by benchmarks/dataset.py and
+reports p50/p95/p99 latency, throughput and SQL queries per request (read
+from the Server-Timing header). Runs in-process through the Flask test
+client, or over HTTP against a multi-worker gunicorn server.
+
+Results can be saved as a named baseline (benchmarks/baselines/<name>.json)
+and later runs compared against it; a p95 regression beyond --tolerance
+makes the script exit with status 1.
+
+Usage: python benchmarks/run_suite.py sqlite:////tmp/orbit_bench.db
+       [--driver client|gunicorn] [--workers 4] [--concurrency 8] [--requests 200]
+       [--scenarios index,detail_modal] [--no-cache] [--save NAME] [--compare NAME] [--tolerance 0.2]
+"""
+
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from dataset import BENCH_PASSWORD, make_app
+
+BASELINE_DIR = os.path.join(BENCH_DIR, 'baselines')
+MODAL_HEADERS = {'X-Requested-With': 'XMLHttpRequest'}
+_QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+
+
+def _event_id(ctx):
+    return ctx['rng'].randint(1, ctx['max_event_id'])
+
+
+def _join_leave(ctx, send):
+    event_id = _event_id(ctx)
+    first = send('GET', f'/events/join/{event_id}', headers=MODAL_HEADERS)
+    second = send('GET', f'/events/leave/{event_id}', headers=MODAL_HEADERS)
+    return first, second
+
+
+# name -> (needs login, request builder). A builder returns one request or calls send itself.
+SCENARIOS = {
+    'index': (False, lambda ctx, send: send('GET', '/')),
+    'history': (False, lambda ctx, send: send('GET', '/history')),
+    'search': (False, lambda ctx, send: send('GET', '/?search=python+meetup')),
+    'profile': (True, lambda ctx, send: send('GET', '/profile')),
+    'detail_modal': (False, lambda ctx, send: send('GET', f'/events/detail/{_event_id(ctx)}', headers=MODAL_HEADERS)),
+    'join_leave': (True, _join_leave),
+    'comment': (True, lambda ctx, send: send(
+        'POST', f'/events/detail/{_event_id(ctx)}', data={'content': 'Benchmark comment'}, headers=MODAL_HEADERS
+    )),
+}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples, elapsed):
+    latencies = sorted(ms for ms, _, _ in samples)
+    queries = [q for _, q, _ in samples if q is not None]
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for _, _, ok in samples if not ok),
+        'rps': round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'queries_avg': round(sum(queries) / len(queries), 1) if queries else None,
+        'queries_max': max(queries) if queries else None,
+    }
+
+
+def _queries(server_timing):
+    match = _QUERIES_RE.search(server_timing or '')
+    return int(match.group(1)) if match else None
+
+
+class ClientDriver:
+    """In-process Flask test client; measures app + DB time without network or WSGI server"""
+    def __init__(self, database_url, cache_enabled):
+        self.app = make_app(database_url, cache_enabled)
+
+    def session(self, username=None):
+        client = self.app.test_client()
+        if username:
+            client.post('/auth/login', data={'username': username, 'password': BENCH_PASSWORD})
+
+        def send(method, path, data=None, headers=None):
+            response = client.open(path, method=method, data=data, headers=headers)
+            return response.status_code < 400, _queries(response.headers.get('Server-Timing'))
+        return send
+
+    def close(self):
+        pass
+
+
+class GunicornDriver:
+    """Real multi-worker gunicorn server, driven over HTTP by --concurrency threads"""
+    def __init__(self, database_url, cache_enabled, workers):
+        self.port = _free_port()
+        self.base = f'http://127.0.0.1:{self.port}'
+        env = dict(os.environ, BENCH_DATABASE_URL=database_url, BENCH_CACHE_ENABLED=str(int(cache_enabled)))
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '--chdir', BENCH_DIR, '-w', str(workers),
+             '-b', f'127.0.0.1:{self.port}', '--log-level', 'warning', 'bench_wsgi:app'],
+            env=env
+        )
+        self._wait_ready()
+
+    def _wait_ready(self, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError("gunicorn exited during startup (is it installed?)")
+            try:
+                urllib.request.urlopen(self.base + '/auth/login', timeout=1).read()
+                return
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.2)
+        raise RuntimeError("gunicorn did not start in time")
+
+    def session(self, username=None):
+        opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+        def send(method, path, data=None, headers=None):
+            body = urllib.parse.urlencode(data).encode() if data else None
+            req = urllib.request.Request(self.base + path, data=body, method=method, headers=headers or {})
+            try:
+                with opener.open(req, timeout=30) as response:
+                    response.read()
+                    return True, _queries(response.headers.get('Server-Timing'))
+            except urllib.error.HTTPError as e:
+                return False, _queries(e.headers.get('Server-Timing'))
+            except urllib.error.URLError:
+                return False, None
+
+        if username:
+            send('POST', '/auth/login', data={'username': username, 'password': BENCH_PASSWORD})
+        return send
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait(timeout=10)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def run_scenario(driver, name, requests, concurrency, max_event_id, users, seed):
+    needs_login, build = SCENARIOS[name]
+    samples = []
+    lock = threading.Lock()
+    per_thread = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+
+    def worker(index, count):
+        rng = random.Random(seed + index)
+        ctx = {'rng': rng, 'max_event_id': max_event_id}
+        send_raw = driver.session(f'user{rng.randint(0, users - 1)}' if needs_login else None)
+
+        def send(*args, **kwargs):
+            started = time.perf_counter()
+            ok, queries = send_raw(*args, **kwargs)
+            with lock:
+                samples.append(((time.perf_counter() - started) * 1000, queries, ok))
+
+        for _ in range(count):
+            build(ctx, send)
+
+    threads = [threading.Thread(target=worker, args=(i, n)) for i, n in enumerate(per_thread) if n]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return summarize(samples, time.perf_counter() - started)
+
+
+def dataset_shape(database_url):
+    from sqlalchemy import create_engine, func, select
+    from app.models.models import User, Event
+
+    engine = create_engine(database_url)
+    with engine.connect() as conn:
+        shape = {
+            'users': conn.execute(select(func.count(User.id))).scalar(),
+            'events': conn.execute(select(func.count(Event.id))).scalar(),
+            'max_event_id': conn.execute(select(func.max(Event.id))).scalar() or 1,
+        }
+    engine.dispose()
+    return shape
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """Prints p95 deltas against a baseline. Returns the regressed scenario names."""
+    regressions = []
+    print(f"\n📊 Compared with baseline from commit {baseline.get('commit')} ({baseline.get('created')})")
+    for name, current in results.items():
+        previous = baseline['results'].get(name)
+        if not previous or not previous['p95_ms']:
+            continue
+        change = current['p95_ms'] / previous['p95_ms'] - 1
+        flag = '  ❌ regression' if change > tolerance else ''
+        print(f"   {name:<14} p95 {previous['p95_ms']:8.2f} -> {current['p95_ms']:8.2f} ms ({change:+.0%}){flag}")
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('database_url')
+    parser.add_argument('--driver', choices=('client', 'gunicorn'), default='client')
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn worker processes')
+    parser.add_argument('--concurrency', type=int, default=1, help='client threads issuing requests')
+    parser.add_argument('--requests', type=int, default=200, help='requests per scenario')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--no-cache', action='store_true', help='disable the application cache (every request hits the DB)')
+    parser.add_argument('--save', metavar='NAME', help='save results as baselines/NAME.json')
+    parser.add_argument('--compare', metavar='NAME', help='compare with baselines/NAME.json')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed p95 slowdown (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    shape = dataset_shape(args.database_url)
+    cache_enabled = not args.no_cache
+    if args.driver == 'client':
+        driver = ClientDriver(args.database_url, cache_enabled)
+    else:
+        driver = GunicornDriver(args.database_url, cache_enabled, args.workers)
+    print(f"⏱️  {args.driver} driver, {args.requests} requests/scenario, concurrency {args.concurrency}, "
+          f"cache {'on' if cache_enabled else 'off'}, {shape['users']:,} users / {shape['events']:,} events")
+    print(f"   {'scenario':<14}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}{'errors':>8}")
+
+    results = {}
+    try:
+        for name in scenarios:
+            result = run_scenario(driver, name, args.requests, args.concurrency,
+                                  shape['max_event_id'], shape['users'], args.seed)
+            results[name] = result
+            queries = '-' if result['queries_avg'] is None else f"{result['queries_avg']:.1f}"
+            print(f"   {name:<14}{result['rps']:8.1f}{result['p50_ms']:9.2f}{result['p95_ms']:9.2f}"
+                  f"{result['p99_ms']:9.2f}{queries:>9}{result['errors']:8d}")
+    finally:
+        driver.close()
+
+    run = {
+        'commit': git_commit(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'driver': args.driver,
+        'workers': args.workers if args.driver == 'gunicorn' else 1,
+        'concurrency': args.concurrency,
+        'cache': cache_enabled,
+        'dataset': {'users': shape['users'], 'events': shape['events']},
+        'results': results,
+    }
+
+    regressions = []
+    if args.compare:
+        with open(os.path.join(BASELINE_DIR, f'{args.compare}.json')) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        path = os.path.join(BASELINE_DIR, f'{args.save}.json')
+        with open(path, 'w') as f:
+            json.dump(run, f, indent=2)
+        print(f"💾 Baseline saved to {path}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
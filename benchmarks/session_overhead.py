@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Session Backend Benchmark
+Measures per-request session overhead (load + save) for each SESSION_TYPE by
+driving a route that reads the session and, optionally, writes to it.
+
+Usage: python benchmarks/session_overhead.py [--requests 2000] [--write-every 10]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+BACKENDS = ['filesystem', 'cookie', 'sqlalchemy']
+
+
+def make_app(session_type, workdir):
+    class BenchConfig(config.TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{os.path.join(workdir, "sessions.db")}'
+        SESSION_TYPE = session_type
+        SESSION_FILE_DIR = os.path.join(workdir, 'flask_session')
+        WTF_CSRF_ENABLED = False
+
+    config.config['bench'] = BenchConfig
+    from app import create_app, db
+    from flask import session
+
+    app = create_app('bench')
+    with app.app_context():
+        db.create_all()
+
+    @app.route('/_bench/session/<int:write>')
+    def bench_session(write):
+        if write or 'user_id' not in session:
+            session['user_id'] = 1
+            session['counter'] = session.get('counter', 0) + 1
+        return str(session.get('user_id'))
+
+    return app
+
+
+def run(session_type, requests, write_every):
+    workdir = tempfile.mkdtemp()
+    try:
+        app = make_app(session_type, workdir)
+        client = app.test_client()
+        client.get('/_bench/session/1')
+
+        start = time.perf_counter()
+        for i in range(requests):
+            client.get(f'/_bench/session/{int(i % write_every == 0)}')
+        elapsed = time.perf_counter() - start
+
+        files = 0
+        session_dir = os.path.join(workdir, 'flask_session')
+        if os.path.isdir(session_dir):
+            files = len(os.listdir(session_dir))
+        return elapsed / requests * 1e6, files
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--write-every', type=int, default=10, help='write the session on every Nth request')
+    args = parser.parse_args()
+
+    print(f"⏱️  {args.requests} requests per backend, session written every {args.write_every} request(s)")
+    results = {}
+    for backend in BACKENDS:
+        per_request, files = run(backend, args.requests, args.write_every)
+        results[backend] = per_request
+        extra = f"  ({files} session files left on disk)" if backend == 'filesystem' else ""
+        print(f"   {backend:<11} {per_request:8.1f} µs/request{extra}")
+
+    base = results['filesystem']
+    for backend in BACKENDS[1:]:
+        print(f"   {backend} vs filesystem: {base / results[backend]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+SQLite Mixed Read/Write Benchmark
+Runs listing/detail reads and join/leave/comment writes from several worker
+processes against one SQLite file, once per SQLite configuration: the
+'default' profile (rollback journal), the 'production' profile (WAL and
+friends) and 'production' with the serialized writer queue. Each
+configuration starts from a fresh copy of the same dataset.
+
+Usage: python benchmarks/sqlite_mixed.py [--workers 4] [--seconds 10] [--write-ratio 0.2]
+       [--events 2000] [--configs default,production,production+queue]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from dataset import bench_config, build_dataset
+
+CONFIGS = {
+    'default': {'SQLITE_PROFILE': 'default', 'SQLITE_WRITE_QUEUE': False},
+    'production': {'SQLITE_PROFILE': 'production', 'SQLITE_WRITE_QUEUE': False},
+    'production+queue': {'SQLITE_PROFILE': 'production', 'SQLITE_WRITE_QUEUE': True},
+}
+
+
+def make_app(db_path, settings):
+    # Reads must reach the database, so the application cache is off
+    config.config['sqlite_mixed'] = type('MixedConfig', (bench_config(f'sqlite:///{db_path}', False),), settings)
+    from app import create_app
+    return create_app('sqlite_mixed')
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def work(args):
+    db_path, settings, worker, start_at, seconds, write_ratio, users, events = args
+    from sqlalchemy.exc import OperationalError
+    from app import db
+    from app.services.event_service import EventService
+    from app.services.sqlite_tuning import WriterBusy
+
+    app = make_app(db_path, settings)
+    rng = random.Random(worker)
+    result = {'reads': 0, 'writes': 0, 'locked': 0, 'busy': 0, 'write_latencies': []}
+
+    with app.app_context():
+        time.sleep(max(0.0, start_at - time.time()))
+        deadline = time.time() + seconds
+        while time.time() < deadline:
+            user_id = rng.randint(1, users)
+            event_id = rng.randint(1, events)
+            started = time.perf_counter()
+            try:
+                if rng.random() < write_ratio:
+                    if rng.random() < 0.5:
+                        success, message = EventService.add_comment(user_id, event_id, f'Comment from worker {worker}')
+                    else:
+                        success, message = EventService.join_event(user_id, event_id)
+                        if not success and 'already' in message:
+                            success, message = EventService.leave_event(user_id, event_id)
+                    result['writes'] += 1
+                    result['write_latencies'].append(time.perf_counter() - started)
+                else:
+                    EventService.get_listing_page('upcoming', viewer_id=user_id)
+                    EventService.get_event_with_details(event_id, user_id)
+                    result['reads'] += 1
+            except WriterBusy:
+                result['busy'] += 1
+            except OperationalError:
+                # "database is locked": the write (or read) is lost, as it would be for a user
+                db.session.rollback()
+                result['locked'] += 1
+            finally:
+                db.session.remove()
+    return result
+
+
+def run(name, pristine_path, args):
+    db_path = os.path.join(tempfile.mkdtemp(), 'mixed.db')
+    shutil.copy(pristine_path, db_path)
+
+    start_at = time.time() + 3  # lets every worker finish building its app first
+    jobs = [(db_path, CONFIGS[name], worker, start_at, args.seconds, args.write_ratio, args.users, args.events)
+            for worker in range(args.workers)]
+    with Pool(args.workers) as pool:
+        results = pool.map(work, jobs)
+
+    totals = {key: sum(r[key] for r in results) for key in ('reads', 'writes', 'locked', 'busy')}
+    latencies = [latency for r in results for latency in r['write_latencies']]
+    shutil.rmtree(os.path.dirname(db_path), ignore_errors=True)
+    return {
+        'reads_per_sec': totals['reads'] / args.seconds,
+        'writes_per_sec': totals['writes'] / args.seconds,
+        'locked': totals['locked'],
+        'busy': totals['busy'],
+        'write_p50_ms': percentile(latencies, 50) * 1000,
+        'write_p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--configs', default=','.join(CONFIGS),
+                        help=f"comma-separated, from: {', '.join(CONFIGS)}")
+    args = parser.parse_args()
+
+    names = args.configs.split(',')
+    unknown = [name for name in names if name not in CONFIGS]
+    if unknown:
+        parser.error(f"unknown config(s): {', '.join(unknown)}")
+
+    pristine_path = os.path.join(tempfile.mkdtemp(), 'pristine.db')
+    build_dataset(f'sqlite:///{pristine_path}', users=args.users, events=args.events,
+                  participations=args.events * 5, comments=args.events * 2)
+
+    print(f"\n🏋️  {args.workers} workers, {args.seconds:g}s each, {args.write_ratio:.0%} writes\n")
+    print(f"{'config':<18} {'reads/s':>9} {'writes/s':>9} {'locked':>7} {'busy':>5} {'write p50':>10} {'write p99':>10}")
+    for name in names:
+        r = run(name, pristine_path, args)
+        print(f"{name:<18} {r['reads_per_sec']:>9.0f} {r['writes_per_sec']:>9.0f} {r['locked']:>7} {r['busy']:>5} "
+              f"{r['write_p50_ms']:>8.1f}ms {r['write_p99_ms']:>8.1f}ms")
+
+    shutil.rmtree(os.path.dirname(pristine_path), ignore_errors=True)
+    print("\n'locked' counts operations that failed with \"database is locked\";"
+          " 'busy' counts writes the queue turned away after SQLITE_WRITE_QUEUE_TIMEOUT.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Query Plan Check
+Runs every read path in EventService, captures the SQL it sends and EXPLAINs
+each statement against the configured database. Exits non-zero if any
+statement falls back to a full table scan.
+"""
+
+import os
+import re
+import sys
+from dotenv import load_dotenv
+from sqlalchemy import event
+
+load_dotenv()
+
+from app import create_app, db
+
+# SQLite: "SCAN events" (full table scan) vs "SCAN events USING [COVERING] INDEX ..."
+SQLITE_TABLE_SCAN = re.compile(r'\bSCAN (\w+)\b(?! USING)(?! VIRTUAL TABLE)')
+# PostgreSQL: "Seq Scan on events"
+POSTGRES_TABLE_SCAN = re.compile(r'Seq Scan on (\w+)')
+
+
+def capture_statements(engine, calls):
+    """Runs the callables and returns the (statement, parameters) pairs they execute"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            captured.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        for call in calls:
+            call()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return captured
+
+
+def explain(conn, dialect, statement, parameters):
+    if dialect == 'sqlite':
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        plan = "\n".join(row[-1] for row in rows)
+        scans = SQLITE_TABLE_SCAN.findall(plan)
+    else:
+        rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).fetchall()
+        plan = "\n".join(row[0] for row in rows)
+        scans = POSTGRES_TABLE_SCAN.findall(plan)
+    return plan, scans
+
+
+def check_query_plans():
+    from app.services.event_service import EventService
+    from app.models.models import Event, User
+
+    sample_event = db.session.query(Event.id, Event.user_id, Event.title, Event.date).first()
+    sample_user_id = sample_event.user_id if sample_event else 1
+    sample_event_id = sample_event.id if sample_event else 1
+
+    def listing(page):
+        EventService.load_listing(page.items, sample_user_id)
+
+    calls = [
+        lambda: listing(EventService.get_upcoming_events(sample_user_id)),
+        lambda: listing(EventService.get_upcoming_events(sample_user_id, category_filter='Tech')),
+        lambda: listing(EventService.get_upcoming_events(sample_user_id, search_query='meetup')),
+        lambda: listing(EventService.get_past_events(sample_user_id)),
+        lambda: listing(EventService.get_past_events(sample_user_id, category_filter='Tech')),
+        lambda: listing(EventService.get_past_events(sample_user_id, search_query='meetup')),
+        lambda: EventService.get_all_categories(),
+        lambda: EventService.get_event_with_details(sample_event_id),
+        lambda: EventService.get_comments(sample_event_id),
+        lambda: EventService.get_user_created_events(sample_user_id),
+        lambda: EventService.get_user_joined_events(sample_user_id),
+        lambda: EventService.get_profile(sample_user_id),
+        lambda: db.session.get(User, sample_user_id),
+    ]
+
+    dialect = db.engine.dialect.name
+    statements = capture_statements(db.engine, calls)
+
+    failures = 0
+    with db.engine.connect() as conn:
+        for statement, parameters in statements:
+            plan, scans = explain(conn, dialect, statement, parameters)
+            status = "❌" if scans else "✅"
+            failures += bool(scans)
+            print(f"{status} {' '.join(statement.split())[:110]}")
+            for line in plan.splitlines():
+                print(f"      {line}")
+
+    print()
+    if failures:
+        print(f"❌ {failures} of {len(statements)} statements scan a table without an index.")
+    else:
+        print(f"✅ All {len(statements)} statements use an index.")
+    return failures == 0
+
+
+if __name__ == "__main__":
+    app = create_app(os.environ.get('FLASK_ENV', 'development'))
+    with app.app_context():
+        ok = check_query_plans()
+    sys.exit(0 if ok else 1)
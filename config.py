@@ -2,21 +2,160 @@ import os
 from datetime import timedelta
 
 
+def database_url(url):
+    """Heroku/Render-style postgres:// URLs are spelled postgresql:// for SQLAlchemy"""
+    if url and url.startswith('postgres://'):
+        return 'postgresql://' + url[len('postgres://'):]
+    return url
+
+
 class Config:
     """Base configuration"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     
     # Session configuration
+    # 'cookie' (signed cookie, no server storage), 'sqlalchemy' (server_sessions table,
+    # shared across workers) or any Flask-Session backend such as the legacy 'filesystem'
     SESSION_PERMANENT = False
-    SESSION_TYPE = 'filesystem'
+    SESSION_TYPE = os.environ.get('SESSION_TYPE', 'cookie')
     PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
+    SESSION_SWEEP_INTERVAL = 300  # seconds between expired-session sweeps
+    SESSION_SWEEP_BATCH = 500     # rows deleted per sweep statement
     
     # Database configuration - Use absolute path
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     DB_PATH = os.path.join(BASE_DIR, 'orbit.db')
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or f'sqlite:///{DB_PATH}'
+    SQLALCHEMY_DATABASE_URI = database_url(os.environ.get('DATABASE_URL')) or f'sqlite:///{DB_PATH}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection pool per worker process (PostgreSQL; SQLite keeps SQLAlchemy's defaults).
+    # workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) must stay under the server's max_connections.
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = 30                 # seconds to wait for a free connection
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))  # below the server/proxy idle timeout
+    DB_POOL_PRE_PING = True              # test connections on checkout, replacing dropped ones
+    
+    # Read replicas (app/services/db_routing.py)
+    # Read-only EventService calls go to one of these; a user's reads stay on the
+    # primary for REPLICA_STICKY_SECONDS after their own write
+    DATABASE_REPLICA_URLS = [database_url(url.strip()) for url in
+                             os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+    
+    # SQLite tuning (app/services/sqlite_tuning.py)
+    # 'default' leaves SQLite's rollback journal alone; 'production' applies WAL,
+    # synchronous=NORMAL, busy_timeout, mmap and cache sizes and foreign keys
+    SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'default')
+    SQLITE_PRAGMAS = {}                  # per-PRAGMA overrides of the profile
+    SQLITE_WRITE_QUEUE = os.environ.get('SQLITE_WRITE_QUEUE', '').lower() in ('1', 'true', 'yes')
+    SQLITE_WRITE_QUEUE_TIMEOUT = 10.0    # seconds a writer waits for its turn
+    
+    # ASGI serving mode (asgi.py, app/async_app.py)
+    # The public JSON reads run on the event loop through an async driver; every
+    # other route runs in the Flask app on a pool of ASGI_WSGI_THREADS threads
+    ASYNC_DATABASE_URL = database_url(os.environ.get('ASYNC_DATABASE_URL'))  # default: DATABASE_URL via aiosqlite/asyncpg
+    ASGI_WSGI_THREADS = int(os.environ.get('ASGI_WSGI_THREADS', 10))
+    
+    # Listings (keyset pagination)
+    EVENTS_PER_PAGE = int(os.environ.get('EVENTS_PER_PAGE', 24))
+    EVENTS_MAX_PER_PAGE = 100
+    COMMENTS_PER_PAGE = int(os.environ.get('COMMENTS_PER_PAGE', 20))
+    
+    # Application cache (app/services/cache_service.py)
+    # The local tier is per process; other workers may serve an entry for up to
+    # CACHE_LOCAL_TTL seconds after it was invalidated.
+    CACHE_ENABLED = True
+    CACHE_LOCAL_TTL = int(os.environ.get('CACHE_LOCAL_TTL', 10))
+    CACHE_LOCAL_MAX_ENTRIES = 2048
+    # Optional shared tier: 'filesystem' (workers on one host) or 'redis'
+    CACHE_SHARED_TYPE = os.environ.get('CACHE_SHARED_TYPE') or None
+    CACHE_SHARED_DIR = os.path.join(BASE_DIR, 'cache')
+    CACHE_SHARED_TTL = 300
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+    CACHE_STATS_ENABLED = False
+    
+    # Rendered fragment cache (app/services/fragment_cache.py)
+    # Event cards and the detail modal body, per process, keyed by event id and version stamp
+    FRAGMENT_CACHE_ENABLED = True
+    FRAGMENT_CACHE_MAX_ENTRIES = 4096
+    FRAGMENT_CACHE_TTL = 600             # seconds; only evicts cold entries, a version's markup never changes
+    
+    # Password hashing (app/services/password_hasher.py)
+    # Stored hashes made with a different method/cost are upgraded at next login
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    PASSWORD_HASH_POOL = True            # False hashes inline on the request thread
+    PASSWORD_HASH_WORKERS = None         # pool processes per app process (default: min(4, CPUs))
+    PASSWORD_HASH_MAX_PENDING = 16       # queued + running operations before callers wait
+    PASSWORD_HASH_QUEUE_TIMEOUT = 2.0    # seconds to wait for a slot before HashingBusyError
+    
+    # SQL query profiler (app/services/query_profiler.py)
+    # Every response carries a Server-Timing header with query count and DB time
+    QUERY_PROFILER_ENABLED = True
+    QUERY_PROFILER_LOG = False       # log one JSON line per request
+    QUERY_PROFILER_SLOWEST = 5       # slowest statements kept per request
+    QUERY_PROFILER_HISTORY = 50      # recent requests shown at /_stats/queries
+    QUERY_STATS_ENABLED = False
+    QUERY_SLOW_MS = 100              # statements slower than this are logged
+    QUERY_BUDGET = None              # max queries per request (None: unlimited)
+    QUERY_BUDGET_ENDPOINTS = {}      # per-endpoint overrides of QUERY_BUDGET
+    QUERY_BUDGET_RAISE = False       # raise QueryBudgetExceeded instead of logging
+    
+    # Prometheus metrics (app/services/metrics.py), served at METRICS_PATH
+    # Under gunicorn, PROMETHEUS_MULTIPROC_DIR (see gunicorn.conf.py) makes every scrape cover all workers.
+    # Scrapes must come from METRICS_ALLOWED_IPS (addresses or networks) or send
+    # "Authorization: Bearer <METRICS_TOKEN>"; anyone else gets a 404. The same goes for /_stats/*.
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1').lower() in ('1', 'true', 'yes')
+    METRICS_PATH = '/metrics'
+    METRICS_ALLOWED_IPS = [ip.strip() for ip in os.environ.get('METRICS_ALLOWED_IPS', '').split(',') if ip.strip()]
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN') or None
+    
+    # Live updates for event detail modals (app/services/live_updates.py)
+    # 'memory' serves /events/<id>/live from each app process (a worker thread per
+    # viewer; switched off under gunicorn's sync workers, see gunicorn.conf.py);
+    # 'udp' publishes to live_server.py, which holds the connections
+    LIVE_UPDATES_ENABLED = True
+    LIVE_BROKER = os.environ.get('LIVE_BROKER', 'memory')
+    LIVE_BROKER_ADDRESS = os.environ.get('LIVE_BROKER_ADDRESS', '127.0.0.1:8765')
+    LIVE_STREAM_URL = os.environ.get('LIVE_STREAM_URL', '')  # live_server.py as browsers reach it ('' = this app)
+    LIVE_HISTORY = 50          # deltas kept per event for reconnects and long-polls
+    LIVE_HEARTBEAT = 15        # seconds between keep-alive comments on idle streams
+    LIVE_POLL_TIMEOUT = 25     # seconds a long-poll waits for a delta
+    
+    # Write and export rate limits (app/services/rate_limiter.py)
+    # Token buckets per user and per client IP: action -> (burst, per minute).
+    # 'memory' keeps them per process; 'sqlite' shares them between the workers on a host
+    RATE_LIMIT_ENABLED = True
+    RATE_LIMIT_STORE = os.environ.get('RATE_LIMIT_STORE', 'memory')
+    RATE_LIMIT_SQLITE_PATH = os.path.join(BASE_DIR, 'rate_limits.db')
+    RATE_LIMIT_MAX_KEYS = 100000         # buckets kept by the memory store
+    RATE_LIMIT_IP_MULTIPLIER = 5         # an IP's bucket is this many users' worth (NATs, shared offices)
+    RATE_LIMITS = {
+        'create': (5, 10),
+        'comment': (10, 20),
+        'join': (20, 60),
+        'leave': (20, 60),
+        'export': (2, 4),                # full-table downloads, anonymous callers included
+    }
+    
+    # Background jobs (app/services/jobs.py, worker.py)
+    # 'thread' runs queued jobs on a thread in each app process; 'external'
+    # leaves them to `python worker.py`
+    JOBS_RUNNER = os.environ.get('JOBS_RUNNER', 'thread')
+    JOBS_POLL_INTERVAL = 2.0             # seconds between checks for due jobs when idle
+    JOBS_VISIBILITY_TIMEOUT = 300        # seconds before a running job whose runner died is run again
+    JOBS_MAX_ATTEMPTS = 5                # default; a task can set its own
+    JOBS_RETRY_BACKOFF = 5               # seconds before the first retry, doubled for each later one
+    JOBS_KEEP_DONE = 86400               # seconds finished jobs stay visible
+    JOBS_STATS_ENABLED = False
+    
+    # Digest emails (app/services/digest_service.py; queue with `python worker.py digest`)
+    MAIL_SERVER = os.environ.get('MAIL_SERVER', 'localhost')
+    MAIL_PORT = int(os.environ.get('MAIL_PORT', 1025))  # a local stand-in: python -m aiosmtpd -n -l localhost:1025
+    MAIL_TIMEOUT = 10
+    MAIL_SENDER = os.environ.get('MAIL_SENDER', 'Orbit <no-reply@orbit.local>')
+    MAIL_RECIPIENT_DOMAIN = os.environ.get('MAIL_RECIPIENT_DOMAIN', 'orbit.local')
+    
     # Security
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
@@ -26,6 +165,13 @@ class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
     TESTING = False
+    DB_POOL_SIZE = 2
+    DB_MAX_OVERFLOW = 3
+    CACHE_STATS_ENABLED = True
+    QUERY_STATS_ENABLED = True
+    JOBS_STATS_ENABLED = True
+    QUERY_PROFILER_LOG = True
+    METRICS_ALLOWED_IPS = Config.METRICS_ALLOWED_IPS or ['127.0.0.1', '::1']
 
 
 class ProductionConfig(Config):
@@ -33,12 +179,25 @@ class ProductionConfig(Config):
     DEBUG = False
     TESTING = False
     SESSION_COOKIE_SECURE = True  # Require HTTPS in production
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'production')
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '').lower() in ('1', 'true', 'yes')
 
 
 class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///test.db'
+    # A route that regresses into per-row lookups fails instead of slowing down quietly
+    QUERY_BUDGET = 20
+    QUERY_BUDGET_ENDPOINTS = {
+        'main.index': 8,
+        'main.history': 8,
+        'main.profile': 8,
+        'events.detail': 8,
+    }
+    QUERY_BUDGET_RAISE = True
 
 
 # Configuration dictionary
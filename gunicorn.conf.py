@@ -0,0 +1,34 @@
+"""
+Gunicorn settings, picked up from the working directory by `gunicorn wsgi:app`.
+
+With PROMETHEUS_MULTIPROC_DIR set, every worker writes its metrics to files
+in that directory and /metrics adds them up (app/services/metrics.py). The
+directory is emptied when the master starts, so counters from a previous run
+don't carry over, and a worker's live gauges are dropped when it exits.
+
+Sync workers handle one request at a time, so they don't serve live-update
+streams (LIVE_BROKER=memory): one open event modal would hold a worker
+until it timed out. Use LIVE_BROKER=udp with live_server.py instead.
+"""
+
+import os
+import shutil
+
+
+def on_starting(server):
+    multiproc_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if multiproc_dir:
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def post_worker_init(worker):
+    if type(worker).__name__ == 'SyncWorker':
+        from app.services.live_updates import live_updates
+        live_updates.sync_workers = True
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Live Update Server
+Holds the browsers' Server-Sent Events and long-poll connections for event
+detail modals in one asyncio process, so thousands of idle viewers cost a
+socket each instead of a gunicorn worker. App workers publish deltas to it
+over UDP (LIVE_BROKER=udp); it serves the same /events/<id>/live and
+/events/<id>/updates endpoints as the app does with LIVE_BROKER=memory.
+
+Usage:
+    python live_server.py [--host 0.0.0.0] [--port 8001] [--broker 127.0.0.1:8765] [--allow-origin '*']
+
+Point LIVE_STREAM_URL at it (or route /events/<id>/live and /updates to it
+in the reverse proxy and leave LIVE_STREAM_URL empty).
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+from app.services.live_updates import Channel, parse_broker_address, sse_message
+
+ROUTE = re.compile(r'/events/(\d+)/(live|updates)')
+
+
+class LiveHub:
+    """asyncio counterpart of MemoryBroker: per-event channels whose waiters are woken on publish"""
+    def __init__(self, history=50, max_channels=10000):
+        self.history = history
+        self.max_channels = max_channels
+        self.channels = OrderedDict()
+        self.signals = {}
+        self.subscribers = 0
+        self.published = 0
+
+    def channel(self, event_id):
+        entry = self.channels.get(event_id)
+        if entry is None:
+            entry = self.channels[event_id] = Channel(self.history)
+            self.signals[event_id] = asyncio.Event()
+            while len(self.channels) > self.max_channels:
+                evicted, _ = self.channels.popitem(last=False)
+                self.signals.pop(evicted).set()
+        self.channels.move_to_end(event_id)
+        return entry
+
+    def publish(self, event_id, message):
+        self.channel(event_id).append(message)
+        self.published += 1
+        # Wake this channel's waiters and give the next ones a fresh signal
+        self.signals[event_id].set()
+        self.signals[event_id] = asyncio.Event()
+
+    async def wait(self, event_id, after, timeout):
+        """Same contract as MemoryBroker.wait"""
+        entry = self.channel(event_id)
+        if after is None:
+            after = entry.seq
+        deadline = time.monotonic() + timeout
+        while True:
+            entry = self.channel(event_id)
+            messages = entry.since(after)
+            remaining = deadline - time.monotonic()
+            if messages or remaining <= 0:
+                return messages, (messages[-1][0] if messages else min(after, entry.seq))
+            try:
+                await asyncio.wait_for(self.signals[event_id].wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+
+class BrokerProtocol(asyncio.DatagramProtocol):
+    """Receives {"channel": event_id, "message": {...}} datagrams from UdpPublisher"""
+    def __init__(self, hub):
+        self.hub = hub
+
+    def datagram_received(self, data, addr):
+        try:
+            payload = json.loads(data)
+            self.hub.publish(int(payload['channel']), payload['message'])
+        except (ValueError, KeyError, TypeError):
+            pass
+
+
+class LiveServer:
+    def __init__(self, hub, allow_origin='*', heartbeat=15, poll_timeout=25):
+        self.hub = hub
+        self.allow_origin = allow_origin
+        self.heartbeat = heartbeat
+        self.poll_timeout = poll_timeout
+
+    async def handle(self, reader, writer):
+        try:
+            method, target, headers = await self._read_request(reader)
+            url = urlsplit(target)
+            match = ROUTE.fullmatch(url.path)
+            if method == 'GET' and url.path == '/stats':
+                await self._send_json(writer, 200, {
+                    'subscribers': self.hub.subscribers,
+                    'channels': len(self.hub.channels),
+                    'published': self.hub.published,
+                })
+            elif method != 'GET' or not match:
+                await self._send_json(writer, 404, {'error': 'Not found'})
+            elif match.group(2) == 'live':
+                await self._stream(writer, int(match.group(1)), _int(headers.get('last-event-id')))
+            else:
+                after = _int(parse_qs(url.query).get('after', [None])[0])
+                await self._poll(writer, int(match.group(1)), after)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        request_line = await asyncio.wait_for(reader.readline(), 10)
+        method, target, _ = request_line.decode('latin-1').split(' ', 2)
+        headers = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), 10)
+            if line in (b'\r\n', b'\n', b''):
+                return method, target, headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    def _head(self, status, content_type, extra=''):
+        reason = {200: 'OK', 404: 'Not Found'}[status]
+        return (f"HTTP/1.1 {status} {reason}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Cache-Control: no-store\r\n"
+                f"Access-Control-Allow-Origin: {self.allow_origin}\r\n"
+                f"{extra}").encode()
+
+    async def _send_json(self, writer, status, body):
+        data = json.dumps(body, separators=(',', ':')).encode()
+        writer.write(self._head(status, 'application/json', f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n"))
+        writer.write(data)
+        await writer.drain()
+
+    async def _stream(self, writer, event_id, after):
+        writer.write(self._head(200, 'text/event-stream', "Connection: keep-alive\r\nX-Accel-Buffering: no\r\n\r\n"))
+        writer.write(b"retry: 3000\n\n")
+        await writer.drain()
+        self.hub.subscribers += 1
+        try:
+            while True:
+                messages, after = await self.hub.wait(event_id, after, self.heartbeat)
+                if not messages:
+                    writer.write(b": keep-alive\n\n")
+                for seq, message in messages:
+                    writer.write(sse_message(seq, message).encode())
+                # A closed connection surfaces here, at the latest with the next heartbeat
+                await writer.drain()
+                if writer.is_closing():
+                    return
+        finally:
+            self.hub.subscribers -= 1
+
+    async def _poll(self, writer, event_id, after):
+        self.hub.subscribers += 1
+        try:
+            messages, cursor = await self.hub.wait(event_id, after, self.poll_timeout)
+        finally:
+            self.hub.subscribers -= 1
+        await self._send_json(writer, 200, {
+            'data': [dict(message, seq=seq) for seq, message in messages],
+            'cursor': cursor,
+        })
+
+
+def _int(value):
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+async def serve(args):
+    hub = LiveHub(history=args.history)
+    server = LiveServer(hub, allow_origin=args.allow_origin, heartbeat=args.heartbeat,
+                        poll_timeout=args.poll_timeout)
+    loop = asyncio.get_running_loop()
+    await loop.create_datagram_endpoint(lambda: BrokerProtocol(hub), local_addr=parse_broker_address(args.broker))
+    http = await asyncio.start_server(server.handle, args.host, args.port, backlog=2048)
+    print(f"📡 Live updates on http://{args.host}:{args.port}, deltas from udp://{args.broker}")
+    async with http:
+        await http.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--broker', default='127.0.0.1:8765', help='UDP address app workers publish to')
+    parser.add_argument('--allow-origin', default='*', help='Access-Control-Allow-Origin for browsers on the app domain')
+    parser.add_argument('--history', type=int, default=50, help='deltas kept per event')
+    parser.add_argument('--heartbeat', type=float, default=15)
+    parser.add_argument('--poll-timeout', type=float, default=25)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+
+
+if __name__ == "__main__":
+    main()
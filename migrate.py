@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Database Migrations
+Creates or upgrades the schema of DATABASE_URL (SQLite or PostgreSQL) with
+the versioned migrations in app/migrations/versions.
+
+Usage:
+    python migrate.py [upgrade] [--to VERSION] [--batch-size 5000]
+    python migrate.py status     # applied and pending migrations with timings
+    python migrate.py check      # compare the models with the live schema
+"""
+
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app, db
+from app import migrations
+
+
+def status(engine):
+    applied = migrations.applied(engine)
+    for row in applied:
+        print(f"   ✅ {row.version:04d} {row.name:<28} {row.applied_at:%Y-%m-%d %H:%M}  {row.duration_ms:>7} ms")
+    for migration in migrations.pending(engine):
+        print(f"   ⏳ {migration.version:04d} {migration.name:<28} pending")
+    print(f"Schema version {migrations.current_version(engine)} of {migrations.latest_version()}")
+
+
+def check(engine):
+    problems = migrations.drift(engine, db.metadata)
+    for problem in problems:
+        print(f"   ❌ {problem}")
+    if problems:
+        print("Models and database disagree; add a migration.")
+        return False
+    print("✅ Models match the database schema.")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('command', nargs='?', choices=('upgrade', 'status', 'check'), default='upgrade')
+    parser.add_argument('--to', type=int, metavar='VERSION', help='stop after this version')
+    parser.add_argument('--batch-size', type=int, default=migrations.BACKFILL_BATCH_SIZE,
+                        help='rows per backfill batch')
+    args = parser.parse_args()
+
+    app = create_app(os.environ.get('FLASK_ENV', 'development'))
+    with app.app_context():
+        engine = db.engine
+        print(f"📦 {engine.url.render_as_string(hide_password=True)}")
+        if args.command == 'status':
+            status(engine)
+        elif args.command == 'check':
+            sys.exit(0 if check(engine) else 1)
+        else:
+            migrations.upgrade(engine, target=args.to, batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Counter Reconciliation
+Rewrites events.participants_count and events.comments_count from the
+event_participants and comments tables for any event whose stored counter has
+drifted (manual SQL edits, restored backups...).
+"""
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app
+
+
+def reconcile():
+    from app.services.event_service import EventService
+
+    print("🔢 Reconciling participant and comment counters...")
+    fixed = EventService.reconcile_participant_counts() + EventService.reconcile_comment_counts()
+    if fixed:
+        print(f"✅ Fixed {fixed} drifted counter(s).")
+    else:
+        print("✅ All counters already match.")
+    return fixed
+
+
+if __name__ == "__main__":
+    app = create_app(os.environ.get('FLASK_ENV', 'development'))
+    with app.app_context():
+        reconcile()
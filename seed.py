@@ -1,50 +1,155 @@
-import sys
+#!/usr/bin/env python3
+"""
+Database Seeding
+Creates the admin user, generates synthetic data or bulk-imports users,
+events, participants and comments from CSV/JSONL files.
+
+Usage:
+    python seed.py admin [--username admin@admin.com] [--password admin123]
+    python seed.py generate [--users 1000] [--events 10000] [--participations 50000] [--comments 20000]
+    python seed.py import DIR    # DIR holds users/events/participants/comments .csv or .jsonl
+
+generate/import accept --batch-size and --resume (continue an interrupted
+load from its checkpoint file).
+"""
+
+import argparse
 import os
+import sys
+import time
 
 # Ensure the app module can be found
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
-import app as application_module 
-from werkzeug.security import generate_password_hash
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app, db
+from app import migrations
+
+CHECKPOINT_FILE = 'seed.checkpoint.json'
+
+
+def seed_admin(username, password):
+    from app.models.models import User
+    from app.services.password_hasher import password_hasher
+
+    migrations.upgrade(db.engine)
+    print(f"👤 Target user: {username}")
+    user = User.query.filter_by(username=username).first()
+    if user:
+        print(f"⚠️ User '{username}' already exists. Updating password...")
+        user.hash = password_hasher.hash(password)
+    else:
+        print(f"👤 Creating user '{username}'...")
+        db.session.add(User(username=username, hash=password_hasher.hash(password)))
+    db.session.commit()
+    print("✅ Seeding completed successfully!")
+
+
+def find_sources(directory):
+    """Maps each table name to its users.csv / users.jsonl style file in `directory`"""
+    from app.services.bulk_loader import TABLES
+
+    sources = {}
+    for name in TABLES:
+        for extension in ('.jsonl', '.csv'):
+            path = os.path.join(directory, name + extension)
+            if os.path.exists(path):
+                sources[name] = path
+                break
+    return sources
+
+
+def bulk_load(make_streams, args):
+    """
+    Loads the {name: (rows, total)} returned by make_streams(loader) in table
+    order, then fixes counters and statistics
+    """
+    from app.services.bulk_loader import BulkLoader, TABLES
+    from app.services.event_service import EventService
+    from app.services.cache_service import cache
+
+    migrations.upgrade(db.engine)
+    loader = BulkLoader(db.engine, batch_size=args.batch_size, checkpoint_path=args.checkpoint, resume=args.resume)
+    if loader.done:
+        print(f"↩️  Resuming from checkpoint: {loader.done}")
+
+    started = time.perf_counter()
+    with loader.session():
+        streams = make_streams(loader)
+        for name in TABLES:
+            if name in streams:
+                rows, total = streams[name]
+                loader.load(name, rows, total)
+        loader.finish()
+
+    if 'participants' in streams:
+        print("🔢 Reconciling participant counters...")
+        EventService.reconcile_participant_counts()
+    if 'comments' in streams:
+        print("🔢 Reconciling comment counters...")
+        EventService.reconcile_comment_counts()
+    cache.clear()
+    print(f"✅ Loaded in {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    admin = commands.add_parser('admin', help='create or update the admin user')
+    admin.add_argument('--username', default='admin@admin.com')
+    admin.add_argument('--password', default='admin123')
+
+    load_options = argparse.ArgumentParser(add_help=False)
+    load_options.add_argument('--batch-size', type=int, default=10000)
+    load_options.add_argument('--checkpoint', default=CHECKPOINT_FILE)
+    load_options.add_argument('--resume', action='store_true', help='continue from the checkpoint file')
+
+    generate = commands.add_parser('generate', parents=[load_options], help='generate synthetic data')
+    generate.add_argument('--users', type=int, default=1000)
+    generate.add_argument('--events', type=int, default=10000)
+    generate.add_argument('--participations', type=int, default=50000)
+    generate.add_argument('--comments', type=int, default=20000)
+    generate.add_argument('--password', default='password', help='password of every generated user')
+    generate.add_argument('--seed', type=int, default=42)
+
+    importer = commands.add_parser('import', parents=[load_options], help='import CSV/JSONL files')
+    importer.add_argument('directory')
+
+    args = parser.parse_args()
 
-def seed():
-    # Initialize the app which sets up the database connection
-    flask_app = application_module.create_app()
-    
     print("🌱 Seeding database...")
-    
-    # User details
-    username = "admin@admin.com" # Using email as username
-    password = "admin123"
-    
-    print(f"   Target User: {username}")
-    
-    # generate_password_hash default method is usually pbkdf2:sha256 in newer werkzeug
-    hashed_password = generate_password_hash(password)
-    
-    # Check if user exists
-    try:
-        # Access db from the module where it was initialized
-        db = application_module.db
-        
-        if db is None:
-            print("❌ Error: Database connection (db) is still None after create_app().")
+    flask_app = create_app(os.environ.get('FLASK_ENV', 'development'))
+    with flask_app.app_context():
+        if args.command == 'admin':
+            seed_admin(args.username, args.password)
             return
 
-        existing_user = db.execute("SELECT * FROM users WHERE username = ?", username)
-        
-        if existing_user:
-            print(f"⚠️ User '{username}' already exists. Updating password...")
-            db.execute("UPDATE users SET hash = ? WHERE username = ?", hashed_password, username)
+        from app.services.bulk_loader import read_rows, synthetic_rows
+        from app.services.password_hasher import password_hasher
+
+        if args.command == 'generate':
+            password_hash = password_hasher.hash(args.password)
+
+            def make_streams(loader):
+                return synthetic_rows(
+                    args.users, args.events, args.participations, args.comments,
+                    password_hash, seed=args.seed, first_ids=loader.next_ids()
+                )
         else:
-            print(f"👤 Creating user '{username}'...")
-            db.execute("INSERT INTO users (username, hash) VALUES (?, ?)", username, hashed_password)
-            
-        print("✅ Seeding completed successfully!")
-        print("ℹ️  Note: 'role' field was skipped as it does not exist in the 'users' table schema.")
-        
-    except Exception as e:
-        print(f"❌ Error during seeding: {e}")
+            sources = find_sources(args.directory)
+            if not sources:
+                print(f"❌ No users/events/participants/comments .csv or .jsonl files in {args.directory}")
+                sys.exit(1)
+            print(f"📂 Importing {', '.join(os.path.basename(p) for p in sources.values())}")
+
+            def make_streams(loader):
+                return {name: (read_rows(path, name, password_hasher.hash), None) for name, path in sources.items()}
+        bulk_load(make_streams, args)
+
 
 if __name__ == "__main__":
-    seed()
+    main()
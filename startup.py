@@ -1,32 +1,41 @@
 #!/usr/bin/env python3
 """
 Startup script for production deployment
-Ensures database is initialized before starting the application
+Brings the database schema up to date before the application starts.
+An up-to-date schema costs one query; DDL only runs when migrations are pending.
 """
 
 import os
 import sys
-from init_db import init_database
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app, db
+from app import migrations
+
 
 def startup():
-    """Initialize database and prepare for production"""
+    """Check the schema version and apply pending migrations"""
     print("🚀 Starting Orbit Mini...")
-    
-    # Get database path from environment or use default
-    db_path = os.environ.get('DATABASE_URL', 'sqlite:///orbit.db')
-    if db_path.startswith('sqlite:///'):
-        db_path = db_path.replace('sqlite:///', '')
-    
-    # Initialize database
-    try:
-        init_database(db_path)
-        print("✅ Database ready")
-    except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
-        sys.exit(1)
-    
+
+    app = create_app(os.environ.get('FLASK_ENV', 'production'))
+    with app.app_context():
+        try:
+            current, latest = migrations.current_version(db.engine), migrations.latest_version()
+            if current >= latest:
+                print(f"✅ Database ready (schema version {current})")
+            else:
+                print(f"📦 Migrating schema from version {current} to {latest}...")
+                migrations.upgrade(db.engine)
+                print("✅ Database ready")
+        except Exception as e:
+            print(f"❌ Database initialization failed: {e}")
+            sys.exit(1)
+
     print("✅ Startup complete!")
     return True
 
+
 if __name__ == "__main__":
     startup()
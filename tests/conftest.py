@@ -0,0 +1,32 @@
+import pytest
+
+import config
+from app import create_app, db, migrations
+
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(config.TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        WTF_CSRF_ENABLED = False
+        JOBS_RUNNER = 'external'
+        PASSWORD_HASH_POOL = False
+
+    config.config['pytest'] = TestConfig
+    app = create_app('pytest')
+    with app.app_context():
+        migrations.upgrade(db.engine, log=lambda message: None)
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def users(app):
+    from app.services.auth_service import AuthService
+    return [AuthService.register_user(f'user{i}', 'password123') for i in range(3)]
@@ -0,0 +1,73 @@
+from datetime import date, timedelta
+
+from app.services.event_service import EventService
+
+
+def add_events(host, count, **data):
+    ids = []
+    for i in range(count):
+        event, _, _ = EventService.create_event(
+            host.id, {'title': f'Event {i}', 'date': date.today() + timedelta(days=i + 1), **data})
+        ids.append(event.id)
+    return ids
+
+
+def test_default_fieldset(app, client, users):
+    add_events(users[0], 1, description='Long text')
+    body = client.get('/api/v1/events').get_json()
+    assert list(body['data'][0]) == ['id', 'title', 'date', 'time', 'category', 'capacity',
+                                     'participants_count', 'location_name', 'image_url']
+    assert body['data'][0]['date'] == (date.today() + timedelta(days=1)).isoformat()
+
+
+def test_requested_fields_only(app, client, users):
+    event_id = add_events(users[0], 1)[0]
+    body = client.get('/api/v1/events?fields=title,creator').get_json()
+    assert body['data'] == [{'title': 'Event 0', 'creator': 'user0'}]
+
+    detail = client.get(f'/api/v1/events/{event_id}?fields=id,comments_count').get_json()
+    assert detail == {'data': {'id': event_id, 'comments_count': 0}}
+
+
+def test_unknown_field_is_rejected(app, client, users):
+    response = client.get('/api/v1/events?fields=title,password_hash')
+    assert response.status_code == 400
+    assert 'password_hash' in response.get_json()['error']
+
+
+def test_cursors_walk_every_page(app, client, users):
+    expected = add_events(users[0], 5)
+    seen, url = [], '/api/v1/events?fields=id&per_page=2'
+    while True:
+        body = client.get(url).get_json()
+        seen += [row['id'] for row in body['data']]
+        if not body['next_cursor']:
+            break
+        url = f"/api/v1/events?fields=id&per_page=2&after={body['next_cursor']}"
+    assert seen == expected
+
+    back = client.get(f"/api/v1/events?fields=id&per_page=2&before={body['prev_cursor']}").get_json()
+    assert [row['id'] for row in back['data']] == expected[2:4]
+
+
+def test_comment_cursor_and_missing_event(app, client, users):
+    event_id = add_events(users[0], 1)[0]
+    for i in range(3):
+        EventService.add_comment(users[0].id, event_id, f'Comment {i}')
+
+    first = client.get(f'/api/v1/events/{event_id}/comments?per_page=2').get_json()
+    assert [c['content'] for c in first['data']] == ['Comment 2', 'Comment 1']
+    rest = client.get(f"/api/v1/events/{event_id}/comments?per_page=2&after={first['next_cursor']}").get_json()
+    assert ([c['content'] for c in rest['data']], rest['next_cursor']) == (['Comment 0'], None)
+
+    assert client.get('/api/v1/events/999/comments').status_code == 404
+    assert client.get('/api/v1/events/999').status_code == 404
+
+
+def test_my_events_needs_login(app, client, users):
+    event_id = add_events(users[0], 1)[0]
+    assert client.get('/api/v1/me/events').status_code == 401
+    with client.session_transaction() as session:
+        session['user_id'] = users[0].id
+    assert [e['id'] for e in client.get('/api/v1/me/events?role=created').get_json()['data']] == [event_id]
+    assert client.get('/api/v1/me/events').get_json()['data'] == []
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+from app.services.cache_service import TTLLRUCache, cache
+from app.services.event_service import EventService
+
+
+def new_event(host, title='Meetup', **data):
+    event, _, created = EventService.create_event(host.id, {'title': title, 'date': date.today() + timedelta(days=7), **data})
+    assert created
+    return event.id
+
+
+def listing_ids():
+    return [card.id for card in EventService.get_listing_page('upcoming')]
+
+
+def test_ttl_lru_cache_expires_and_evicts():
+    local = TTLLRUCache(maxsize=2, ttl=60)
+    local.set('a', 1)
+    local.set('b', 2)
+    local.get('a')
+    local.set('c', 3)  # evicts b, the least recently used
+    assert (local.get('a'), local.get('b'), local.get('c')) == (1, None, 3)
+
+    local.set('d', 4, ttl=-1)
+    assert local.get('d', 'missing') == 'missing'
+
+
+def test_listing_is_served_from_cache_until_an_event_is_created(app, users):
+    first = new_event(users[0], 'First')
+    assert listing_ids() == [first]
+    misses = cache.stats()['misses']
+    assert listing_ids() == [first]
+    assert cache.stats()['misses'] == misses
+
+    second = new_event(users[0], 'Second')
+    assert listing_ids() == [first, second]
+
+
+def test_deleted_event_leaves_listing_and_categories(app, users):
+    event_id = new_event(users[0], category='Sports')
+    assert listing_ids() == [event_id]
+    assert EventService.get_all_categories() == ['Sports']
+
+    assert EventService.delete_event(users[0].id, event_id)[0]
+
+    assert listing_ids() == []
+    assert EventService.get_all_categories() == []
+    assert EventService.get_event_with_details(event_id) is None
+
+
+def test_new_category_shows_up_after_create(app, users):
+    new_event(users[0], 'Run', category='Sports')
+    assert EventService.get_all_categories() == ['Sports']
+    new_event(users[0], 'Jam', category='Music')
+    assert EventService.get_all_categories() == ['Music', 'Sports']
+
+
+def test_card_follows_joins_and_leaves(app, users):
+    host, guest = users[0], users[1]
+    event_id = new_event(host, capacity=2)
+    card = EventService.get_event_with_details(event_id, guest.id)
+    assert (card.participants_count, card.joined) == (0, False)
+
+    EventService.join_event(guest.id, event_id)
+    card = EventService.get_event_with_details(event_id, guest.id)
+    assert (card.participants_count, card.joined) == (1, True)
+    assert 'user1' in card.participant_names
+
+    EventService.leave_event(guest.id, event_id)
+    card = EventService.get_event_with_details(event_id, guest.id)
+    assert (card.participants_count, card.joined) == (0, False)
+
+
+def test_disabled_cache_always_queries(app, users, monkeypatch):
+    monkeypatch.setattr(cache, 'enabled', False)
+    event_id = new_event(users[0])
+    assert listing_ids() == [event_id]
+    cache.set('categories', ['Stale'])
+    assert cache.get('categories') is None
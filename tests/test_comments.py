@@ -0,0 +1,64 @@
+import re
+from datetime import date, timedelta
+
+from app.services.event_service import EventService
+
+
+def new_event(host):
+    event, _, _ = EventService.create_event(host.id, {'title': 'Meetup', 'date': date.today() + timedelta(days=7)})
+    return event.id
+
+
+def load_more_url(html):
+    match = re.search(r'data-load-more="([^"]+)"', html)
+    return match.group(1).replace('&amp;', '&') if match else None
+
+
+def test_comment_pages_cover_the_thread_newest_first(app, users):
+    event_id = new_event(users[0])
+    for i in range(7):
+        EventService.add_comment(users[i % 3].id, event_id, f'Comment {i}')
+
+    seen, cursor = [], None
+    while True:
+        page = EventService.get_comments_page(event_id, after=cursor, limit=3)
+        seen += [(c.content, c.username) for c in page.items]
+        cursor = page.next_cursor
+        if not cursor:
+            break
+    assert seen == [(f'Comment {i}', f'user{i % 3}') for i in reversed(range(7))]
+
+
+def test_comments_count_is_kept_on_the_event(app, users):
+    event_id = new_event(users[0])
+    for i in range(3):
+        EventService.add_comment(users[1].id, event_id, f'Comment {i}')
+    assert EventService.get_event_with_details(event_id).comments_count == 3
+
+
+def test_first_page_cache_is_refreshed_by_a_new_comment(app, users):
+    event_id = new_event(users[0])
+    EventService.add_comment(users[1].id, event_id, 'First')
+    assert [c.content for c in EventService.get_comments(event_id, 2)] == ['First']
+
+    EventService.add_comment(users[1].id, event_id, 'Second')
+    EventService.add_comment(users[1].id, event_id, 'Third')
+    page = EventService.get_comments(event_id, 2)
+    assert [c.content for c in page] == ['Third', 'Second']
+    assert page.next_cursor
+
+
+def test_load_more_follows_the_detail_page(app, client, users, monkeypatch):
+    monkeypatch.setitem(app.config, 'COMMENTS_PER_PAGE', 2)
+    event_id = new_event(users[0])
+    for i in range(5):
+        EventService.add_comment(users[1].id, event_id, f'Comment {i}')
+
+    html = client.get(f'/events/detail/{event_id}').get_data(as_text=True)
+    shown = re.findall(r'Comment \d', html)
+    url = load_more_url(html)
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        shown += re.findall(r'Comment \d', html)
+        url = load_more_url(html)
+    assert shown == [f'Comment {i}' for i in reversed(range(5))]
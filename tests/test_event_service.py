@@ -0,0 +1,104 @@
+from datetime import date, timedelta
+
+from app.services import event_service
+from app.services.event_service import EventService
+from app.services.jobs import jobs
+
+
+def new_event(host, title='Meetup', **data):
+    event, message, created = EventService.create_event(
+        host.id, {'title': title, 'date': date.today() + timedelta(days=7), **data})
+    assert created, message
+    return event.id
+
+
+def test_leave_soft_deleted_event_before_purge(app, users, monkeypatch):
+    host, guest = users[0], users[1]
+    event_id = new_event(host)
+    assert EventService.join_event(guest.id, event_id)[0]
+
+    monkeypatch.setattr(event_service, 'DELETE_INLINE_MAX_ROWS', 0)  # leave the rows to a purge_event job
+    assert EventService.delete_event(host.id, event_id)[0]
+
+    assert EventService.leave_event(guest.id, event_id) == (False, "Event not found")
+    assert jobs.run_pending() == 1
+    assert EventService.leave_event(guest.id, event_id) == (False, "You are not part of this event")
+
+
+def test_soft_deleted_event_comments_are_hidden(app, users, monkeypatch):
+    host = users[0]
+    event_id = new_event(host)
+    EventService.add_comment(host.id, event_id, 'See you there')
+    assert len(EventService.get_comments_page(event_id).items) == 1
+
+    monkeypatch.setattr(event_service, 'DELETE_INLINE_MAX_ROWS', 0)
+    EventService.delete_event(host.id, event_id)
+    assert EventService.get_comments_page(event_id).items == []
+
+
+def test_duplicate_event_is_rejected_until_deleted(app, users, monkeypatch):
+    host = users[0]
+    event_id = new_event(host)
+    event, _, created = EventService.create_event(host.id, {'title': 'Meetup', 'date': date.today() + timedelta(days=7)})
+    assert (event.id, created) == (event_id, False)
+    assert EventService.get_event_version(event_id) == 0  # a repeated submit doesn't invalidate ETags
+
+    monkeypatch.setattr(event_service, 'DELETE_INLINE_MAX_ROWS', -1)  # keep the soft-deleted row until the purge
+    EventService.delete_event(host.id, event_id)
+    assert new_event(host) != event_id
+
+
+def test_duplicate_submit_redirects_to_the_existing_event(app, users, client):
+    event_id = new_event(users[0])
+    with client.session_transaction() as session:
+        session['user_id'] = users[0].id
+    form = {'title': 'Meetup', 'date': (date.today() + timedelta(days=7)).isoformat(), 'category': 'General'}
+    response = client.post('/events/add', data=form)
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith(f'/events/detail/{event_id}')
+
+
+def test_comment_on_missing_or_deleted_event(app, users, monkeypatch):
+    from app.models.models import Comment
+    host = users[0]
+    assert EventService.add_comment(host.id, 999, 'Hello?') == (None, "Event not found")
+
+    event_id = new_event(host)
+    monkeypatch.setattr(event_service, 'DELETE_INLINE_MAX_ROWS', -1)
+    EventService.delete_event(host.id, event_id)
+    assert EventService.add_comment(host.id, event_id, 'Too late') == (None, "Event not found")
+    assert Comment.query.count() == 0
+
+
+def test_concurrent_joins_never_overbook(app, users):
+    import threading
+    from app import db
+    from app.models.models import Event, EventParticipant, User
+
+    capacity, guests = 3, 12
+    db.session.add_all(User(username=f'guest{i}', hash='-') for i in range(guests))
+    db.session.commit()
+    guest_ids = [user.id for user in User.query.filter(User.username.like('guest%'))]
+    event_id = new_event(users[0], capacity=capacity)
+
+    barrier = threading.Barrier(guests)
+    results = []
+
+    def join(user_id):
+        with app.app_context():
+            barrier.wait()
+            results.append(EventService.join_event(user_id, event_id)[0])
+            db.session.remove()
+
+    threads = [threading.Thread(target=join, args=(user_id,)) for user_id in guest_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    db.session.expire_all()
+    count = db.session.get(Event, event_id).participants_count
+    assert len(results) == guests  # every thread got an answer
+    assert count <= capacity
+    assert results.count(True) == count == capacity
+    assert EventParticipant.query.filter_by(event_id=event_id).count() == count
@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from app.services import export_service
+from app.services.event_service import EventService
+from app.services.export_service import ExportService
+
+
+def new_event(host, title, days=7, **data):
+    event, _, _ = EventService.create_event(host.id, {'title': title, 'date': date.today() + timedelta(days=days), **data})
+    return event.id
+
+
+def login(client, user):
+    with client.session_transaction() as session:
+        session['user_id'] = user.id
+
+
+def test_events_csv(app, client, users):
+    new_event(users[0], 'Picnic', category='Social')
+    new_event(users[1], 'Old', days=-7)
+
+    response = client.get('/export/events.csv?kind=upcoming')
+    assert response.status_code == 200
+    assert response.headers['Content-Disposition'] == 'attachment; filename="events-upcoming.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [(r['title'], r['creator'], r['category']) for r in rows] == [('Picnic', 'user0', 'Social')]
+    assert rows[0]['date'] == (date.today() + timedelta(days=7)).isoformat()
+
+
+def test_csv_formula_cells_are_quoted(app, users):
+    new_event(users[0], '=HYPERLINK("http://example.com")', description='-1+2')
+    rows = list(csv.DictReader(io.StringIO(''.join(ExportService.events('all', 'csv')))))
+    assert rows[0]['title'] == '\'=HYPERLINK("http://example.com")'
+    assert rows[0]['description'] == "'-1+2"
+
+    line = json.loads(''.join(ExportService.events('all', 'jsonl')))
+    assert line['title'] == '=HYPERLINK("http://example.com")'
+
+
+def test_export_streams_in_chunks(app, users, monkeypatch):
+    monkeypatch.setattr(export_service, 'EXPORT_CHUNK_ROWS', 2)
+    for i in range(5):
+        new_event(users[0], f'Event {i}', days=i + 1)
+    chunks = list(ExportService.events('all', 'jsonl'))
+    assert len(chunks) == 3
+    assert [json.loads(line)['title'] for line in ''.join(chunks).splitlines()] == [f'Event {i}' for i in range(5)]
+
+
+def test_events_export_is_rate_limited(app, client, users):
+    burst = app.config['RATE_LIMITS']['export'][0] * app.config['RATE_LIMIT_IP_MULTIPLIER']
+    statuses = [client.get('/export/events.jsonl').status_code for _ in range(burst + 1)]
+    assert statuses == [200] * burst + [429]
+    assert 'Retry-After' in client.get('/export/events.jsonl').headers
+
+
+def test_participants_for_the_organizer_only(app, client, users):
+    event_id = new_event(users[0], 'Picnic')
+    EventService.join_event(users[1].id, event_id)
+
+    login(client, users[1])
+    assert client.get(f'/export/events/{event_id}/participants.csv').status_code == 302
+
+    login(client, users[0])
+    response = client.get(f'/export/events/{event_id}/participants.jsonl')
+    assert [json.loads(line)['username'] for line in response.get_data(as_text=True).splitlines()] == ['user1']
+
+
+def test_calendar(app, client, users):
+    event_id = new_event(users[0], 'Picnic, with friends; bring food', description='x' * 100)
+    assert client.get('/export/calendar.ics').status_code == 302
+
+    EventService.join_event(users[1].id, event_id)
+    login(client, users[1])
+    body = client.get('/export/calendar.ics').get_data(as_text=True)
+    assert body.startswith('BEGIN:VCALENDAR\r\n') and body.endswith('END:VCALENDAR\r\n')
+    assert f'UID:event-{event_id}@orbit-mini' in body
+    assert r'SUMMARY:Picnic\, with friends\; bring food' in body
+    assert all(len(line.encode()) <= 75 for line in body.split('\r\n'))
@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+
+from app.services.event_service import EventService
+from app.services.fragment_cache import fragment_cache
+
+
+def new_event(host, title='Meetup', **data):
+    event, _, _ = EventService.create_event(host.id, {'title': title, 'date': date.today() + timedelta(days=7), **data})
+    return event.id
+
+
+def login(client, user):
+    with client.session_transaction() as session:
+        session['user_id'] = user.id
+
+
+def test_cards_are_rendered_once_per_version(app, client, users):
+    new_event(users[0])
+    fragment_cache.reset_stats()
+    first = client.get('/').data
+    assert fragment_cache.stats()['misses'] == 1
+
+    assert client.get('/').data == first
+    assert fragment_cache.stats()['hits'] == 1
+
+
+def test_join_renders_the_new_version(app, client, users):
+    event_id = new_event(users[0])
+    client.get('/')
+    EventService.join_event(users[1].id, event_id)
+    fragment_cache.reset_stats()
+
+    html = client.get('/').get_data(as_text=True)
+
+    assert fragment_cache.stats()['misses'] == 1
+    assert 'title="user1"' in html
+
+
+def test_one_entry_serves_every_viewer(app, client, users):
+    event_id = new_event(users[0])
+    EventService.join_event(users[1].id, event_id)
+    fragment_cache.reset_stats()
+
+    login(client, users[1])
+    assert b'Joined' in client.get('/').data
+    login(client, users[2])
+    html = client.get('/').get_data(as_text=True)
+
+    assert 'Joined' not in html and f'/events/join/{event_id}' in html
+    assert fragment_cache.stats()['misses'] == 1
+
+
+def test_user_content_cannot_forge_a_slot(app, client, users):
+    new_event(users[0], title='<!--slot:actions-->')
+    login(client, users[1])
+    html = client.get('/').get_data(as_text=True)
+    assert '&lt;!--slot:actions--&gt;' in html
+    assert html.count('/events/join/') == 1
+
+
+def test_detail_body_keeps_viewer_slots_out_of_the_cache(app, client, users):
+    event_id = new_event(users[0])
+    EventService.join_event(users[2].id, event_id)
+    fragment_cache.reset_stats()
+
+    login(client, users[0])
+    owner = client.get(f'/events/detail/{event_id}').get_data(as_text=True)
+    login(client, users[1])
+    guest = client.get(f'/events/detail/{event_id}').get_data(as_text=True)
+
+    assert 'Export attendees' in owner and 'Export attendees' not in guest
+    assert fragment_cache.stats()['misses'] == 1
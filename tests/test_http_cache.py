@@ -0,0 +1,68 @@
+from datetime import date, timedelta
+
+from app.services.event_service import EventService
+
+
+def new_event(host):
+    event, _, _ = EventService.create_event(host.id, {'title': 'Meetup', 'date': date.today() + timedelta(days=7)})
+    return event.id
+
+
+def login(client, user):
+    with client.session_transaction() as session:
+        session['user_id'] = user.id
+
+
+def test_unchanged_event_answers_304(app, client, users):
+    event_id = new_event(users[0])
+    first = client.get(f'/events/detail/{event_id}')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+
+    again = client.get(f'/events/detail/{event_id}', headers={'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.data == b''
+    assert again.headers['ETag'] == etag
+
+
+def test_join_changes_the_etag(app, client, users):
+    event_id = new_event(users[0])
+    login(client, users[1])
+    etag = client.get(f'/events/detail/{event_id}').headers['ETag']
+
+    EventService.join_event(users[1].id, event_id)
+
+    response = client.get(f'/events/detail/{event_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_etag_depends_on_viewer_and_modal(app, client, users):
+    event_id = new_event(users[0])
+    page = client.get(f'/events/detail/{event_id}').headers['ETag']
+    modal = client.get(f'/events/detail/{event_id}', headers={'X-Requested-With': 'XMLHttpRequest'}).headers['ETag']
+    login(client, users[1])
+    viewer = client.get(f'/events/detail/{event_id}').headers['ETag']
+    assert len({page, modal, viewer}) == 3
+
+    response = client.get(f'/events/detail/{event_id}', headers={'If-None-Match': page})
+    assert response.status_code == 200
+
+
+def test_pending_flash_is_never_answered_with_304(app, client, users):
+    event_id = new_event(users[0])
+    etag = client.get(f'/events/detail/{event_id}').headers['ETag']
+    with client.session_transaction() as session:
+        session['_flashes'] = [('info', 'Hello')]
+
+    response = client.get(f'/events/detail/{event_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert b'Hello' in response.data
+
+
+def test_cache_policies(app, client, users):
+    event_id = new_event(users[0])
+    assert client.get('/auth/login').headers['Cache-Control'] == 'no-store'
+    response = client.get(f'/events/detail/{event_id}')
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+    assert 'Cookie' in response.headers['Vary']
@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+from sqlalchemy import select
+
+from app import db
+from app.models.models import Comment, Event, EventParticipant, Job
+from app.services import event_service
+from app.services.event_service import EventService
+from app.services.jobs import jobs
+from app.services.sqlite_tuning import WriterBusy
+
+
+def busy_event(host, guests):
+    """An event with a participant and a comment per guest"""
+    event, _, _ = EventService.create_event(host.id, {'title': 'Meetup', 'date': date.today() + timedelta(days=7)})
+    for guest in guests:
+        EventService.join_event(guest.id, event.id)
+        EventService.add_comment(guest.id, event.id, f'Hi from {guest.username}')
+    return event.id
+
+
+def rows_left(event_id):
+    event = db.session.scalars(
+        select(Event).where(Event.id == event_id).execution_options(include_deleted=True)
+    ).one_or_none()
+    return (event is not None,
+            EventParticipant.query.filter_by(event_id=event_id).count(),
+            Comment.query.filter_by(event_id=event_id).count())
+
+
+def test_small_event_is_purged_inline(app, users):
+    event_id = busy_event(users[0], users[1:])
+    assert EventService.delete_event(users[0].id, event_id)[0]
+    assert rows_left(event_id) == (False, 0, 0)
+    assert Job.query.count() == 0
+
+
+def test_big_event_is_purged_by_a_job_in_batches(app, users, monkeypatch):
+    monkeypatch.setattr(event_service, 'DELETE_INLINE_MAX_ROWS', 1)
+    monkeypatch.setattr(event_service, 'PURGE_BATCH_SIZE', 1)
+    event_id = busy_event(users[0], users[1:])
+
+    assert EventService.delete_event(users[0].id, event_id)[0]
+    assert rows_left(event_id) == (True, 2, 2)
+    assert EventService.get_event_with_details(event_id) is None
+
+    assert jobs.run_pending() == 1
+    assert rows_left(event_id) == (False, 0, 0)
+    assert jobs.stats()['counts']['done'] == 1
+
+
+def test_failed_purge_is_retried(app, users, monkeypatch):
+    monkeypatch.setattr(event_service, 'DELETE_INLINE_MAX_ROWS', 0)
+    event_id = busy_event(users[0], users[1:2])
+    EventService.delete_event(users[0].id, event_id)
+
+    def busy(event_id, batch_size):
+        raise WriterBusy("Server is busy, please try again in a moment")
+    with monkeypatch.context() as patch:
+        patch.setattr(EventService, '_purge_batch', staticmethod(busy))
+        assert jobs.run_pending() == 1
+
+    job = Job.query.one()
+    assert (job.status, job.attempts) == ('queued', 1)
+    assert 'WriterBusy' in job.last_error
+    assert rows_left(event_id) == (True, 1, 1)
+
+    assert jobs.retry(job.id) == 1  # due now instead of after the backoff
+    assert jobs.run_pending() == 1
+    assert rows_left(event_id) == (False, 0, 0)
+
+
+def test_purge_is_safe_to_run_again(app, users):
+    event_id = busy_event(users[0], users[1:])
+    EventService.delete_event(users[0].id, event_id)
+    EventService.purge_event(event_id)
+    assert rows_left(event_id) == (False, 0, 0)
@@ -0,0 +1,52 @@
+import ipaddress
+
+import pytest
+
+from app.services.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def allow_localhost(app, monkeypatch):
+    monkeypatch.setattr(metrics, 'allowed_networks', [ipaddress.ip_network('127.0.0.1')])
+
+
+def test_metrics_are_served_to_allowed_addresses(app, client):
+    response = client.get('/metrics', environ_base={'REMOTE_ADDR': '127.0.0.1'})
+    assert response.status_code == 200
+    assert b'orbit_http_request_duration_seconds' in response.data
+
+
+def test_metrics_are_hidden_from_other_addresses(app, client):
+    assert client.get('/metrics', environ_base={'REMOTE_ADDR': '203.0.113.7'}).status_code == 404
+
+
+def test_metrics_token(app, client, monkeypatch):
+    monkeypatch.setattr(metrics, 'token', 's3cret')
+    monkeypatch.setattr(metrics, 'allowed_networks', [])
+    outside = {'REMOTE_ADDR': '203.0.113.7'}
+    assert client.get('/metrics', environ_base=outside).status_code == 404
+    assert client.get('/metrics', environ_base=outside, headers={'Authorization': 'Bearer nope'}).status_code == 404
+    assert client.get('/metrics', environ_base=outside, headers={'Authorization': 'Bearer s3cret'}).status_code == 200
+
+
+def test_rate_limit_refusals_are_counted(app, client):
+    from prometheus_client import REGISTRY
+    from app.services.rate_limiter import rate_limiter
+
+    labels = {'action': 'comment', 'bucket': 'user'}
+    before = REGISTRY.get_sample_value('orbit_rate_limited_total', labels) or 0
+    burst = rate_limiter.limits['comment'][0]
+    waits = [rate_limiter.hit('comment', user_id=1, ip='198.51.100.1') for _ in range(burst + 1)]
+    assert waits[-1] and not any(waits[:-1])
+    assert REGISTRY.get_sample_value('orbit_rate_limited_total', labels) == before + 1
+    assert b'orbit_rate_limited_total{action="comment",bucket="user"}' in client.get('/metrics').data
+
+
+@pytest.mark.parametrize('path, flag', [('/_stats/cache', 'CACHE_STATS_ENABLED'),
+                                        ('/_stats/jobs', 'JOBS_STATS_ENABLED'),
+                                        ('/_stats/queries', 'QUERY_STATS_ENABLED')])
+def test_stats_share_the_metrics_allowlist(app, client, monkeypatch, path, flag):
+    assert client.get(path, environ_base={'REMOTE_ADDR': '127.0.0.1'}).status_code == 404  # flag off
+    monkeypatch.setitem(app.config, flag, True)
+    assert client.get(path, environ_base={'REMOTE_ADDR': '127.0.0.1'}).status_code == 200
+    assert client.get(path, environ_base={'REMOTE_ADDR': '203.0.113.7'}).status_code == 404
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+
+from app.services.event_service import EventService
+
+
+def add_events(host, days):
+    """One event per entry of days (offsets from today); repeated offsets share a date"""
+    ids = []
+    for i, offset in enumerate(days):
+        event, _, created = EventService.create_event(
+            host.id, {'title': f'Event {i}', 'date': date.today() + timedelta(days=offset)})
+        assert created
+        ids.append((event.date, event.id))
+    return ids
+
+
+def walk(fetch, limit):
+    """Event ids of every page, following next_cursor from the first page"""
+    pages, cursor = [], None
+    while True:
+        page = fetch(after=cursor, limit=limit)
+        pages.append([event.id for event in page.items])
+        cursor = page.next_cursor
+        if not cursor:
+            return pages
+
+
+def test_upcoming_pages_cover_every_event_once_in_date_order(app, users):
+    keys = add_events(users[0], [3, 1, 1, 2, 5, 1, 4, 2])
+    expected = [event_id for _, event_id in sorted(keys)]
+
+    pages = walk(lambda **kw: EventService.get_upcoming_events(None, **kw), limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert sum(pages, []) == expected
+
+
+def test_past_pages_run_newest_first(app, users):
+    keys = add_events(users[0], [-3, -1, -1, -2, -5])
+    expected = [event_id for _, event_id in sorted(keys, reverse=True)]
+
+    assert sum(walk(lambda **kw: EventService.get_past_events(None, **kw), limit=2), []) == expected
+
+
+def test_before_cursor_walks_back_to_the_previous_page(app, users):
+    add_events(users[0], [1, 1, 2, 3, 3, 4, 5])
+    first = EventService.get_upcoming_events(None, limit=3)
+    second = EventService.get_upcoming_events(None, after=first.next_cursor, limit=3)
+    assert first.prev_cursor is None
+
+    back = EventService.get_upcoming_events(None, before=second.prev_cursor, limit=3)
+
+    assert [e.id for e in back.items] == [e.id for e in first.items]
+    assert back.prev_cursor is None
+    assert back.next_cursor == first.next_cursor
+
+
+def test_malformed_cursor_yields_the_first_page(app, users):
+    add_events(users[0], [1, 2, 3])
+    first = EventService.get_upcoming_events(None, limit=2)
+    for cursor in ('not-a-cursor', '!!!', ''):
+        page = EventService.get_upcoming_events(None, after=cursor, limit=2)
+        assert [e.id for e in page.items] == [e.id for e in first.items]
@@ -0,0 +1,20 @@
+import pytest
+
+from app.services.password_hasher import password_hasher
+
+
+@pytest.mark.parametrize('method', ['scrypt', 'scrypt:32768:8:1', 'pbkdf2:sha256', 'pbkdf2:sha256:600000'])
+def test_fresh_hash_does_not_need_rehash(app, method):
+    app.config['PASSWORD_HASH_METHOD'] = method
+    password_hasher.init_app(app)
+    assert not password_hasher.needs_rehash(password_hasher.hash('password123'))
+
+
+def test_hash_from_another_method_needs_rehash(app):
+    app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256'
+    password_hasher.init_app(app)
+    stored = password_hasher.hash('password123')
+
+    app.config['PASSWORD_HASH_METHOD'] = 'scrypt'
+    password_hasher.init_app(app)
+    assert password_hasher.needs_rehash(stored)
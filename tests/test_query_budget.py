@@ -0,0 +1,41 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.cache_service import cache
+from app.services.event_service import EventService
+from app.services.fragment_cache import fragment_cache
+from app.services.query_profiler import query_profiler
+
+
+@pytest.fixture
+def seeded(app, users, client):
+    """Upcoming and past events, each with participants and comments, and user0 logged in"""
+    event_ids = []
+    for i, days in enumerate((7, 14, 21, 28, -7, -14)):
+        host = users[i % len(users)]
+        event, _, _ = EventService.create_event(
+            host.id, {'title': f'Event {i}', 'date': date.today() + timedelta(days=days), 'capacity': 10})
+        for guest in users:
+            if guest is not host:
+                EventService.join_event(guest.id, event.id)
+            EventService.add_comment(guest.id, event.id, f'Comment from {guest.username}')
+        event_ids.append(event.id)
+    with client.session_transaction() as session:
+        session['user_id'] = users[0].id
+    return event_ids
+
+
+@pytest.mark.parametrize('path, shows', [('/', b'Event 0'), ('/history', b'Event 4'),
+                                         ('/profile', b'Event 0'), ('/events/detail/{event_id}', b'Comment from user1')])
+def test_pages_stay_within_query_budget(app, client, seeded, path, shows):
+    cache.clear()
+    fragment_cache.clear()
+    query_profiler.clear()
+
+    response = client.get(path.format(event_id=seeded[0]))  # QUERY_BUDGET_RAISE fails the request if over
+
+    assert response.status_code == 200
+    entry = query_profiler.recent()[-1]
+    assert entry['queries'] <= query_profiler.budget_for(entry['endpoint'])
+    assert shows in response.data
@@ -0,0 +1,26 @@
+import pytest
+
+from app.services.rate_limiter import MemoryBucketStore, RateLimiter, SqliteBucketStore
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def limiter(request, tmp_path):
+    limiter = RateLimiter()
+    limiter.enabled = True
+    limiter.limits = {'comment': (2, 60)}
+    limiter.ip_multiplier = 1
+    limiter.store = MemoryBucketStore() if request.param == 'memory' else SqliteBucketStore(str(tmp_path / 'rl.db'))
+    return limiter
+
+
+def test_ip_rejection_does_not_spend_the_user_token(limiter):
+    # Two other users behind the same address use up the IP bucket
+    assert not limiter.hit('comment', user_id=1, ip='10.0.0.1')
+    assert not limiter.hit('comment', user_id=2, ip='10.0.0.1')
+    assert limiter.hit('comment', user_id=3, ip='10.0.0.1')
+    assert limiter.hit('comment', user_id=3, ip='10.0.0.1')
+
+    # User 3's bucket is still full from another address
+    assert not limiter.hit('comment', user_id=3, ip='10.0.0.2')
+    assert not limiter.hit('comment', user_id=3, ip='10.0.0.2')
+    assert limiter.hit('comment', user_id=3, ip='10.0.0.2')
@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+
+from app.services.event_service import EventService
+
+
+def add_events(host):
+    soon = date.today() + timedelta(days=1)
+    later = date.today() + timedelta(days=30)
+    for title, day, description in [
+        ('Board games', soon, 'Bring a python book if you like'),
+        ('Garden walk', soon, 'Nothing to do with snakes'),
+        ('Python meetup', later, 'Talks about Python packaging'),
+        ('Pythonistas', later, 'Lightning talks'),
+    ]:
+        EventService.create_event(host.id, {'title': title, 'date': day, 'description': description})
+
+
+def test_search_orders_by_relevance_and_pages(app, users):
+    add_events(users[0])
+
+    titles = [e.title for e in EventService.get_upcoming_events(None, search_query='pyth')]
+    assert titles[-1] == 'Board games'  # description-only match ranks below the title matches
+    assert set(titles) == {'Python meetup', 'Pythonistas', 'Board games'}
+
+    first = EventService.get_upcoming_events(None, search_query='pyth', limit=2)
+    second = EventService.get_upcoming_events(None, search_query='pyth', after=first.next_cursor, limit=2)
+    assert [e.title for e in first] + [e.title for e in second] == titles
+    assert second.next_cursor is None
+    back = EventService.get_upcoming_events(None, search_query='pyth', before=second.prev_cursor, limit=2)
+    assert [e.title for e in back] == [e.title for e in first]
+
+
+def test_api_search_is_ranked(app, users, client):
+    add_events(users[0])
+    response = client.get('/api/v1/events?search=python&fields=id,title,date')
+    assert [e['title'] for e in response.get_json()['data']][-1] == 'Board games'
+    assert set(response.get_json()['data'][0]) == {'id', 'title', 'date'}
+
+
+
+def test_search_index_is_picked_up_after_migrating(app, users):
+    from app import db, migrations
+
+    add_events(users[0])
+    for name in ('events_fts_insert', 'events_fts_delete', 'events_fts_update'):
+        db.session.execute(db.text(f"DROP TRIGGER {name}"))
+    db.session.execute(db.text("DROP TABLE events_fts"))
+    db.session.execute(db.text("DELETE FROM schema_migrations WHERE version = 9"))
+    db.session.commit()
+    titles = [e.title for e in EventService.get_upcoming_events(None, search_query='pyth')]
+    assert titles[0] == 'Board games'  # LIKE fallback, in date order
+
+    migrations.upgrade(db.engine, log=lambda message: None)
+    titles = [e.title for e in EventService.get_upcoming_events(None, search_query='pyth')]
+    assert titles[-1] == 'Board games'
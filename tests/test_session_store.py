@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import select
+
+from app import db
+from app.models.models import ServerSession
+import config
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    from app import create_app, migrations
+
+    class SqlSessionConfig(config.TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        WTF_CSRF_ENABLED = False
+        JOBS_RUNNER = 'external'
+        PASSWORD_HASH_POOL = False
+        SESSION_TYPE = 'sqlalchemy'
+
+    monkeypatch.setitem(config.config, 'sql_sessions', SqlSessionConfig)
+    app = create_app('sql_sessions')
+    with app.app_context():
+        migrations.upgrade(db.engine, log=lambda message: None)
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def session_ids():
+    return set(db.session.scalars(select(ServerSession.id)))
+
+
+def test_login_replaces_the_session_id(app, client, users):
+    client.get('/auth/login')
+    with client.session_transaction() as session:
+        session['visited'] = True  # an anonymous session with a stored row
+    planted = client.get_cookie(app.config['SESSION_COOKIE_NAME']).value
+    assert planted in session_ids()
+
+    client.post('/auth/login', data={'username': 'user0', 'password': 'password123'})
+    sid = client.get_cookie(app.config['SESSION_COOKIE_NAME']).value
+    assert sid != planted
+    assert session_ids() == {sid}
@@ -0,0 +1,26 @@
+from datetime import date, timedelta
+
+from app.models.models import Event
+from app.services.sqlite_tuning import write_queue
+
+
+def test_create_while_writer_busy_answers_503(app, client, users, monkeypatch):
+    monkeypatch.setattr(write_queue, 'enabled', True)
+    monkeypatch.setattr(write_queue, 'timeout', 0.05)
+    client.post('/auth/login', data={'username': 'user0', 'password': 'password123'})
+
+    form = {'title': 'Meetup', 'date': (date.today() + timedelta(days=7)).isoformat(), 'time': '18:00',
+            'category': 'Social', 'capacity': 10}
+    assert write_queue._acquire()  # another writer holds the turn
+    try:
+        response = client.post('/events/add', data=form)
+    finally:
+        write_queue._release()
+
+    assert response.status_code == 503
+    assert b'Server is busy' in response.data
+    assert Event.query.count() == 0
+
+    response = client.post('/events/add', data=form)
+    assert response.status_code == 302
+    assert Event.query.count() == 1
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Background Job Worker
+Runs the jobs queued in the jobs table (event purges, digest emails) outside
+the web processes, and inspects or re-queues them. Needed when
+JOBS_RUNNER=external; with the default 'thread' runner the web processes run
+jobs themselves and this is only used for status, retry and digest.
+
+Usage:
+    python worker.py [run]          # run jobs until interrupted
+    python worker.py run --once     # run what is due now, then exit
+    python worker.py status         # counts per status and recent failures
+    python worker.py retry [ID]     # re-queue one failed job, or all of them
+    python worker.py digest [--days 7]   # queue a digest email per user with upcoming events
+"""
+
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app
+from app.services.jobs import jobs
+
+
+def status():
+    stats = jobs.stats()
+    counts = stats['counts']
+    print(f"   ⏳ queued {counts['queued']}   🏃 running {counts['running']}   "
+          f"✅ done {counts['done']}   ❌ failed {counts['failed']}")
+    if stats['oldest_due_seconds']:
+        print(f"   Oldest due job has waited {stats['oldest_due_seconds']:.0f}s")
+    for job in stats['failed']:
+        print(f"   ❌ #{job['id']} {job['name']} {job['payload']} after {job['attempts']} attempt(s): {job['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('command', nargs='?', choices=('run', 'status', 'retry', 'digest'), default='run')
+    parser.add_argument('job_id', nargs='?', type=int, help='job to retry (default: every failed job)')
+    parser.add_argument('--once', action='store_true', help='run the jobs due now and exit')
+    parser.add_argument('--days', type=int, default=7, help='digest look-ahead')
+    args = parser.parse_args()
+
+    app = create_app(os.environ.get('FLASK_ENV', 'development'))
+    with app.app_context():
+        if args.command == 'status':
+            status()
+        elif args.command == 'retry':
+            print(f"🔁 Re-queued {jobs.retry(args.job_id)} job(s).")
+        elif args.command == 'digest':
+            from app.services.digest_service import DigestService
+            print(f"📬 Queued {DigestService.enqueue_digests(args.days)} digest email(s).")
+        elif args.once:
+            print(f"✅ Ran {jobs.run_pending()} job(s).")
+        else:
+            print(f"👷 Running jobs (polling every {jobs.poll_interval:g}s, Ctrl+C to stop)...")
+            try:
+                jobs.work()
+            except KeyboardInterrupt:
+                sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()